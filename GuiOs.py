@@ -1,6 +1,456 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import random
+from tkinter import ttk, messagebox, filedialog
+import math
+import time
+from array import array
+from itertools import compress
+
+from scheduler import ProcessTable
+from scheduler.core import PREEMPTIBLE_ALGORITHMS, QUANTUM_ALGORITHMS
+from scheduler.cache import default_cache
+from scheduler.gantt import GanttIndex, with_overhead
+from scheduler.jobs import SimulationJob
+from scheduler.manifest import dumps
+from scheduler.smp import SMP_ALGORITHMS, SMPResult
+from scheduler.stats import first_dispatch, run_stats
+from scheduler.store import load_result, save_result
+
+# Timelines longer than this skip the block-by-block animation and go
+# straight to the zoomable GanttView.
+ANIMATE_LIMIT = 40
+
+# Milliseconds between polls of a running simulation job.
+POLL_INTERVAL = 50
+
+
+class GanttView:
+    """Zoomable, pannable Gantt chart drawn from one GanttIndex per lane.
+
+    Multi-CPU runs get one lane per core, stacked top to bottom.  Canvas items
+    are pooled and reused between redraws, and only about one block per pixel
+    is drawn, so even huge timelines redraw quickly.  Scroll to zoom around
+    the cursor, drag to pan and double-click to reset.
+    """
+
+    PALETTE = ["#FFB6C1", "#87CEEB", "#98FB98", "#DDA0DD", "#F0E68C"]
+    MIXED_COLOR = "#B0C4DE"
+    OVERHEAD_COLOR = "#696969"
+    X0, X1, Y, HEIGHT = 20, 880, 120, 50
+    LANES_HEIGHT = 140
+    EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>", "<ButtonPress-1>", "<B1-Motion>", "<Double-Button-1>")
+
+    def __init__(self, canvas, indexes, pids):
+        self.canvas = canvas
+        self.indexes = indexes
+        self.pids = pids
+        self.lane_height = min(self.HEIGHT, self.LANES_HEIGHT / len(indexes))
+        used = [index for index in indexes if index.end > index.begin] or indexes
+        self.begin = min(index.begin for index in used)
+        self.end = max(index.end for index in used)
+        self.blocks = [[] for _ in indexes]
+        self.shown = [0] * len(indexes)
+        self.ticks = []
+        self.ticks_shown = 0
+        self.fills = {}
+        self.drag_x = None
+        self.pending = False
+        self.reset()
+
+        canvas.delete("all")
+        canvas.create_line(10, self.Y-30, 880, self.Y-30, arrow=tk.LAST, fill="#4682B4", width=2)
+        canvas.create_text(20, self.Y-50, text="Time", font=("Helvetica", 12, "bold"), fill="#4682B4")
+        bottom = self.Y + self.lane_height * len(indexes)
+        canvas.create_text(450, bottom + (40 if len(indexes) == 1 else 15),
+                           text="Scroll to zoom, drag to pan, double-click to reset",
+                           font=("Helvetica", 9), fill="#6A5ACD")
+        for sequence, handler in zip(self.EVENTS, (self.on_wheel, self.on_wheel, self.on_wheel,
+                                                   self.on_press, self.on_drag, self.on_reset)):
+            canvas.bind(sequence, handler)
+        self.redraw()
+
+    def detach(self):
+        for sequence in self.EVENTS:
+            self.canvas.unbind(sequence)
+
+    def reset(self):
+        self.t0 = self.begin
+        self.t1 = max(self.end, self.t0 + 1e-9)
+
+    def time_at(self, x):
+        return self.t0 + (x - self.X0) * (self.t1 - self.t0) / (self.X1 - self.X0)
+
+    def clamp(self, t0, t1):
+        span = min(max(t1 - t0, 1e-6), self.end - self.begin or 1e-6)
+        t0 = min(max(t0, self.begin), self.end - span)
+        self.t0, self.t1 = t0, t0 + span
+
+    def on_wheel(self, event):
+        zoom_in = event.num == 4 or getattr(event, "delta", 0) > 0
+        factor = 0.8 if zoom_in else 1.25
+        center = self.time_at(event.x)
+        self.clamp(center - (center - self.t0) * factor, center + (self.t1 - center) * factor)
+        self.schedule_redraw()
+
+    def on_press(self, event):
+        self.drag_x = event.x
+
+    def on_drag(self, event):
+        if self.drag_x is None:
+            return
+        shift = (self.drag_x - event.x) * (self.t1 - self.t0) / (self.X1 - self.X0)
+        self.drag_x = event.x
+        self.clamp(self.t0 + shift, self.t1 + shift)
+        self.schedule_redraw()
+
+    def on_reset(self, event):
+        self.reset()
+        self.schedule_redraw()
+
+    def schedule_redraw(self):
+        if not self.pending:
+            self.pending = True
+            self.canvas.after_idle(self.redraw)
+
+    def redraw(self):
+        self.pending = False
+        for lane in range(len(self.indexes)):
+            self.draw_lane(lane)
+        self.draw_ticks()
+
+    def draw_lane(self, lane):
+        canvas = self.canvas
+        pool = self.blocks[lane]
+        y0 = self.Y + lane * self.lane_height
+        y1 = y0 + max(self.lane_height - 1, 1)
+        labels = self.lane_height >= 16
+        scale = (self.X1 - self.X0) / (self.t1 - self.t0)
+        blocks = self.indexes[lane].blocks(self.t0, self.t1, self.X1 - self.X0)
+        for k, (start, end, i, mixed) in enumerate(blocks):
+            if k == len(pool):
+                pool.append((canvas.create_rectangle(0, 0, 0, 0, outline="", state="hidden"),
+                             canvas.create_text(0, 0, font=("Helvetica", 12 if len(self.indexes) == 1 else 8, "bold"),
+                                                fill="#483D8B", state="hidden")))
+            rect, text = pool[k]
+            x0 = max(self.X0, self.X0 + (start - self.t0) * scale)
+            x1 = max(min(self.X1, self.X0 + (end - self.t0) * scale), x0 + 1)
+            canvas.coords(rect, x0, y0, x1, y1)
+            if mixed:
+                fill = self.MIXED_COLOR
+            else:
+                fill = self.OVERHEAD_COLOR if i < 0 else self.PALETTE[i % len(self.PALETTE)]
+            if self.fills.get(rect) != fill:
+                canvas.itemconfigure(rect, fill=fill)
+                self.fills[rect] = fill
+            if k >= self.shown[lane]:
+                canvas.itemconfigure(rect, state="normal")
+            if labels and x1 - x0 > 30 and not mixed and i >= 0:
+                canvas.coords(text, (x0 + x1) / 2, (y0 + y1) / 2)
+                canvas.itemconfigure(text, text=self.pids[i], state="normal")
+            else:
+                canvas.itemconfigure(text, state="hidden")
+        for rect, text in pool[len(blocks):self.shown[lane]]:
+            canvas.itemconfigure(rect, state="hidden")
+            canvas.itemconfigure(text, state="hidden")
+        self.shown[lane] = len(blocks)
+
+    def draw_ticks(self):
+        span = self.t1 - self.t0
+        step = 10 ** math.floor(math.log10(span / 8))
+        for multiple in (1, 2, 5, 10):
+            if span / (step * multiple) <= 8:
+                step *= multiple
+                break
+        first = math.ceil(self.t0 / step)
+        count = int(self.t1 / step) - first + 1
+        for k in range(count):
+            if k == len(self.ticks):
+                self.ticks.append(self.canvas.create_text(0, 0, font=("Helvetica", 10), fill="#4682B4", state="hidden"))
+            t = (first + k) * step
+            x = self.X0 + (t - self.t0) * (self.X1 - self.X0) / span
+            self.canvas.coords(self.ticks[k], x, self.Y - 15)
+            self.canvas.itemconfigure(self.ticks[k], text=f"{t:.6g}", state="normal")
+        for tick in self.ticks[count:self.ticks_shown]:
+            self.canvas.itemconfigure(tick, state="hidden")
+        self.ticks_shown = count
+
+
+class LiveStrip:
+    """Gantt strip that grows while a streamed simulation posts its segments.
+
+    Streamed runs are single-CPU and never idle while a process is waiting,
+    so the makespan, and with it the final scale, is known before the run
+    starts.  Each pixel column is drawn once, by the first segment that
+    reaches it, which keeps the canvas to about one item per pixel.
+    """
+
+    def __init__(self, canvas, table):
+        self.canvas = canvas
+        arrival, burst = table.arrival, table.burst
+        end = 0.0
+        for i in table.arrival_order():
+            end = max(end, arrival[i]) + burst[i]
+        self.scale = (GanttView.X1 - GanttView.X0) / end if end > 0 else 0.0
+        self.x = GanttView.X0
+        y = GanttView.Y
+        canvas.delete("all")
+        canvas.create_line(10, y-30, 880, y-30, arrow=tk.LAST, fill="#4682B4", width=2)
+        canvas.create_text(20, y-50, text="Time", font=("Helvetica", 12, "bold"), fill="#4682B4")
+        canvas.create_text(GanttView.X0, y-15, text="0", font=("Helvetica", 10), fill="#4682B4")
+        canvas.create_text(GanttView.X1, y-15, text=f"{end:.6g}", font=("Helvetica", 10), fill="#4682B4")
+
+    def add(self, segments):
+        palette = GanttView.PALETTE
+        y0, y1 = GanttView.Y, GanttView.Y + GanttView.HEIGHT
+        for i, start, duration in segments:
+            x1 = min(GanttView.X0 + (start + duration) * self.scale, GanttView.X1)
+            if x1 < self.x + 1:
+                continue
+            x0 = GanttView.X0 + start * self.scale
+            if x0 < self.x + 1:
+                x0 = self.x
+            self.canvas.create_rectangle(x0, y0, x1, y1, fill=palette[i % len(palette)], outline="")
+            self.x = x1
+
+
+class VirtualTable:
+    """Treeview that only ever holds the rows on screen.
+
+    The rows come from a source with ``len(source)`` items,
+    ``source.values(k)`` (the cells of item k), ``source.sort_key(column)``
+    and, for the pid filter, ``source.pids`` and ``source.rows`` (the
+    process row behind every item).  Scrolling, sorting and filtering only
+    change which item numbers are displayed, so a million rows cost one
+    index array.  Click a heading to sort by it, and again to reverse.
+    While a source grows, new items show up unless a sort or filter is
+    applied; those work on the items present when they were applied.
+    """
+
+    WHEEL_ROWS = 3
+    FILTER_DELAY = 200
+
+    def __init__(self, parent, columns, height=8):
+        self.frame = ttk.Frame(parent)
+        bar = ttk.Frame(self.frame)
+        bar.pack(fill="x", pady=(0, 5))
+        ttk.Label(bar, text="Filter by pid:").pack(side="left")
+        self.needle = tk.StringVar()
+        ttk.Entry(bar, textvariable=self.needle, width=20).pack(side="left", padx=5)
+        self.count_label = ttk.Label(bar, text="", foreground="#6A5ACD")
+        self.count_label.pack(side="left", padx=10)
+        self.headings = [heading for heading, _ in columns]
+        self.tree = ttk.Treeview(self.frame, columns=list(range(len(columns))), show="headings",
+                                 height=height, selectmode="browse")
+        for column, (heading, width) in enumerate(columns):
+            self.tree.heading(column, text=heading, command=lambda column=column: self.sort(column))
+            self.tree.column(column, width=width, anchor="center")
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.yview)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self.on_wheel)
+        self.height = height
+        self.source = None
+        self.view = None
+        self.top = 0
+        self.sorted_by = None
+        self.reverse = False
+        self.pending = None
+        self.needle.trace_add("write", self.on_filter)
+
+    def show(self, source):
+        if self.sorted_by is not None:
+            self.tree.heading(self.sorted_by, text=self.headings[self.sorted_by])
+        self.source = source
+        self.sorted_by = None
+        self.reverse = False
+        self.top = 0
+        self.apply()
+
+    def total(self):
+        if self.view is not None:
+            return len(self.view)
+        return len(self.source) if self.source is not None else 0
+
+    def sort(self, column):
+        if self.source is None:
+            return
+        if self.sorted_by is not None:
+            self.tree.heading(self.sorted_by, text=self.headings[self.sorted_by])
+        self.reverse = column == self.sorted_by and not self.reverse
+        self.sorted_by = column
+        self.tree.heading(column, text=self.headings[column] + (" \u25bc" if self.reverse else " \u25b2"))
+        self.top = 0
+        self.apply()
+
+    def on_filter(self, *args):
+        if self.pending is not None:
+            self.frame.after_cancel(self.pending)
+        self.pending = self.frame.after(self.FILTER_DELAY, self.apply)
+
+    def apply(self):
+        """Rebuild the displayed item numbers from the sort column and filter."""
+        self.pending = None
+        source = self.source
+        if source is None:
+            return
+        view = None
+        if self.sorted_by is not None:
+            view = array("l", sorted(range(len(source)), key=source.sort_key(self.sorted_by), reverse=self.reverse))
+        needle = self.needle.get().strip()
+        if needle:
+            matched = bytearray(needle in str(pid) for pid in source.pids)
+            items = range(len(source)) if view is None else view
+            view = array("l", compress(items, map(matched.__getitem__, map(source.rows.__getitem__, items))))
+        self.view = view
+        self.render()
+
+    def render(self):
+        tree = self.tree
+        tree.delete(*tree.get_children())
+        total = self.total()
+        self.top = max(0, min(self.top, total - self.height))
+        view = self.view
+        for k in range(self.top, min(self.top + self.height, total)):
+            tree.insert("", "end", values=self.source.values(k if view is None else view[k]))
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + self.height) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        size = len(self.source) if self.source is not None else 0
+        self.count_label.configure(text=f"{total} rows" if total == size else f"{total} of {size} rows")
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * self.total())
+        else:
+            self.top += int(args[1]) * (self.height if args[2] == "pages" else 1)
+        self.render()
+
+    def on_wheel(self, event):
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        self.yview("scroll", -self.WHEEL_ROWS if up else self.WHEEL_ROWS, "units")
+        return "break"
+
+
+class LogRows:
+    """Execution log for a :class:`VirtualTable`: one item per segment, in time order.
+
+    Plain single-CPU results are shown straight from their timeline
+    columns; switching segments and per-CPU columns are merged in only when
+    the result has them.
+    """
+
+    HEADINGS = [("Start", 110), ("End", 110), ("Process", 160), ("Event", 120), ("CPU", 70)]
+
+    def __init__(self, pids, rows=None, start=None, duration=None, switching=None, cores=None):
+        self.pids = pids
+        self.rows = array("l") if rows is None else rows
+        self.start = array("d") if start is None else start
+        self.duration = array("d") if duration is None else duration
+        self.switching = switching
+        self.cores = cores
+
+    @classmethod
+    def from_result(cls, result):
+        timeline, overhead = result.timeline, result.overhead
+        smp = isinstance(result, SMPResult)
+        if overhead is None and not smp:
+            return cls(result.table.pids, timeline.index, timeline.start, timeline.duration)
+        lanes = [(timeline, 0, result.segment_core if smp else None)]
+        if overhead is not None:
+            lanes.append((overhead, 1, result.overhead_core if smp else None))
+        rows, start, duration, switching, cores = array("l"), array("d"), array("d"), bytearray(), array("l")
+        for lane, flag, lane_cores in lanes:
+            rows.extend(lane.index)
+            start.extend(lane.start)
+            duration.extend(lane.duration)
+            switching.extend(bytes([flag]) * len(lane.index))
+            cores.extend(lane_cores if lane_cores is not None else array("l", bytes(8 * len(lane.index))))
+        order = sorted(range(len(start)), key=start.__getitem__)
+        return cls(result.table.pids, array("l", map(rows.__getitem__, order)),
+                   array("d", map(start.__getitem__, order)), array("d", map(duration.__getitem__, order)),
+                   bytearray(map(switching.__getitem__, order)),
+                   array("l", map(cores.__getitem__, order)) if smp else None)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def append(self, segments):
+        """Add ``(row, start, duration)`` execution segments, as a streamed run posts them."""
+        for i, start, duration in segments:
+            self.rows.append(i)
+            self.start.append(start)
+            self.duration.append(duration)
+
+    def values(self, k):
+        start = self.start[k]
+        return (f"{start:.2f}", f"{start + self.duration[k]:.2f}", self.pids[self.rows[k]],
+                "Switching" if self.switching is not None and self.switching[k] else "Executing",
+                self.cores[k] if self.cores is not None else 0)
+
+    def sort_key(self, column):
+        if column == 0:
+            return self.start.__getitem__
+        if column == 1:
+            return lambda k: self.start[k] + self.duration[k]
+        if column == 2:
+            return lambda k: str(self.pids[self.rows[k]])
+        flags = self.switching if column == 3 else self.cores
+        return (lambda k: 0) if flags is None else flags.__getitem__
+
+
+class ProcessRows:
+    """Per-process statistics for a :class:`VirtualTable`, in completion order."""
+
+    HEADINGS = [("Process", 140), ("Arrival", 90), ("Burst", 90), ("Completion", 100), ("Waiting", 90),
+                ("Turnaround", 100), ("Response", 90)]
+
+    def __init__(self, table, rows, completion, first):
+        self.table = table
+        self.pids = table.pids
+        self.rows = rows
+        self.completion = completion
+        self.first = first
+
+    @classmethod
+    def from_result(cls, result):
+        return cls(result.table, result.order, result.completion, first_dispatch(result))
+
+    @classmethod
+    def pending(cls, table):
+        """Rows for a streamed run that has not completed anything yet."""
+        return cls(table, array("l"), array("d", bytes(8 * len(table))), array("d", [math.inf]) * len(table))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def started(self, segments):
+        first = self.first
+        for i, start, _ in segments:
+            if start < first[i]:
+                first[i] = start
+
+    def completed(self, pairs):
+        for i, completion in pairs:
+            self.rows.append(i)
+            self.completion[i] = completion
+
+    def columns(self, i):
+        arrival, burst, completion = self.table.arrival[i], self.table.burst[i], self.completion[i]
+        turnaround = completion - arrival
+        response = self.first[i] - arrival if self.first[i] != math.inf else turnaround
+        return self.pids[i], arrival, burst, completion, turnaround - burst, turnaround, response
+
+    def values(self, k):
+        pid, *times = self.columns(self.rows[k])
+        return (pid, *(f"{t:.2f}" for t in times))
+
+    def sort_key(self, column):
+        rows = self.rows
+        if column == 0:
+            return lambda k: str(self.pids[rows[k]])
+        return lambda k: self.columns(rows[k])[column]
+
 
 class CPUSchedulerSimulator:
     def __init__(self, root):
@@ -8,11 +458,44 @@ class CPUSchedulerSimulator:
         self.root.title("Pastel CPU Scheduling Simulator")
         self.root.geometry("1000x750")
         self.root.configure(bg="#E6E6FA")
-        self.processes = []
+        self.processes = ProcessTable()
+        self.gantt_view = None
+        self.last_result = None
+        self.last_manifest = None
+        # Created on the first run, so starting the GUI touches no cache directory.
+        self.cache = None
         self.current_algorithm = "RR"
         self.is_preemptive = tk.BooleanVar(value=False)
+        self.show_metrics = tk.BooleanVar(value=False)
+        self.metrics_panel = None
+        self.job = None
+        self.live = None
+        self.configure_styles()
         self.show_landing_page()
 
+    def configure_styles(self):
+        # ttk styles belong to the Tk interpreter, so configuring them once covers every page.
+        style = ttk.Style(self.root)
+        style.configure("Pastel.TLabelframe", background="#F0F8FF", foreground="#4682B4")
+        style.configure("Pastel.TLabelframe.Label", font=("Helvetica", 12, "bold"), foreground="#FF69B4")
+        style.configure("Pastel.TRadiobutton", background="#F0F8FF", foreground="#483D8B", 
+                       font=("Helvetica", 11, "bold"))
+        style.map("Pastel.TRadiobutton", background=[("active", "#D8BFD8")])  
+        style.configure("Pastel.TCheckbutton", background="#F0F8FF", foreground="#483D8B", 
+                       font=("Helvetica", 11))
+        style.configure("Launch.TButton", font=("Helvetica", 12, "bold"), background="#87CEEB", 
+                       foreground="#191970", padding=10)  
+        style.map("Launch.TButton", background=[("active", "#ADD8E6")]) 
+        style.configure("Back.TButton", font=("Helvetica", 10, "bold"), background="#DDA0DD", 
+                       foreground="#4B0082")  
+        style.map("Back.TButton", background=[("active", "#D8BFD8")])
+        style.configure("Input.TLabel", background="#F0F8FF", foreground="#4682B4", 
+                       font=("Helvetica", 11, "bold"))
+        style.configure("Pastel.TEntry", font=("Helvetica", 11), background="#FFF0F5")  
+        style.configure("Action.TButton", font=("Helvetica", 11, "bold"), background="#98FB98", 
+                       foreground="#006400", padding=6)  
+        style.map("Action.TButton", background=[("active", "#90EE90")])
+
     def show_landing_page(self):
         self.clear_window()
         
@@ -27,16 +510,17 @@ class CPUSchedulerSimulator:
                                   style="Pastel.TLabelframe")
         algo_frame.pack(pady=30, padx=30, fill="x")
         
-        algorithms = [("FCFS", "FCFS"), ("SJF", "SJF"), ("Priority", "PP"), ("Round Robin", "RR")]
+        algorithms = [("FCFS", "FCFS"), ("SJF", "SJF"), ("Priority", "PP"), ("Round Robin", "RR"),
+                      ("MLFQ", "MLFQ"), ("CFS", "CFS"), ("HRRN", "HRRN"), ("Priority + Aging", "AGING")]
         self.algo_var = tk.StringVar(value="RR")
         
         for i, (text, value) in enumerate(algorithms):
             btn = ttk.Radiobutton(algo_frame, text=text, value=value, variable=self.algo_var, 
                                 command=self.set_algorithm, style="Pastel.TRadiobutton")
-            btn.grid(row=0, column=i, padx=10, pady=10)
+            btn.grid(row=i // 4, column=i % 4, padx=10, pady=10)
         
-        ttk.Checkbutton(algo_frame, text="Enable Preemption (SJF/PP)", variable=self.is_preemptive, 
-                       style="Pastel.TCheckbutton").grid(row=1, column=1, columnspan=2, pady=10)
+        ttk.Checkbutton(algo_frame, text="Enable Preemption (SJF/PP/Aging)", variable=self.is_preemptive, 
+                       style="Pastel.TCheckbutton").grid(row=2, column=1, columnspan=2, pady=10)
         
         ttk.Button(self.root, text="Launch Simulation", command=self.show_execution_page, 
                   style="Launch.TButton").pack(pady=40)
@@ -49,6 +533,7 @@ class CPUSchedulerSimulator:
         self.create_execution_widgets()
 
     def clear_window(self):
+        self.cancel_job()
         for widget in self.root.winfo_children():
             widget.destroy()
 
@@ -59,7 +544,7 @@ class CPUSchedulerSimulator:
         header_canvas = tk.Canvas(self.root, height=80, bg="#E6E6FA", highlightthickness=0)
         header_canvas.pack(fill="x")
         header_canvas.create_rectangle(0, 0, 1000, 80, fill="#FFB6C1", outline="")
-        header_canvas.create_text(500, 40, text=f"{self.current_algorithm} Scheduling {'(Preemptive)' if self.is_preemptive.get() and self.current_algorithm in ['SJF', 'PP'] else '(Non-Preemptive)'}", 
+        header_canvas.create_text(500, 40, text=f"{self.current_algorithm} Scheduling {'(Preemptive)' if self.is_preemptive.get() and self.current_algorithm in PREEMPTIBLE_ALGORITHMS else '(Non-Preemptive)'}", 
                                 font=("Helvetica", 20, "bold"), fill="#4B0082")
         
         back_btn = ttk.Button(header_canvas, text="← Back", command=self.show_landing_page, 
@@ -68,7 +553,7 @@ class CPUSchedulerSimulator:
 
         input_frame = ttk.LabelFrame(self.root, text="Add Process", padding=15, 
                                    style="Pastel.TLabelframe")
-        input_frame.pack(pady=20, padx=30, fill="x")
+        input_frame.pack(pady=(20, 5), padx=30, fill="x")
 
         labels = ["Process ID:", "Arrival Time:", "Burst Time:", "Priority:"]
         self.entries = {}
@@ -83,8 +568,22 @@ class CPUSchedulerSimulator:
                 ttk.Label(input_frame, text="(-20 to 20)", foreground="#6A5ACD",
                          font=("Helvetica", 8)).grid(row=1, column=i*2+1, sticky="n")
 
-        if self.current_algorithm == "RR":
-            ttk.Label(input_frame, text="Time Quantum:", style="Input.TLabel").grid(row=1, column=0, padx=5, pady=10)
+        ttk.Label(input_frame, text="CPUs:", style="Input.TLabel").grid(row=1, column=2, padx=5, pady=10)
+        self.cores_entry = ttk.Entry(input_frame, style="Pastel.TEntry")
+        self.cores_entry.insert(0, "1")
+        self.cores_entry.grid(row=1, column=3, padx=5, pady=10)
+        ttk.Label(input_frame, text="Switch Cost:", style="Input.TLabel").grid(row=2, column=2, padx=5, pady=10)
+        self.switch_entry = ttk.Entry(input_frame, style="Pastel.TEntry")
+        self.switch_entry.insert(0, "0")
+        self.switch_entry.grid(row=2, column=3, padx=5, pady=10)
+        ttk.Label(input_frame, text="Warmup:", style="Input.TLabel").grid(row=2, column=4, padx=5, pady=10)
+        self.warmup_entry = ttk.Entry(input_frame, style="Pastel.TEntry")
+        self.warmup_entry.insert(0, "0")
+        self.warmup_entry.grid(row=2, column=5, padx=5, pady=10)
+
+        if self.current_algorithm in QUANTUM_ALGORITHMS:
+            label = "Aging Interval:" if self.current_algorithm == "AGING" else "Time Quantum:"
+            ttk.Label(input_frame, text=label, style="Input.TLabel").grid(row=1, column=0, padx=5, pady=10)
             self.quantum_entry = ttk.Entry(input_frame, style="Pastel.TEntry")
             self.quantum_entry.grid(row=1, column=1, padx=5, pady=10)
             ttk.Label(input_frame, text="(can be decimal)", foreground="#6A5ACD",
@@ -94,37 +593,39 @@ class CPUSchedulerSimulator:
                   style="Action.TButton").grid(row=0, column=8, padx=10, pady=10)
         ttk.Button(input_frame, text="Simulate", command=self.simulate, 
                   style="Action.TButton").grid(row=1, column=8, padx=10, pady=10)
+        file_frame = ttk.Frame(input_frame)
+        file_frame.grid(row=2, column=6, columnspan=3, sticky="e")
+        ttk.Button(file_frame, text="Save Results", command=self.save_results,
+                  style="Action.TButton").pack(side="left", padx=5)
+        ttk.Button(file_frame, text="Load Results", command=self.load_results,
+                  style="Action.TButton").pack(side="left", padx=5)
+        ttk.Checkbutton(file_frame, text="Show Metrics", variable=self.show_metrics,
+                       style="Pastel.TCheckbutton").pack(side="left", padx=5)
+
+        progress_frame = ttk.Frame(self.root)
+        progress_frame.pack(padx=30, fill="x")
+        self.progress = ttk.Progressbar(progress_frame, length=500)
+        self.progress.pack(side="left", padx=5)
+        self.cancel_button = ttk.Button(progress_frame, text="Cancel", command=self.cancel_job,
+                                        style="Action.TButton", state="disabled")
+        self.cancel_button.pack(side="left", padx=5)
+        self.status_label = ttk.Label(progress_frame, text="", foreground="#6A5ACD")
+        self.status_label.pack(side="left", padx=5)
 
         self.canvas = tk.Canvas(self.root, width=900, height=300, bg="#F0F8FF", highlightthickness=1, 
                               highlightbackground="#4682B4")  
-        self.canvas.pack(pady=20, padx=30)
+        self.canvas.pack(pady=10, padx=30)
 
-        self.result_text = tk.Text(self.root, height=14, width=100, font=("Courier", 11), 
+        notebook = ttk.Notebook(self.root)
+        notebook.pack(pady=10, padx=30, fill="both", expand=True)
+        self.result_text = tk.Text(notebook, height=10, width=100, font=("Courier", 11),
                                  bg="#F0F8FF", fg="#483D8B", relief="flat", borderwidth=2, 
                                  highlightthickness=1, highlightbackground="#4682B4")
-        self.result_text.pack(pady=20, padx=30)
-
-        
-        style = ttk.Style()
-        style.configure("Pastel.TLabelframe", background="#F0F8FF", foreground="#4682B4")
-        style.configure("Pastel.TLabelframe.Label", font=("Helvetica", 12, "bold"), foreground="#FF69B4")
-        style.configure("Pastel.TRadiobutton", background="#F0F8FF", foreground="#483D8B", 
-                       font=("Helvetica", 11, "bold"))
-        style.map("Pastel.TRadiobutton", background=[("active", "#D8BFD8")])  
-        style.configure("Pastel.TCheckbutton", background="#F0F8FF", foreground="#483D8B", 
-                       font=("Helvetica", 11))
-        style.configure("Launch.TButton", font=("Helvetica", 12, "bold"), background="#87CEEB", 
-                       foreground="#191970", padding=10)  
-        style.map("Launch.TButton", background=[("active", "#ADD8E6")]) 
-        style.configure("Back.TButton", font=("Helvetica", 10, "bold"), background="#DDA0DD", 
-                       foreground="#4B0082")  
-        style.map("Back.TButton", background=[("active", "#D8BFD8")])
-        style.configure("Input.TLabel", background="#F0F8FF", foreground="#4682B4", 
-                       font=("Helvetica", 11, "bold"))
-        style.configure("Pastel.TEntry", font=("Helvetica", 11), background="#FFF0F5")  
-        style.configure("Action.TButton", font=("Helvetica", 11, "bold"), background="#98FB98", 
-                       foreground="#006400", padding=6)  
-        style.map("Action.TButton", background=[("active", "#90EE90")]) 
+        self.log_table = VirtualTable(notebook, LogRows.HEADINGS)
+        self.process_table = VirtualTable(notebook, ProcessRows.HEADINGS)
+        notebook.add(self.result_text, text="Summary")
+        notebook.add(self.log_table.frame, text="Execution Log")
+        notebook.add(self.process_table.frame, text="Processes")
 
     def add_process(self):
         try:
@@ -150,13 +651,7 @@ class CPUSchedulerSimulator:
                 messagebox.showerror("Error", "Priority must be between -20 and 20")
                 return
                 
-            self.processes.append({
-                "pid": pid, 
-                "arrival": arrival, 
-                "burst": burst, 
-                "remaining": burst, 
-                "priority": priority
-            })
+            self.processes.append(pid, arrival, burst, priority)
             self.result_text.insert(tk.END, f"Added Process {pid}: Arrival={arrival:.2f}, Burst={burst:.2f}, Priority={priority:.2f}\n")
             for entry in self.entries.values():
                 entry.delete(0, tk.END)
@@ -169,32 +664,207 @@ class CPUSchedulerSimulator:
             messagebox.showerror("Error", "No processes to simulate")
             return
 
-        self.canvas.delete("all")
-        self.result_text.delete(1.0, tk.END)
-        
-        if self.current_algorithm == "RR":
+        quantum = None
+        if self.current_algorithm in QUANTUM_ALGORITHMS:
             try:
                 quantum = float(self.quantum_entry.get())
                 if quantum <= 0:
                     raise ValueError
             except ValueError:
-                messagebox.showerror("Error", "Please enter a valid quantum value")
+                what = "aging interval" if self.current_algorithm == "AGING" else "quantum"
+                messagebox.showerror("Error", f"Please enter a valid {what} value")
                 return
-            self.simulate_rr(quantum)
-        elif self.current_algorithm == "FCFS":
-            self.simulate_fcfs()
-        elif self.current_algorithm == "SJF":
-            if self.is_preemptive.get():
-                self.simulate_sjf_preemptive()
-            else:
-                self.simulate_sjf_non_preemptive()
-        else:  # PP
-            if self.is_preemptive.get():
-                self.simulate_pp_preemptive()
+
+        try:
+            cores = int(self.cores_entry.get())
+            if cores < 1:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a whole number of CPUs (1 or more)")
+            return
+
+        try:
+            switch_cost = float(self.switch_entry.get())
+            warmup = float(self.warmup_entry.get())
+            if switch_cost < 0 or warmup < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Switch cost and warmup must be numbers of at least 0")
+            return
+        if (cores > 1 or switch_cost or warmup) and self.current_algorithm not in SMP_ALGORITHMS:
+            messagebox.showerror("Error", f"{self.current_algorithm} runs on one CPU without switching costs")
+            return
+
+        self.start_job(SimulationJob(self.processes.copy(), self.current_algorithm, self.is_preemptive.get(),
+                                     quantum, cores, metrics=cores == 1 and self.show_metrics.get(),
+                                     switch_cost=switch_cost, warmup=warmup, cache=self.result_cache()))
+
+    def result_cache(self):
+        if self.cache is None:
+            self.cache = default_cache()
+        return self.cache
+
+    def start_job(self, job):
+        self.cancel_job()
+        if self.gantt_view:
+            self.gantt_view.detach()
+            self.gantt_view = None
+        self.canvas.delete("all")
+        self.result_text.delete(1.0, tk.END)
+        self.job = job.start()
+        self.cancel_button.configure(state="normal")
+        if job.streamed:
+            self.live = LiveStrip(self.canvas, job.table)
+            self.log_table.show(LogRows(job.table.pids))
+            self.process_table.show(ProcessRows.pending(job.table))
+            self.progress.configure(mode="determinate", maximum=len(job.table), value=0)
+        else:
+            self.live = None
+            self.log_table.show(LogRows(job.table.pids))
+            self.process_table.show(ProcessRows.pending(job.table))
+            self.progress.configure(mode="indeterminate")
+            self.progress.start(15)
+        self.status_label.configure(text=f"Running {job.algorithm} on {len(job.table)} processes...")
+        self.root.after(POLL_INTERVAL, self.poll_job, job)
+
+    def poll_job(self, job):
+        if job is not self.job:
+            return
+        for message in job.poll():
+            kind = message[0]
+            if kind == "segments":
+                self.live.add(message[1])
+                self.log_table.source.append(message[1])
+                self.process_table.source.started(message[1])
+                self.log_table.render()
+            elif kind == "completed":
+                self.process_table.source.completed(message[1])
+                self.process_table.render()
+                i, completion = message[1][-1]
+                done = self.progress["value"] + len(message[1])
+                self.progress.configure(value=done)
+                self.status_label.configure(text=f"Completed {done:.0f} of {len(job.table)} "
+                                                 f"processes (last: {job.table.pids[i]} at {completion:.2f})")
             else:
-                self.simulate_pp_non_preemptive()
+                self.stop_job()
+                if kind == "done":
+                    self.status_label.configure(text="")
+                    # A finished run consumes the entered processes; loading saved results does not.
+                    self.processes.clear()
+                    self.show_result(message[1], message[2], job.manifest)
+                elif kind == "failed":
+                    self.status_label.configure(text="")
+                    messagebox.showerror("Error", f"Simulation failed: {message[1]}")
+                return
+        self.root.after(POLL_INTERVAL, self.poll_job, job)
 
-    def animate_gantt(self, timeline):
+    def stop_job(self):
+        self.job = None
+        self.live = None
+        self.progress.stop()
+        self.progress.configure(mode="determinate", value=0)
+        self.cancel_button.configure(state="disabled")
+
+    def cancel_job(self):
+        """Cancel the running simulation, if any, and drop whatever it still posts."""
+        if self.job is None:
+            return
+        self.job.cancel()
+        self.stop_job()
+        self.status_label.configure(text="Simulation cancelled")
+
+    def show_result(self, result, cached=None, manifest=None):
+        if self.gantt_view:
+            self.gantt_view.detach()
+            self.gantt_view = None
+        self.canvas.delete("all")
+        self.last_result = result
+        self.last_manifest = manifest
+
+        formatting = time.perf_counter()
+        lines = [self.simulation_title(result)]
+        if cached:
+            lines.append(f"(cache hit: reused result from {cached} cache)")
+        lines.extend(self.summary_lines(result))
+        smp = isinstance(result, SMPResult)
+        if smp:
+            lines.append("")
+            lines.extend(f"CPU {core} Utilization: {utilization:.1%}"
+                         for core, utilization in enumerate(result.utilization()))
+        if result.overhead is not None:
+            lines.append(f"Total Switching Overhead: {result.overhead_time():.2f}")
+            lines.append(f"Effective CPU Utilization: {result.effective_utilization():.1%}")
+        if manifest is not None:
+            lines.append("")
+            lines.append(f"Run manifest: {dumps(manifest)}")
+        self.result_text.delete(1.0, tk.END)
+        self.result_text.insert(tk.END, "\n".join(lines))
+        self.log_table.show(LogRows.from_result(result))
+        self.process_table.show(ProcessRows.from_result(result))
+        if result.metrics is not None:
+            result.metrics.formatting_time = time.perf_counter() - formatting
+            self.show_metrics_panel(result.metrics)
+        if smp:
+            lanes = [with_overhead(lane, overhead) for lane, overhead in zip(result.lanes(), result.overhead_lanes())]
+        elif result.overhead is not None:
+            lanes = [with_overhead(result.timeline, result.overhead)]
+        elif len(result.timeline) <= ANIMATE_LIMIT:
+            timeline = result.timeline
+            self.animate_gantt(list(zip(timeline.index, timeline.start, timeline.duration)), result.table.pids)
+            return
+        else:
+            lanes = [result.timeline]
+        self.gantt_view = GanttView(self.canvas, [GanttIndex(lane) for lane in lanes], result.table.pids)
+
+    def show_metrics_panel(self, metrics):
+        if self.metrics_panel is None or not self.metrics_panel.winfo_exists():
+            self.metrics_panel = tk.Toplevel(self.root)
+            self.metrics_panel.title("Run Metrics")
+            self.metrics_panel.configure(bg="#E6E6FA")
+            text = tk.Text(self.metrics_panel, height=30, width=90, font=("Courier", 10),
+                           bg="#F0F8FF", fg="#483D8B", relief="flat")
+            text.pack(fill="both", expand=True, padx=10, pady=10)
+            self.metrics_panel.text = text
+        text = self.metrics_panel.text
+        text.delete(1.0, tk.END)
+        text.insert(tk.END, "\n".join(metrics.report()))
+
+    def save_results(self):
+        if self.last_result is None:
+            messagebox.showerror("Error", "Run a simulation first")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".sres",
+                                            filetypes=[("Scheduling results", "*.sres")])
+        if path:
+            save_result(self.last_result, path, self.last_manifest)
+
+    def load_results(self):
+        path = filedialog.askopenfilename(filetypes=[("Scheduling results", "*.sres"), ("All files", "*")])
+        if not path:
+            return
+        try:
+            result = load_result(path)
+        except (OSError, ValueError) as exc:
+            messagebox.showerror("Error", f"Could not load results: {exc}")
+            return
+        self.cancel_job()
+        self.show_result(result)
+
+    def simulation_title(self, result):
+        cpus = f" on {result.cores} CPUs" if isinstance(result, SMPResult) else ""
+        if result.algorithm == "RR":
+            return f"Starting Round Robin Simulation{cpus} with Quantum={result.quantum:.2f}..."
+        if result.algorithm in ("MLFQ", "CFS"):
+            return f"Starting {result.algorithm} Simulation with Quantum={result.quantum:.2f}..."
+        if result.algorithm == "AGING":
+            return (f"Starting Priority {'Preemptive' if result.preemptive else 'Non-Preemptive'} Simulation "
+                    f"with Aging Interval={result.quantum:.2f}...")
+        if result.algorithm in ("FCFS", "HRRN"):
+            return f"Starting {result.algorithm} Simulation{cpus}..."
+        name = "SJF" if result.algorithm == "SJF" else "Priority"
+        return f"Starting {name} {'Preemptive' if result.preemptive else 'Non-Preemptive'} Simulation{cpus}..."
+
+    def animate_gantt(self, timeline, pids):
         self.canvas.delete("all")
         x_start = 20
         y = 120
@@ -203,7 +873,7 @@ class CPUSchedulerSimulator:
         time_scale = 25  
         
         
-        total_time = timeline[-1]["start"] + timeline[-1]["duration"] if timeline else 0
+        total_time = timeline[-1][1] + timeline[-1][2] if timeline else 0
         if total_time > 35:  
             time_scale = min(25, 880 / total_time)
         
@@ -213,17 +883,19 @@ class CPUSchedulerSimulator:
         def animate_block(index=0):
             if index >= len(timeline):
                 
-                self.canvas.create_text(current_x, y-30, text=f"{timeline[-1]['start'] + timeline[-1]['duration']:.2f}", 
+                self.canvas.create_text(current_x, y-30, text=f"{timeline[-1][1] + timeline[-1][2]:.2f}", 
                                       font=("Helvetica", 10), fill="#4682B4")
                 return
             
-            entry = timeline[index]
-            width = entry["duration"] * time_scale
-            base_color = random.choice(["#FFB6C1", "#87CEEB", "#98FB98", "#DDA0DD", "#F0E68C"])  # Pastel palette
+            i, start, duration = timeline[index]
+            pid = pids[i]
+            width = duration * time_scale
+            # Same colour per process as in GanttView, so replays look identical.
+            base_color = GanttView.PALETTE[i % len(GanttView.PALETTE)]
             rect_id = self.canvas.create_rectangle(current_x, y, current_x, y + height, fill=base_color, outline="")
-            text_id = self.canvas.create_text(current_x + width/2, y + height/2, text=entry["pid"], 
+            text_id = self.canvas.create_text(current_x + width/2, y + height/2, text=pid, 
                                             font=("Helvetica", 12, "bold"), fill="#483D8B")
-            start_text = self.canvas.create_text(current_x, y-30, text=f"{entry['start']:.2f}", 
+            start_text = self.canvas.create_text(current_x, y-30, text=f"{start:.2f}", 
                                                font=("Helvetica", 10), fill="#4682B4")
 
             def update_frame(frame=0):
@@ -243,311 +915,11 @@ class CPUSchedulerSimulator:
 
         animate_block()
 
-    def simulate_fcfs(self):
-        self.result_text.insert(tk.END, "Starting FCFS Simulation...\n\n")
-        time_elapsed = 0.0
-        completed = []
-        timeline = []
-        processes = sorted(self.processes[:], key=lambda x: x["arrival"])
-        
-        for process in processes:
-            if time_elapsed < process["arrival"]:
-                time_elapsed = process["arrival"]
-            timeline.append({"pid": process["pid"], "start": time_elapsed, "duration": process["burst"]})
-            time_elapsed += process["burst"]
-            completed.append({
-                "pid": process["pid"], "arrival": process["arrival"], "burst": process["burst"],
-                "completion": time_elapsed, "priority": process["priority"]
-            })
-            self.result_text.insert(tk.END, f"Time {time_elapsed-process['burst']:.2f}-{time_elapsed:.2f}: "
-                                  f"Process {process['pid']} executing\n")
-        
-        self.display_results(completed)
-        self.animate_gantt(timeline)
-
-    def simulate_sjf_non_preemptive(self):
-        self.result_text.insert(tk.END, "Starting SJF Non-Preemptive Simulation...\n\n")
-        time_elapsed = 0.0
-        completed = []
-        timeline = []
-        remaining = sorted(self.processes[:], key=lambda x: x["arrival"])
-        
-        while remaining:
-            available = [p for p in remaining if p["arrival"] <= time_elapsed]
-            if not available:
-                time_elapsed = min(p["arrival"] for p in remaining)
-                continue
-            process = min(available, key=lambda x: x["remaining"])
-            timeline.append({"pid": process["pid"], "start": time_elapsed, "duration": process["burst"]})
-            time_elapsed += process["burst"]
-            completed.append({
-                "pid": process["pid"], "arrival": process["arrival"], "burst": process["burst"],
-                "completion": time_elapsed, "priority": process["priority"]
-            })
-            self.result_text.insert(tk.END, f"Time {time_elapsed-process['burst']:.2f}-{time_elapsed:.2f}: "
-                                  f"Process {process['pid']} executing\n")
-            remaining.remove(process)
-        
-        self.display_results(completed)
-        self.animate_gantt(timeline)
-
-    def simulate_sjf_preemptive(self):
-        self.result_text.insert(tk.END, "Starting SJF Preemptive Simulation...\n\n")
-        time_elapsed = 0.0
-        completed = []
-        timeline = []
-        remaining = sorted(self.processes[:], key=lambda x: x["arrival"])
-        current_process = None
-        time_step = 0.1  
-        
-        while remaining or current_process:
-        
-            available = [p for p in remaining if p["arrival"] <= time_elapsed]
-            
-            
-            if not available and not current_process:
-                time_elapsed = min(p["arrival"] for p in remaining)
-                continue
-            
-            
-            if available:
-                next_process = min(available, key=lambda x: x["remaining"])
-                if current_process and current_process["remaining"] > next_process["remaining"]:
-                    
-                    timeline.append({
-                        "pid": current_process["pid"], 
-                        "start": time_elapsed - current_process["elapsed_in_current_burst"],
-                        "duration": current_process["elapsed_in_current_burst"]
-                    })
-                    current_process.pop("elapsed_in_current_burst", None)
-                    remaining.append(current_process)
-                    current_process = next_process
-                    remaining.remove(next_process)
-                    current_process["elapsed_in_current_burst"] = 0
-                elif not current_process:
-                    current_process = next_process
-                    remaining.remove(next_process)
-                    current_process["elapsed_in_current_burst"] = 0
-            
-            if current_process:
-                
-                exec_time = min(time_step, current_process["remaining"])
-                current_process["remaining"] -= exec_time
-                current_process["elapsed_in_current_burst"] = current_process.get("elapsed_in_current_burst", 0) + exec_time
-                time_elapsed += exec_time
-                
-                
-                if current_process["remaining"] <= 0:
-                    timeline.append({
-                        "pid": current_process["pid"], 
-                        "start": time_elapsed - current_process["elapsed_in_current_burst"],
-                        "duration": current_process["elapsed_in_current_burst"]
-                    })
-                    self.result_text.insert(tk.END, f"Time {time_elapsed-current_process['elapsed_in_current_burst']:.2f}-{time_elapsed:.2f}: "
-                                          f"Process {current_process['pid']} executing\n")
-                    
-                    completed.append({
-                        "pid": current_process["pid"], "arrival": current_process["arrival"],
-                        "burst": current_process["burst"], "completion": time_elapsed,
-                        "priority": current_process["priority"]
-                    })
-                    current_process = None
-                
-                
-                elif available and available != [p for p in remaining if p["arrival"] <= time_elapsed - exec_time]:
-                    
-                    timeline.append({
-                        "pid": current_process["pid"], 
-                        "start": time_elapsed - current_process["elapsed_in_current_burst"],
-                        "duration": current_process["elapsed_in_current_burst"]
-                    })
-                    self.result_text.insert(tk.END, f"Time {time_elapsed-current_process['elapsed_in_current_burst']:.2f}-{time_elapsed:.2f}: "
-                                          f"Process {current_process['pid']} executing\n")
-                    current_process["elapsed_in_current_burst"] = 0
-        
-        
-        merged_timeline = []
-        for entry in timeline:
-            if merged_timeline and merged_timeline[-1]["pid"] == entry["pid"] and merged_timeline[-1]["start"] + merged_timeline[-1]["duration"] == entry["start"]:
-                merged_timeline[-1]["duration"] += entry["duration"]
-            else:
-                merged_timeline.append(entry)
-                
-        self.display_results(completed)
-        self.animate_gantt(merged_timeline)
-
-    def simulate_pp_non_preemptive(self):
-        self.result_text.insert(tk.END, "Starting Priority Non-Preemptive Simulation...\n\n")
-        time_elapsed = 0.0
-        completed = []
-        timeline = []
-        remaining = sorted(self.processes[:], key=lambda x: x["arrival"])
-        
-        while remaining:
-            available = [p for p in remaining if p["arrival"] <= time_elapsed]
-            if not available:
-                time_elapsed = min(p["arrival"] for p in remaining)
-                continue
-            
-            process = min(available, key=lambda x: x["priority"])
-            timeline.append({"pid": process["pid"], "start": time_elapsed, "duration": process["burst"]})
-            time_elapsed += process["burst"]
-            completed.append({
-                "pid": process["pid"], "arrival": process["arrival"], "burst": process["burst"],
-                "completion": time_elapsed, "priority": process["priority"]
-            })
-            self.result_text.insert(tk.END, f"Time {time_elapsed-process['burst']:.2f}-{time_elapsed:.2f}: "
-                                  f"Process {process['pid']} executing\n")
-            remaining.remove(process)
-        
-        self.display_results(completed)
-        self.animate_gantt(timeline)
-
-    def simulate_pp_preemptive(self):
-        self.result_text.insert(tk.END, "Starting Priority Preemptive Simulation...\n\n")
-        time_elapsed = 0.0
-        completed = []
-        timeline = []
-        remaining = sorted(self.processes[:], key=lambda x: x["arrival"])
-        current_process = None
-        time_step = 0.1  
-        
-        while remaining or current_process:
-            
-            available = [p for p in remaining if p["arrival"] <= time_elapsed]
-            
-            
-            if not available and not current_process:
-                time_elapsed = min(p["arrival"] for p in remaining)
-                continue
-            
-            
-            if available:
-                next_process = min(available, key=lambda x: x["priority"])
-                if current_process and current_process["priority"] > next_process["priority"]:
-                    
-                    timeline.append({
-                        "pid": current_process["pid"], 
-                        "start": time_elapsed - current_process["elapsed_in_current_burst"],
-                        "duration": current_process["elapsed_in_current_burst"]
-                    })
-                    current_process.pop("elapsed_in_current_burst", None)
-                    remaining.append(current_process)
-                    current_process = next_process
-                    remaining.remove(next_process)
-                    current_process["elapsed_in_current_burst"] = 0
-                elif not current_process:
-                    current_process = next_process
-                    remaining.remove(next_process)
-                    current_process["elapsed_in_current_burst"] = 0
-            
-            if current_process:
-               
-                exec_time = min(time_step, current_process["remaining"])
-                current_process["remaining"] -= exec_time
-                current_process["elapsed_in_current_burst"] = current_process.get("elapsed_in_current_burst", 0) + exec_time
-                time_elapsed += exec_time
-                
-                
-                if current_process["remaining"] <= 0:
-                    timeline.append({
-                        "pid": current_process["pid"], 
-                        "start": time_elapsed - current_process["elapsed_in_current_burst"],
-                        "duration": current_process["elapsed_in_current_burst"]
-                    })
-                    self.result_text.insert(tk.END, f"Time {time_elapsed-current_process['elapsed_in_current_burst']:.2f}-{time_elapsed:.2f}: "
-                                          f"Process {current_process['pid']} executing\n")
-                    
-                    completed.append({
-                        "pid": current_process["pid"], "arrival": current_process["arrival"],
-                        "burst": current_process["burst"], "completion": time_elapsed,
-                        "priority": current_process["priority"]
-                    })
-                    current_process = None
-                
-                
-                elif available and available != [p for p in remaining if p["arrival"] <= time_elapsed - exec_time]:
-                    
-                    timeline.append({
-                        "pid": current_process["pid"], 
-                        "start": time_elapsed - current_process["elapsed_in_current_burst"],
-                        "duration": current_process["elapsed_in_current_burst"]
-                    })
-                    self.result_text.insert(tk.END, f"Time {time_elapsed-current_process['elapsed_in_current_burst']:.2f}-{time_elapsed:.2f}: "
-                                          f"Process {current_process['pid']} executing\n")
-                    current_process["elapsed_in_current_burst"] = 0
-        
-        
-        merged_timeline = []
-        for entry in timeline:
-            if merged_timeline and merged_timeline[-1]["pid"] == entry["pid"] and merged_timeline[-1]["start"] + merged_timeline[-1]["duration"] == entry["start"]:
-                merged_timeline[-1]["duration"] += entry["duration"]
-            else:
-                merged_timeline.append(entry)
-                
-        self.display_results(completed)
-        self.animate_gantt(merged_timeline)
-
-    def simulate_rr(self, quantum):
-        self.result_text.insert(tk.END, f"Starting Round Robin Simulation with Quantum={quantum:.2f}...\n\n")
-        time_elapsed = 0.0
-        completed = []
-        timeline = []
-        remaining = sorted(self.processes[:], key=lambda x: x["arrival"])
-        queue = []
-        
-        while remaining or queue:
-            
-            while remaining and remaining[0]["arrival"] <= time_elapsed:
-                queue.append(remaining.pop(0))
-                
-            
-            if not queue:
-                time_elapsed = remaining[0]["arrival"]
-                continue
-                
-            
-            process = queue.pop(0)
-            
-            
-            exec_time = min(quantum, process["remaining"])
-            timeline.append({"pid": process["pid"], "start": time_elapsed, "duration": exec_time})
-            process["remaining"] -= exec_time
-            time_elapsed += exec_time
-            
-            self.result_text.insert(tk.END, f"Time {time_elapsed-exec_time:.2f}-{time_elapsed:.2f}: "
-                                  f"Process {process['pid']} executing\n")
-            
-            
-            while remaining and remaining[0]["arrival"] <= time_elapsed:
-                queue.append(remaining.pop(0))
-            
-            
-            if process["remaining"] > 0:
-                queue.append(process)
-            else:
-                completed.append({
-                    "pid": process["pid"], "arrival": process["arrival"], "burst": process["burst"],
-                    "completion": time_elapsed, "priority": process["priority"]
-                })
-        
-        self.display_results(completed)
-        self.animate_gantt(timeline)
-
-    def display_results(self, completed):
-        self.result_text.insert(tk.END, "\nSimulation Completed!\n")
-        self.result_text.insert(tk.END, "Process Statistics:\n")
-        
-        avg_waiting = 0
-        for proc in completed:
-            waiting = proc["completion"] - proc["arrival"] - proc["burst"]
-            avg_waiting += waiting
-            self.result_text.insert(tk.END, f"Process {proc['pid']}: Waiting Time = {waiting:.2f}, "
-                                  f"Turnaround Time = {(proc['completion'] - proc['arrival']):.2f}\n")
-        
-        avg_waiting /= len(completed)
-        self.result_text.insert(tk.END, f"\nAverage Waiting Time: {avg_waiting:.2f}")
-        self.processes.clear()
+    def summary_lines(self, result):
+        """Run-wide results; the per-process figures are on the Processes tab."""
+        lines = ["", "Simulation Completed!", f"Average Waiting Time: {result.average_waiting():.2f}"]
+        lines.extend(run_stats(result).report())
+        return lines
 
 def main():
     root = tk.Tk()
@@ -0,0 +1,213 @@
+"""Benchmarks for every scheduling path.
+
+Each case (engine x workload x size) runs in a fresh interpreter so timings
+and peak memory are not polluted by earlier cases.  Results are compared with
+a JSON baseline and the run fails when a case gets slower or hungrier than
+the baseline by more than the threshold.
+
+    python benchmarks/bench.py --update            # record benchmarks/baseline.json
+    python benchmarks/bench.py --threshold 0.25    # compare, exit 1 on regression
+    python benchmarks/bench.py --sizes 100 1000 --workloads uniform bursty
+
+Peak memory is the growth of the process's maximum resident set size during
+the run (Unix only); use --tracemalloc for Python-allocation peaks instead,
+at the cost of much slower runs.
+"""
+
+import argparse
+import contextlib
+import gc
+import importlib.machinery
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from scheduler import core, policies  # noqa: E402
+from scheduler.cache import ResultCache  # noqa: E402
+from scheduler.generate import GENERATORS  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+SIZES = [100, 1000, 10000, 100000, 1000000]
+QUANTUM = 2.0
+
+ENGINES = {
+    "simulate_fcfs": lambda table: core.simulate_fcfs(table),
+    "simulate_sjf_non_preemptive": lambda table: core.simulate_sjf_non_preemptive(table),
+    "simulate_sjf_preemptive": lambda table: core.simulate_sjf_preemptive(table),
+    "simulate_pp_non_preemptive": lambda table: core.simulate_pp_non_preemptive(table),
+    "simulate_pp_preemptive": lambda table: core.simulate_pp_preemptive(table),
+    "simulate_rr": lambda table: core.simulate_rr(table, QUANTUM),
+    "simulate_mlfq": lambda table: policies.simulate_mlfq(table, QUANTUM),
+    "simulate_cfs": lambda table: policies.simulate_cfs(table, QUANTUM),
+    "simulate_hrrn": lambda table: policies.simulate_hrrn(table),
+    "simulate_aging": lambda table: policies.simulate_aging(table, QUANTUM, preemptive=True),
+}
+CLI_FUNCTIONS = ["fcfs_scheduling", "sjn_scheduling", "priority_scheduling", "round_robin_scheduling"]
+
+
+def load_cli():
+    loader = importlib.machinery.SourceFileLoader("cpu_scheduler_cli", os.path.join(ROOT, "Cpu Scheduler"))
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+def prepare(engine, table):
+    """Return a zero-argument callable running ``engine`` on ``table``."""
+    if engine in ENGINES:
+        table.arrival_order()
+        return lambda: ENGINES[engine](table)
+    cli = load_cli()
+    # A cache that never keeps anything, so every repeat runs the engine.
+    cli._cache = ResultCache(None, memory_items=0)
+    function = getattr(cli, engine)
+    processes = [cli.Process(table.pids[i], table.arrival[i], table.burst[i], table.priority[i])
+                 for i in range(len(table))]
+    if engine == "round_robin_scheduling":
+        return lambda: function(processes[:], QUANTUM)
+    return lambda: function(processes[:])
+
+
+def peak_kib():
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_case(engine, workload, size, repeat, use_tracemalloc):
+    """Run one case in this process and return its measurements."""
+    table = GENERATORS[workload](size, seed=size)
+    run = prepare(engine, table)
+    best = float("inf")
+    output = None
+    for _ in range(repeat):
+        output = None
+        gc.collect()
+        started = time.perf_counter()
+        output = run()
+        best = min(best, time.perf_counter() - started)
+
+    if use_tracemalloc:
+        import tracemalloc
+        output = None
+        gc.collect()
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+    else:
+        before = peak_kib()
+        output = None
+        gc.collect()
+        output = run()
+        peak = max(0, peak_kib() - before)
+
+    segments = len(output[2]) if engine in ENGINES else len(output[1])
+    events = size + segments
+    return {"seconds": best, "peak_kib": peak, "events": events, "events_per_second": events / best if best else 0.0}
+
+
+def run_isolated(engine, workload, size, repeat, use_tracemalloc, timeout):
+    command = [sys.executable, os.path.abspath(__file__), "--case", engine, workload, str(size),
+               "--repeat", str(repeat)]
+    if use_tracemalloc:
+        command.append("--tracemalloc")
+    env = dict(os.environ, SCHEDULER_CACHE_DIR="")
+    try:
+        finished = subprocess.run(command, capture_output=True, text=True, timeout=timeout, env=env)
+    except subprocess.TimeoutExpired:
+        return {"status": "timeout"}
+    if finished.returncode:
+        lines = finished.stderr.strip().splitlines()
+        return {"status": "error", "error": lines[-1] if lines else f"exit code {finished.returncode}"}
+    return dict(json.loads(finished.stdout), status="ok")
+
+
+def compare(results, baseline, threshold):
+    """Return human-readable regressions of ``results`` against ``baseline``."""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous or previous.get("status") != "ok":
+            continue
+        if current.get("status") != "ok":
+            regressions.append(f"{key}: {current['status']} (baseline {previous['seconds']:.4f}s)")
+            continue
+        if current["seconds"] > previous["seconds"] * (1 + threshold):
+            regressions.append(f"{key}: {current['seconds']:.4f}s vs baseline {previous['seconds']:.4f}s")
+        if previous["peak_kib"] and current["peak_kib"] > previous["peak_kib"] * (1 + threshold):
+            regressions.append(f"{key}: peak {current['peak_kib']} KiB vs baseline {previous['peak_kib']} KiB")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every scheduling path.")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES) + CLI_FUNCTIONS,
+                        default=list(ENGINES) + CLI_FUNCTIONS)
+    parser.add_argument("--workloads", nargs="+", choices=list(GENERATORS), default=list(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case below 100k processes (best is kept)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds before a case is abandoned")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown, 0.2 = 20%%")
+    parser.add_argument("--update", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    parser.add_argument("--tracemalloc", action="store_true", help="measure peak Python allocations")
+    parser.add_argument("--case", nargs=3, metavar=("ENGINE", "WORKLOAD", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.case:
+        engine, workload, size = args.case
+        # The CLI functions print as they go; stdout must carry only the JSON.
+        with contextlib.redirect_stdout(sys.stderr):
+            result = run_case(engine, workload, int(size), args.repeat, args.tracemalloc)
+        print(json.dumps(result))
+        return 0
+
+    results = {}
+    for size in args.sizes:
+        for workload in args.workloads:
+            for engine in args.engines:
+                key = f"{engine}|{workload}|{size}"
+                repeat = args.repeat if size < 100000 else 1
+                results[key] = result = run_isolated(engine, workload, size, repeat, args.tracemalloc, args.timeout)
+                if result["status"] == "ok":
+                    print(f"{key:55} {result['seconds']:10.4f}s {result['peak_kib']:9d} KiB "
+                          f"{result['events_per_second']:12.0f} events/s")
+                else:
+                    print(f"{key:55} {result['status']}: {result.get('error', '')}")
+
+    report = {"meta": {"python": platform.python_version(), "platform": platform.platform(),
+                       "machine": platform.machine(), "engine_version": core.ENGINE_VERSION},
+              "results": results}
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+    if args.update:
+        with open(args.baseline, "w") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update to create one")
+        return 0
+    with open(args.baseline) as handle:
+        regressions = compare(results, json.load(handle)["results"], args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Cold-start budget for the headless command line simulator.
+
+Runs ``Cpu Scheduler --no-plot`` in fresh interpreters on a small workload
+fed through standard input and reports the median wall time.  The check
+fails when the median exceeds the budget, or when a headless run imports
+matplotlib or tkinter.
+
+    python benchmarks/startup.py                   # 20 runs against the default budget
+    python benchmarks/startup.py --budget 0.1 --imports
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(ROOT, "Cpu Scheduler")
+
+# Three processes, SJN; the answers to the CLI's prompts.
+ANSWERS = "3\n0\n5\n1\n1\n3\n2\n2\n1\n3\n2\n"
+DEFAULT_BUDGET = 0.15
+HEAVY_MODULES = ("matplotlib", "tkinter")
+
+
+def run_once(extra=()):
+    started = time.perf_counter()
+    done = subprocess.run([sys.executable, *extra, CLI, "--no-plot"], input=ANSWERS, capture_output=True,
+                          text=True, cwd=ROOT, env=dict(os.environ, SCHEDULER_CACHE_DIR=""))
+    elapsed = time.perf_counter() - started
+    if done.returncode:
+        raise RuntimeError(f"CLI failed:\n{done.stderr}")
+    return elapsed, done.stderr
+
+
+def import_times(stderr):
+    """``(cumulative microseconds, module)`` for every line of ``-X importtime`` output."""
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            if cumulative.strip().isdigit():
+                yield int(cumulative), module.rstrip()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the headless CLI's cold start.")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="median seconds allowed per run")
+    parser.add_argument("--imports", action="store_true", help="also list the slowest imports")
+    args = parser.parse_args(argv)
+
+    run_once()  # warm the OS file cache and the bytecode cache
+    times = sorted(run_once()[0] for _ in range(args.runs))
+    median = statistics.median(times)
+    print(f"Headless cold start over {args.runs} runs: median {median * 1000:.1f} ms, "
+          f"min {times[0] * 1000:.1f} ms, max {times[-1] * 1000:.1f} ms (budget {args.budget * 1000:.0f} ms)")
+
+    _, stderr = run_once(("-X", "importtime"))
+    imported = sorted(import_times(stderr), reverse=True)
+    heavy = sorted({module.strip() for _, module in imported if module.strip().split(".")[0] in HEAVY_MODULES})
+    if args.imports:
+        for cumulative, module in imported[:15]:
+            print(f"{cumulative / 1000:8.1f} ms {module}")
+
+    failed = False
+    if heavy:
+        print(f"Headless run imported {', '.join(heavy)}")
+        failed = True
+    if median > args.budget:
+        print(f"Cold start is over budget by {(median - args.budget) * 1000:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,15 @@
+"""Scheduling engines shared by the GUI and the command line simulator.
+
+Importing this package never pulls in tkinter or matplotlib.
+"""
+
+from .core import ALGORITHMS, ENGINE_VERSION, Result, schedule
+from .engine import run_preemptive
+from .probe import Metrics
+from .smp import SMPResult, schedule_smp
+from .table import ProcessTable, Timeline
+
+__all__ = [
+    "ALGORITHMS", "ENGINE_VERSION", "Metrics", "ProcessTable", "Result", "SMPResult", "Timeline",
+    "run_preemptive", "schedule", "schedule_smp",
+]
@@ -0,0 +1,113 @@
+"""Vectorized evaluation of many workloads at once.
+
+Each argument is a 2-D array with one workload per row and one process per
+column.  FCFS is solved in closed form with a cumulative-max scan; the
+non-preemptive SJF and Priority schedulers advance every workload in lockstep,
+one dispatch per step, so the Python loop runs once per process column rather
+than once per process.  Policies without a lockstep form (Round Robin and the
+preemptive variants) fall back to :func:`scheduler.schedule` row by row.
+
+This module needs NumPy; the rest of the package does not.
+"""
+
+import numpy as np
+
+from .core import ALGORITHMS, schedule
+from .engine import EPSILON
+from .table import ProcessTable
+
+
+class BatchResult:
+    """Per-process ``completion``, ``waiting`` and ``turnaround`` arrays, shaped like the input."""
+
+    def __init__(self, completion, arrivals, bursts):
+        self.completion = completion
+        self.turnaround = completion - arrivals
+        self.waiting = self.turnaround - bursts
+
+    def average_waiting(self):
+        return self.waiting.mean(axis=1)
+
+    def average_turnaround(self):
+        return self.turnaround.mean(axis=1)
+
+
+def _by_arrival(arrivals, *columns):
+    order = np.argsort(arrivals, axis=1, kind="stable")
+    return order, [np.take_along_axis(column, order, axis=1) for column in (arrivals,) + columns]
+
+
+def _restore(order, values):
+    out = np.empty_like(values)
+    np.put_along_axis(out, order, values, axis=1)
+    return out
+
+
+def fcfs_completion(arrivals, bursts):
+    """Completion times for FCFS.
+
+    With the processes of a row in arrival order and ``S`` the running sum of
+    bursts, ``C[k] = S[k] + max(0, max_{j<=k}(A[j] - S[j-1]))``, which is the
+    closed form of ``C[k] = max(C[k-1], A[k]) + B[k]``.
+    """
+    order, (a, b) = _by_arrival(arrivals, bursts)
+    total = np.cumsum(b, axis=1)
+    idle = np.maximum.accumulate(a - (total - b), axis=1)
+    return _restore(order, total + np.maximum(idle, 0.0))
+
+
+def non_preemptive_completion(arrivals, bursts, keys):
+    """Completion times for non-preemptive selection on ``keys`` (lower runs first).
+
+    Ties on the key go to the earliest arrival, then to the lowest column,
+    matching :func:`scheduler.schedule`.
+    """
+    order, (a, b, k) = _by_arrival(arrivals, bursts, keys)
+    rows = np.arange(a.shape[0])
+    done = np.zeros(a.shape, dtype=bool)
+    completion = np.zeros(a.shape)
+    t = np.zeros(a.shape[0])
+    for _ in range(a.shape[1]):
+        pending_arrival = np.where(done, np.inf, a)
+        upcoming = pending_arrival.min(axis=1)
+        t = np.where(upcoming > t + EPSILON, upcoming, t)
+        pick = np.where(pending_arrival <= t[:, None] + EPSILON, k, np.inf).argmin(axis=1)
+        t = t + b[rows, pick]
+        completion[rows, pick] = t
+        done[rows, pick] = True
+    return _restore(order, completion)
+
+
+def _per_row(arrivals, bursts, priorities, algorithm, preemptive, quantum):
+    completion = np.empty(arrivals.shape)
+    for row in range(arrivals.shape[0]):
+        table = ProcessTable.from_sequences(range(arrivals.shape[1]), arrivals[row].tolist(),
+                                            bursts[row].tolist(), priorities[row].tolist())
+        completion[row] = schedule(table, algorithm, preemptive, quantum).completion
+    return completion
+
+
+def evaluate(arrivals, bursts, algorithm="FCFS", priorities=None, preemptive=False, quantum=None):
+    """Schedule every row of ``arrivals``/``bursts`` and return a :class:`BatchResult`.
+
+    A 1-D input is treated as a single workload.  ``priorities`` defaults to
+    zeros and is only used by PP.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm!r}")
+    arrivals = np.atleast_2d(np.asarray(arrivals, dtype=float))
+    bursts = np.atleast_2d(np.asarray(bursts, dtype=float))
+    if priorities is None:
+        priorities = np.zeros_like(arrivals)
+    else:
+        priorities = np.atleast_2d(np.asarray(priorities, dtype=float))
+    if not arrivals.shape == bursts.shape == priorities.shape:
+        raise ValueError("arrivals, bursts and priorities must have the same shape")
+
+    if algorithm == "FCFS":
+        completion = fcfs_completion(arrivals, bursts)
+    elif algorithm in ("SJF", "PP") and not preemptive:
+        completion = non_preemptive_completion(arrivals, bursts, bursts if algorithm == "SJF" else priorities)
+    else:
+        completion = _per_row(arrivals, bursts, priorities, algorithm, preemptive, quantum)
+    return BatchResult(completion, arrivals, bursts)
@@ -0,0 +1,195 @@
+"""Content-addressed cache of scheduling results.
+
+Results are keyed by a SHA-256 over the process table (pids, arrivals, bursts
+and priorities in row order, since row order decides ties) together with the
+algorithm, the preemption flag, the RR quantum and the engine version.  A
+small in-memory LRU sits in front of an on-disk tier of result files written
+with :mod:`scheduler.store`; disk hits are memory-mapped, and once the
+directory grows past its byte budget the least recently used files are
+deleted.
+
+The default disk location is ``$SCHEDULER_CACHE_DIR``, falling back to
+``$XDG_CACHE_HOME/cpu-scheduler`` or ``~/.cache/cpu-scheduler``.
+"""
+
+import copy
+import hashlib
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections import OrderedDict
+
+from .core import ALGORITHMS, ENGINE_VERSION, PREEMPTIBLE_ALGORITHMS, QUANTUM_ALGORITHMS, schedule
+from .store import load_result, save_result
+from .table import ProcessTable
+
+SUFFIX = ".sres"
+
+
+def workload_hash(table):
+    """Hex SHA-256 of the process table's contents.
+
+    Pids are hashed with their type, so the pid ``1`` and the pid ``"1"``
+    make different workloads.
+    """
+    digest = hashlib.sha256()
+    for pid in table.pids:
+        encoded = f"{type(pid).__name__}:{pid}".encode("utf-8")
+        digest.update(struct.pack("<I", len(encoded)))
+        digest.update(encoded)
+    for column in (table.arrival, table.burst, table.priority):
+        if sys.byteorder == "little":
+            digest.update(memoryview(column).cast("B"))
+        else:
+            values = array("d", column)
+            values.byteswap()
+            digest.update(values)
+    return digest.hexdigest()
+
+
+def cache_key(table, algorithm, preemptive=False, quantum=None, switch_cost=0.0, warmup=0.0):
+    """Key for one run, with parameters normalized the way :func:`schedule` reads them."""
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm!r}")
+    preemptive = bool(preemptive) and algorithm in PREEMPTIBLE_ALGORITHMS
+    quantum = float(quantum) if algorithm in QUANTUM_ALGORITHMS and quantum is not None else None
+    params = f"{ENGINE_VERSION}|{algorithm}|{preemptive}|{quantum!r}|{workload_hash(table)}"
+    if switch_cost or warmup:
+        params += f"|{float(switch_cost)!r}|{float(warmup)!r}"
+    return hashlib.sha256(params.encode("utf-8")).hexdigest()
+
+
+def default_directory():
+    if "SCHEDULER_CACHE_DIR" in os.environ:
+        return os.environ["SCHEDULER_CACHE_DIR"] or None
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "cpu-scheduler")
+
+
+def default_cache():
+    """A cache on :func:`default_directory`, or memory-only if that cannot be created."""
+    try:
+        return ResultCache(default_directory())
+    except OSError:
+        return ResultCache(None)
+
+
+class ResultCache:
+    """Two-tier (memory LRU + size-bounded directory) cache in front of :func:`schedule`.
+
+    ``directory=None`` disables the disk tier. The directory's size is scanned once,
+    on the first store, and then tracked in ``disk_bytes``; the directory is only
+    listed again when that count passes ``max_bytes``.
+    """
+
+    def __init__(self, directory=None, memory_items=32, max_bytes=1 << 30):
+        self.directory = directory
+        self.memory_items = memory_items
+        self.max_bytes = max_bytes
+        self.memory = OrderedDict()
+        self.disk_bytes = None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key):
+        """Return ``(result, tier)`` with tier ``"memory"`` or ``"disk"``, or ``(None, None)``."""
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return self.memory[key], "memory"
+        if self.directory:
+            path = self.path(key)
+            try:
+                result = load_result(path)
+                os.utime(path)
+            except (OSError, ValueError):
+                return None, None
+            self._remember(key, result)
+            return result, "disk"
+        return None, None
+
+    def put(self, key, result):
+        """Store ``result``; a failing disk tier (full, read-only) is skipped silently."""
+        self._remember(key, result)
+        if not self.directory:
+            return
+        try:
+            handle, temporary = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+            os.close(handle)
+        except OSError:
+            return
+        path = self.path(key)
+        try:
+            save_result(result, temporary)
+            replaced = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(temporary, path)
+            written = os.path.getsize(path)
+        except OSError:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            return
+        if self.disk_bytes is None:
+            self.evict()
+            return
+        self.disk_bytes += written - replaced
+        if self.disk_bytes > self.max_bytes:
+            self.evict()
+
+    def _remember(self, key, result):
+        if result.metrics is not None:
+            # Measurements describe the run that produced them, not later hits.
+            result = copy.copy(result)
+            result.metrics = None
+        self.memory[key] = result
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_items:
+            self.memory.popitem(last=False)
+
+    def evict(self):
+        """Delete least recently used result files until the directory fits ``max_bytes``,
+        and reset ``disk_bytes`` to what is left."""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(SUFFIX) and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self.disk_bytes = total
+
+    def clear(self):
+        self.memory.clear()
+        if self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith(SUFFIX):
+                    os.remove(os.path.join(self.directory, name))
+            self.disk_bytes = 0
+
+    def schedule(self, processes, algorithm, preemptive=False, quantum=None, metrics=False, profile=None,
+                 switch_cost=0.0, warmup=0.0):
+        """Like :func:`schedule`, but returns ``(result, tier)`` where ``tier`` is the
+        cache tier that answered (``"memory"``/``"disk"``) or ``None`` for a fresh run.
+
+        Asking for ``metrics`` or a ``profile`` always runs the engine, since a
+        cached result has no run to measure; the fresh result is still cached."""
+        table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_records(processes)
+        key = cache_key(table, algorithm, preemptive, quantum, switch_cost, warmup)
+        result, tier = (None, None) if metrics or profile else self.get(key)
+        if result is None:
+            result = schedule(table, algorithm, preemptive, quantum, metrics, profile, switch_cost, warmup)
+            self.put(key, result)
+        return result, tier
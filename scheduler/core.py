@@ -0,0 +1,340 @@
+"""Headless scheduling API shared by the GUI and the command line simulator.
+
+Nothing in here imports tkinter or matplotlib, so the functions can run on
+batch nodes and inside worker processes.  Every simulator takes a
+:class:`ProcessTable` and returns ``(order, completion, timeline)``: the row
+indices in completion order, the completion time of every row and the
+executed Gantt segments as a :class:`Timeline`.  They also accept an
+optional ``probe`` (a :class:`~scheduler.probe.Metrics`) that samples each
+ready-set selection.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections import deque
+from heapq import heappop, heappush
+from itertools import repeat
+from math import ceil
+from operator import add, mul
+from time import perf_counter
+
+from .engine import EPSILON, INF, run_preemptive
+from .policies import simulate_aging, simulate_cfs, simulate_hrrn, simulate_mlfq
+from .probe import PROFILERS, Metrics, profiled
+from .table import ProcessTable, Timeline
+
+ALGORITHMS = ("FCFS", "SJF", "PP", "RR", "MLFQ", "CFS", "HRRN", "AGING")
+
+# Algorithms that take a quantum (for AGING it is the aging interval) and
+# algorithms that have both a preemptive and a non-preemptive form.
+QUANTUM_ALGORITHMS = ("RR", "MLFQ", "CFS", "AGING")
+PREEMPTIBLE_ALGORITHMS = ("SJF", "PP", "AGING")
+
+# Bump whenever a change to the engines can alter a schedule, so cached and
+# recorded results from older engines are not mistaken for current ones.
+ENGINE_VERSION = 5
+
+
+class Result:
+    """Outcome of one scheduling run, stored column-wise against its table."""
+
+    def __init__(self, table, algorithm, preemptive, quantum, order, completion, timeline, overhead=None,
+                 metrics=None):
+        self.table = table
+        self.algorithm = algorithm
+        self.preemptive = preemptive
+        self.quantum = quantum
+        self.order = order
+        self.completion = completion
+        self.timeline = timeline
+        self.overhead = overhead
+        self.metrics = metrics
+
+    @property
+    def completed(self):
+        """Finished processes as dicts, in completion order."""
+        table = self.table
+        return [dict(table.record(i), completion=self.completion[i]) for i in self.order]
+
+    def segments(self):
+        """Yield ``(pid, start, duration)`` for every executed Gantt segment."""
+        pids = self.table.pids
+        timeline = self.timeline
+        for i, start, duration in zip(timeline.index, timeline.start, timeline.duration):
+            yield pids[i], start, duration
+
+    def stats(self):
+        """Return ``(pid, waiting, turnaround)`` for each completed process."""
+        table = self.table
+        arrival, burst, completion = table.arrival, table.burst, self.completion
+        return [(table.pids[i], completion[i] - arrival[i] - burst[i], completion[i] - arrival[i])
+                for i in self.order]
+
+    def average_waiting(self):
+        if not self.order:
+            return 0.0
+        return self.average_turnaround() - sum(self.table.burst) / len(self.order)
+
+    def average_turnaround(self):
+        if not self.order:
+            return 0.0
+        return (sum(self.completion) - sum(self.table.arrival)) / len(self.order)
+
+    def makespan(self):
+        return self.timeline.end()
+
+    def overhead_time(self):
+        """Total time spent switching between processes."""
+        return sum(self.overhead.duration) if self.overhead is not None else 0.0
+
+    def effective_utilization(self):
+        """Share of the makespan spent running processes, not idling or switching."""
+        span = self.makespan()
+        return sum(self.timeline.duration) / span if span else 0.0
+
+
+def simulate_fcfs(table, probe=None):
+    arrival, burst = table.arrival, table.burst
+    order = table.arrival_order()
+    completion = array("d", bytes(8 * len(order)))
+    timeline = Timeline()
+    time_elapsed = 0.0
+    if probe is not None:
+        arrived = [arrival[i] for i in order]
+    for position, i in enumerate(order):
+        if time_elapsed < arrival[i]:
+            time_elapsed = arrival[i]
+        if probe is not None:
+            probe.selected(bisect_right(arrived, time_elapsed) - position, 0.0)
+        timeline.append(i, time_elapsed, burst[i])
+        time_elapsed += burst[i]
+        completion[i] = time_elapsed
+    return array("l", order), completion, timeline
+
+
+def _simulate_non_preemptive(table, keys, probe=None):
+    """Run the process with the smallest ``keys[i]`` to completion, repeatedly.
+
+    Arrivals enter a ready heap through a cursor into the arrival order, so
+    every dispatch costs O(log n), and an idle CPU jumps straight to the next
+    arrival.  Heap entries are ``(key, rank, row)`` with ``rank`` the position
+    in arrival order: equal keys go to the earlier arrival, and processes
+    arriving together to the one listed first in the table.  An arrival
+    within ``EPSILON`` of the clock counts as due, so float drift in the
+    clock cannot hold it back behind a later dispatch.
+    """
+    arrival, burst = table.arrival, table.burst
+    order = table.arrival_order()
+    n = len(order)
+    completion = array("d", bytes(8 * n))
+    finished = array("l")
+    timeline = Timeline()
+    ready = []
+    cursor = 0
+    time_elapsed = 0.0
+
+    while cursor < n or ready:
+        if not ready and arrival[order[cursor]] > time_elapsed + EPSILON:
+            time_elapsed = arrival[order[cursor]]
+        while cursor < n and arrival[order[cursor]] <= time_elapsed + EPSILON:
+            i = order[cursor]
+            heappush(ready, (keys[i], cursor, i))
+            cursor += 1
+        if probe is None:
+            i = heappop(ready)[2]
+        else:
+            selecting = perf_counter()
+            available = len(ready)
+            i = heappop(ready)[2]
+            probe.selected(available, perf_counter() - selecting)
+        timeline.append(i, time_elapsed, burst[i])
+        time_elapsed += burst[i]
+        completion[i] = time_elapsed
+        finished.append(i)
+    return finished, completion, timeline
+
+
+def simulate_sjf_non_preemptive(table, probe=None):
+    return _simulate_non_preemptive(table, table.burst, probe)
+
+
+def simulate_sjf_preemptive(table, probe=None):
+    return run_preemptive(table, "remaining", probe)
+
+
+def simulate_pp_non_preemptive(table, probe=None):
+    return _simulate_non_preemptive(table, table.priority, probe)
+
+
+def simulate_pp_preemptive(table, probe=None):
+    return run_preemptive(table, "priority", probe)
+
+
+def _full_rounds(queue, left, quantum, time_elapsed, next_arrival):
+    """How many whole rounds the ready queue can run without any change.
+
+    A round is one quantum for every queued process.  Rounds are safe to skip
+    over in bulk while nobody can finish inside them and no arrival can be
+    admitted at one of their slice boundaries, since the queue then comes out
+    of every round in the same order it went in.
+    """
+    rounds = min(ceil(left[i] / quantum - EPSILON) for i in queue) - 1
+    if next_arrival != INF:
+        rounds = min(rounds, ceil((next_arrival - time_elapsed) / (quantum * len(queue)) - EPSILON) - 1)
+    return rounds
+
+
+def simulate_rr(table, quantum, probe=None):
+    """Round Robin over a deque ready queue and a cursor into the arrival order.
+
+    Processes arriving during a slice are queued ahead of the process that was
+    just preempted.  Whenever the queue has gone through a full round the
+    engine checks how many further rounds it could run with no arrival and no
+    completion, and charges them in one step.  A slice that continues the
+    process that ran just before it extends that process's Gantt segment, as
+    in :mod:`scheduler.smp`, so every segment is one dispatch.
+    """
+    arrival = table.arrival
+    order = table.arrival_order()
+    n = len(order)
+    left = array("d", table.burst)
+    completion = array("d", bytes(8 * n))
+    finished = array("l")
+    timeline = Timeline()
+    time_elapsed = 0.0
+    cursor = 0
+    queue = deque()
+    countdown = 0
+    previous = -1
+
+    while cursor < n or queue:
+        while cursor < n and arrival[order[cursor]] <= time_elapsed + EPSILON:
+            queue.append(order[cursor])
+            cursor += 1
+
+        if not queue:
+            time_elapsed = arrival[order[cursor]]
+            previous = -1
+            continue
+
+        if countdown <= 0:
+            countdown = len(queue)
+            next_arrival = arrival[order[cursor]] if cursor < n else INF
+            rounds = _full_rounds(queue, left, quantum, time_elapsed, next_arrival)
+            if rounds > 1:
+                slices = rounds * len(queue)
+                if len(queue) == 1:
+                    if queue[0] == previous:
+                        timeline.duration[-1] = time_elapsed + slices * quantum - timeline.start[-1]
+                    else:
+                        timeline.append(queue[0], time_elapsed, rounds * quantum)
+                else:
+                    timeline.index.extend(array("l", queue) * rounds)
+                    timeline.start.extend(map(add, repeat(time_elapsed, slices),
+                                              map(mul, range(slices), repeat(quantum, slices))))
+                    timeline.duration.extend(array("d", [quantum]) * slices)
+                previous = queue[-1]
+                for i in queue:
+                    left[i] -= rounds * quantum
+                time_elapsed += slices * quantum
+                if probe is not None:
+                    probe.selected(len(queue), 0.0, slices)
+
+        if probe is None:
+            i = queue.popleft()
+        else:
+            selecting = perf_counter()
+            i = queue.popleft()
+            probe.selected(len(queue) + 1, perf_counter() - selecting)
+        countdown -= 1
+        exec_time = min(quantum, left[i])
+        if i == previous:
+            timeline.duration[-1] = time_elapsed + exec_time - timeline.start[-1]
+        else:
+            timeline.append(i, time_elapsed, exec_time)
+            previous = i
+        left[i] -= exec_time
+        time_elapsed += exec_time
+
+        while cursor < n and arrival[order[cursor]] <= time_elapsed + EPSILON:
+            queue.append(order[cursor])
+            cursor += 1
+
+        if left[i] > EPSILON:
+            queue.append(i)
+        else:
+            completion[i] = time_elapsed
+            finished.append(i)
+    return finished, completion, timeline
+
+
+def schedule(processes, algorithm, preemptive=False, quantum=None, metrics=False, profile=None,
+             switch_cost=0.0, warmup=0.0):
+    """Schedule ``processes`` with ``algorithm`` and return a :class:`Result`.
+
+    ``processes`` is a :class:`ProcessTable` or an iterable of process dicts.
+    ``algorithm`` is one of ``ALGORITHMS``.  ``preemptive`` only affects SJF,
+    PP and AGING (FCFS and HRRN never preempt; RR, MLFQ and CFS always do).
+    ``quantum`` is required for RR, for MLFQ (the top level's slice) and for
+    CFS (the shortest slice), and for AGING it is the time a process has to
+    wait to gain one priority level.  The input processes are not modified.
+
+    With ``metrics`` the result carries a :class:`~scheduler.probe.Metrics`
+    in ``result.metrics``; ``profile`` (``"cprofile"`` or ``"tracemalloc"``)
+    also runs the engine under that profiler and keeps its report in
+    ``result.metrics.profile``.
+
+    ``switch_cost`` and ``warmup`` charge context-switch and cache-warmup
+    time (see :mod:`scheduler.smp`).  The switching shows up as segments in
+    ``result.overhead`` and delays everything scheduled after it.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm!r}")
+    if profile is not None and profile not in PROFILERS:
+        raise ValueError(f"Unknown profiler: {profile!r}")
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_records(processes)
+    args = (table,)
+    if algorithm in QUANTUM_ALGORITHMS and (quantum is None or quantum <= 0):
+        if algorithm == "RR":
+            raise ValueError("Round Robin needs a positive quantum")
+        if algorithm == "AGING":
+            raise ValueError("Aging needs a positive aging interval")
+        raise ValueError(f"{algorithm} needs a positive quantum")
+    if algorithm == "RR":
+        engine, args = simulate_rr, (table, quantum)
+    elif algorithm == "FCFS":
+        engine = simulate_fcfs
+    elif algorithm == "SJF":
+        engine = simulate_sjf_preemptive if preemptive else simulate_sjf_non_preemptive
+    elif algorithm == "PP":
+        engine = simulate_pp_preemptive if preemptive else simulate_pp_non_preemptive
+    elif algorithm == "MLFQ":
+        engine, args = simulate_mlfq, (table, quantum)
+    elif algorithm == "CFS":
+        engine, args = simulate_cfs, (table, quantum)
+    elif algorithm == "HRRN":
+        engine = simulate_hrrn
+    else:  # AGING
+        engine, args = simulate_aging, (table, quantum, bool(preemptive))
+    preemptive = bool(preemptive) and algorithm in PREEMPTIBLE_ALGORITHMS
+    quantum = quantum if algorithm in QUANTUM_ALGORITHMS else None
+    if switch_cost or warmup:
+        # Switching overhead is modelled by the event-driven multi-CPU
+        # machine, which itself builds on this module.
+        from .smp import SMP_ALGORITHMS, simulate_overhead
+        if algorithm not in SMP_ALGORITHMS:
+            raise ValueError(f"Switching overhead is not modelled for {algorithm}")
+        engine, args = simulate_overhead, (table, algorithm, preemptive, quantum, switch_cost, warmup)
+
+    if not (metrics or profile):
+        return Result(table, algorithm, preemptive, quantum, *engine(*args))
+    probe = Metrics()
+    table.arrival_order()
+    started = perf_counter()
+    if profile is None:
+        run = engine(*args, probe)
+    else:
+        run, probe.profile = profiled(lambda: engine(*args, probe), profile)
+    probe.simulation_time = perf_counter() - started
+    probe.finish(run[0], run[2])
+    return Result(table, algorithm, preemptive, quantum, *run, metrics=probe)
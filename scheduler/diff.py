@@ -0,0 +1,219 @@
+"""Compare two scheduling runs without loading either into memory.
+
+Each side is a result file written by :func:`scheduler.store.save_result`
+(memory-mapped) or a JSON Lines event log from :mod:`scheduler.stream`
+(plain or gzipped, read twice: once for segments, once for completions).
+The tool reports the first Gantt segment where the runs diverge and joins
+the completions by pid to report per-process waiting and turnaround deltas.
+Completions are joined through a table of pids seen on only one side so
+far, so memory stays small while the two runs finish processes in roughly
+the same order.  Pids are assumed to be unique.
+
+    python -m scheduler.diff old.jsonl new.jsonl
+    python -m scheduler.diff baseline.sres candidate.sres --tolerance 1e-9
+
+Exits with status 0 when the runs match and 1 when they differ.
+"""
+
+import argparse
+import gzip
+import heapq
+import json
+import sys
+from itertools import zip_longest
+
+from .store import MAGIC, load_result, read_manifest
+
+# How many processes with the largest turnaround delta are listed.
+TOP = 10
+
+
+def _is_result_file(path):
+    with open(path, "rb") as handle:
+        return handle.read(len(MAGIC)) == MAGIC
+
+
+def _events(path, kind):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt") as handle:
+        for line in handle:
+            if line.strip():
+                event = json.loads(line)
+                if event["event"] == kind:
+                    yield event
+
+
+class Run:
+    """One side of a comparison, readable as segments and as completions."""
+
+    __slots__ = ("path", "result")
+
+    def __init__(self, path):
+        self.path = path
+        self.result = load_result(path) if _is_result_file(path) else None
+
+    def segments(self):
+        """Yield ``(pid, start, duration)`` in the order the run produced them."""
+        if self.result is None:
+            for event in _events(self.path, "segment"):
+                yield str(event["pid"]), event["start"], event["duration"]
+            return
+        pids, timeline = self.result.table.pids, self.result.timeline
+        for i, start, duration in zip(timeline.index, timeline.start, timeline.duration):
+            yield pids[i], start, duration
+
+    def completions(self):
+        """Yield ``(pid, arrival, burst, completion)`` in completion order."""
+        if self.result is None:
+            for event in _events(self.path, "completed"):
+                yield str(event["pid"]), event["arrival"], event["burst"], event["completion"]
+            return
+        table, completion = self.result.table, self.result.completion
+        pids, arrival, burst = table.pids, table.arrival, table.burst
+        for i in self.result.order:
+            yield pids[i], arrival[i], burst[i], completion[i]
+
+
+def _differs(a, b, tolerance):
+    return abs(a - b) > tolerance
+
+
+def compare_segments(a, b, tolerance=0.0):
+    """Return ``(first divergence, segments in a, segments in b, makespan a, makespan b)``.
+
+    The divergence is ``None`` or ``(position, segment in a, segment in b)``
+    with ``None`` for a side that ran out of segments.
+    """
+    first = None
+    counts = [0, 0]
+    ends = [0.0, 0.0]
+    for position, (left, right) in enumerate(zip_longest(a, b)):
+        for side, segment in enumerate((left, right)):
+            if segment is not None:
+                counts[side] += 1
+                ends[side] = max(ends[side], segment[1] + segment[2])
+        if first is None and (left is None or right is None or left[0] != right[0]
+                              or _differs(left[1], right[1], tolerance) or _differs(left[2], right[2], tolerance)):
+            first = (position, left, right)
+    return first, counts[0], counts[1], ends[0], ends[1]
+
+
+class CompletionDeltas:
+    """Per-process waiting and turnaround deltas (b minus a), joined by pid."""
+
+    __slots__ = ("tolerance", "matched", "changed", "inputs_changed", "waiting_delta", "largest_delta",
+                 "waiting", "only_a", "only_b", "top")
+
+    def __init__(self, tolerance=0.0):
+        self.tolerance = tolerance
+        self.matched = 0
+        self.changed = 0
+        self.inputs_changed = 0
+        self.waiting_delta = 0.0
+        self.largest_delta = 0.0
+        self.waiting = [0.0, 0.0]
+        self.only_a = {}
+        self.only_b = {}
+        self.top = []
+
+    def feed(self, a, b):
+        pending = [self.only_a, self.only_b]
+        for side, completed in enumerate((a, b)):
+            if completed is None:
+                continue
+            pid, arrival, burst, completion = completed
+            self.waiting[side] += completion - arrival - burst
+            other = pending[1 - side]
+            if pid in other:
+                match = other.pop(pid)
+                self._match(*((match, completed) if side else (completed, match)))
+            else:
+                pending[side][pid] = completed
+
+    def _match(self, a, b):
+        pid, arrival, burst, completion = a
+        _, arrival_b, burst_b, completion_b = b
+        self.matched += 1
+        if _differs(arrival, arrival_b, self.tolerance) or _differs(burst, burst_b, self.tolerance):
+            self.inputs_changed += 1
+        turnaround = completion - arrival
+        delta = (completion_b - arrival_b) - turnaround
+        waiting = delta - (burst_b - burst)
+        if _differs(delta, 0.0, self.tolerance) or _differs(waiting, 0.0, self.tolerance):
+            self.changed += 1
+            self.waiting_delta += waiting
+            self.largest_delta = max(self.largest_delta, abs(delta))
+            entry = (abs(delta), pid, waiting, delta)
+            if len(self.top) < TOP:
+                heapq.heappush(self.top, entry)
+            elif entry > self.top[0]:
+                heapq.heapreplace(self.top, entry)
+
+    @property
+    def identical(self):
+        return not (self.changed or self.inputs_changed or self.only_a or self.only_b)
+
+
+def _segment_text(segment):
+    if segment is None:
+        return "nothing (run ended)"
+    pid, start, duration = segment
+    return f"{pid} at {start!r} for {duration!r}"
+
+
+def diff(path_a, path_b, tolerance=0.0):
+    """Compare two runs; return ``(identical, report lines)``."""
+    run_a, run_b = Run(path_a), Run(path_b)
+    first, count_a, count_b, end_a, end_b = compare_segments(run_a.segments(), run_b.segments(), tolerance)
+    deltas = CompletionDeltas(tolerance)
+    for a, b in zip_longest(run_a.completions(), run_b.completions()):
+        deltas.feed(a, b)
+
+    lines = []
+    if run_a.result is not None and run_b.result is not None:
+        manifests = read_manifest(path_a) or {}, read_manifest(path_b) or {}
+        changed = sorted(key for key in set(manifests[0]) | set(manifests[1])
+                         if manifests[0].get(key) != manifests[1].get(key))
+        if changed:
+            lines.append(f"Manifests differ in: {', '.join(changed)}")
+    lines.append(f"Segments: {count_a} vs {count_b}; makespan {end_a!r} vs {end_b!r}")
+    if first is None:
+        lines.append("Gantt charts are identical")
+    else:
+        position, left, right = first
+        lines.append(f"First divergence at segment {position}: {_segment_text(left)} vs {_segment_text(right)}")
+    completed_a = deltas.matched + len(deltas.only_a)
+    completed_b = deltas.matched + len(deltas.only_b)
+    lines.append(f"Processes: {completed_a} vs {completed_b}, {deltas.matched} in both")
+    if completed_a and completed_b:
+        lines.append(f"Average waiting time: {deltas.waiting[0] / completed_a:.6g} vs "
+                     f"{deltas.waiting[1] / completed_b:.6g}")
+    if deltas.inputs_changed:
+        lines.append(f"{deltas.inputs_changed} processes have a different arrival or burst")
+    if deltas.changed:
+        lines.append(f"{deltas.changed} processes changed: mean waiting delta "
+                     f"{deltas.waiting_delta / deltas.changed:+.6g}, largest turnaround delta "
+                     f"{deltas.largest_delta:.6g}")
+        for _, pid, waiting, delta in sorted(deltas.top, reverse=True):
+            lines.append(f"  {pid}: waiting {waiting:+.6g}, turnaround {delta:+.6g}")
+    for name, only in (("first", deltas.only_a), ("second", deltas.only_b)):
+        if only:
+            shown = ", ".join(list(only)[:TOP])
+            lines.append(f"{len(only)} processes only in the {name} run: {shown}{', ...' if len(only) > TOP else ''}")
+    return first is None and count_a == count_b and deltas.identical, lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two scheduling runs segment by segment.")
+    parser.add_argument("first", help="result file (.sres) or stream event log (.jsonl, .jsonl.gz)")
+    parser.add_argument("second", help="result file (.sres) or stream event log (.jsonl, .jsonl.gz)")
+    parser.add_argument("--tolerance", type=float, default=0.0,
+                        help="largest time difference still counted as equal (default: exact)")
+    args = parser.parse_args(argv)
+    identical, lines = diff(args.first, args.second, args.tolerance)
+    print("\n".join(lines))
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Level-of-detail index over Gantt timelines for fast zoomable rendering.
+
+Level 0 holds the timeline with back-to-back slices of the same process
+coalesced into one block.  Each further level merges neighbouring blocks of
+the level below until every merged block spans at least that level's
+resolution, which doubles from level to level.  A window query picks the
+coarsest level that is still finer than one pixel and bisects into it, so the
+number of blocks returned is proportional to the pixel width of the view, not
+to the length of the timeline.
+"""
+
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import invert
+
+from .engine import EPSILON
+from .table import Timeline
+
+# Stop adding levels once a level is this small; it is cheap to draw in full.
+MIN_LEVEL_BLOCKS = 2048
+# Finest merged resolution, as a fraction of the whole timeline's span.
+BASE_FRACTION = 2.0 ** -20
+
+
+class _Level:
+    __slots__ = ("resolution", "start", "end", "index", "mixed")
+
+    def __init__(self, resolution):
+        self.resolution = resolution
+        self.start = array("d")
+        self.end = array("d")
+        self.index = array("l")
+        self.mixed = array("b")
+
+    def append(self, start, end, i, mixed):
+        self.start.append(start)
+        self.end.append(end)
+        self.index.append(i)
+        self.mixed.append(mixed)
+
+    def __len__(self):
+        return len(self.start)
+
+
+def _coalesce(timeline):
+    level = _Level(0.0)
+    for i, start, duration in zip(timeline.index, timeline.start, timeline.duration):
+        if level.start and level.index[-1] == i and start - level.end[-1] < EPSILON:
+            level.end[-1] = start + duration
+        else:
+            level.append(start, start + duration, i, False)
+    return level
+
+
+def _merge(below, resolution):
+    level = _Level(resolution)
+    starts, ends, index, mixed = below.start, below.end, below.index, below.mixed
+    group_start, group_end = starts[0], ends[0]
+    best, best_length, group_mixed = index[0], ends[0] - starts[0], mixed[0]
+    for k in range(1, len(below)):
+        start, end = starts[k], ends[k]
+        if start - group_end > resolution or group_end - group_start >= resolution:
+            level.append(group_start, group_end, best, group_mixed)
+            group_start, group_end = start, end
+            best, best_length, group_mixed = index[k], end - start, mixed[k]
+            continue
+        group_end = end
+        group_mixed = group_mixed or mixed[k] or index[k] != best
+        if end - start > best_length:
+            best, best_length = index[k], end - start
+    level.append(group_start, group_end, best, group_mixed)
+    return level
+
+
+class GanttIndex:
+    """Multi-resolution view of a :class:`Timeline` for windowed queries."""
+
+    def __init__(self, timeline):
+        self.levels = [_coalesce(timeline)]
+        top = self.levels[0]
+        self.begin = top.start[0] if len(top) else 0.0
+        self.end = top.end[-1] if len(top) else 0.0
+        resolution = (self.end - self.begin) * BASE_FRACTION
+        while len(self.levels[-1]) > MIN_LEVEL_BLOCKS and resolution > 0:
+            self.levels.append(_merge(self.levels[-1], resolution))
+            resolution *= 2
+
+    def blocks(self, t0, t1, pixels):
+        """Return the blocks overlapping ``[t0, t1]`` at roughly one-pixel detail.
+
+        Each block is ``(start, end, index, mixed)``; ``index`` is the table
+        row of the process that ran longest in the block and ``mixed`` tells
+        whether other processes were folded into it.
+        """
+        per_pixel = (t1 - t0) / max(pixels, 1)
+        level = self.levels[0]
+        for candidate in self.levels[1:]:
+            if candidate.resolution > per_pixel:
+                break
+            level = candidate
+        first = bisect_right(level.end, t0)
+        last = bisect_left(level.start, t1, first)
+        return list(zip(level.start[first:last], level.end[first:last],
+                        level.index[first:last], level.mixed[first:last]))
+
+
+def with_overhead(timeline, overhead):
+    """Merge switching ``overhead`` into ``timeline`` for drawing.
+
+    Both timelines must be in start order.  Overhead rows come back with
+    index ``~i`` (always negative), where ``i`` is the process being switched
+    to, so renderers can tell them apart from execution.
+    """
+    merged = Timeline()
+    rows = heapq.merge(zip(timeline.start, timeline.duration, timeline.index),
+                       zip(overhead.start, overhead.duration, map(invert, overhead.index)))
+    for start, duration, i in rows:
+        merged.append(i, start, duration)
+    return merged
@@ -0,0 +1,138 @@
+"""Seeded synthetic workload generators.
+
+Every generator returns a :class:`ProcessTable` of ``n`` processes with
+integer-like pids and Poisson-style arrivals whose average offered load is
+``load`` (1.0 keeps the CPU exactly busy on average).  The same ``seed``
+always produces the same table.
+
+:func:`generate_records` yields the same workloads lazily, as arrival-ordered
+records for :func:`scheduler.stream.stream_schedule`, so a workload of any
+size can be simulated without ever being held in memory.  Both are built on
+one sampler per distribution, so a table and the records of the same
+generator, seed and options hold the same processes.
+"""
+
+import random
+from array import array
+from functools import partial
+from itertools import islice, repeat
+
+from .table import ProcessTable
+
+
+# Lazy generators draw this many processes at a time.
+CHUNK = 4096
+
+
+def _poisson_times(rng, rate):
+    time = 0.0
+    while True:
+        time += rng.expovariate(rate)
+        yield time
+
+
+def _cluster_times(rng, rate, mean_cluster):
+    time = 0.0
+    while True:
+        size = 1 + int(rng.expovariate(1 / mean_cluster))
+        time += rng.expovariate(rate / size)
+        yield from repeat(time, size)
+
+
+def _streams(seed):
+    # One stream per column, so the sample does not depend on how many
+    # processes are drawn at a time.
+    return (random.Random(f"{seed}:{column}") for column in ("arrival", "burst", "priority"))
+
+
+# Each sampler returns an endless iterator of arrival times and callables
+# drawing one burst and one priority; tables and records share them.
+
+def _sample_uniform(seed, load, mean_burst):
+    arrivals, bursts, priorities = _streams(seed)
+    return (_poisson_times(arrivals, load / mean_burst), partial(bursts.uniform, 0.01, 2 * mean_burst),
+            partial(priorities.randint, -20, 20))
+
+
+def _sample_heavy_tailed(seed, load, mean_burst, alpha=1.5):
+    arrivals, bursts, priorities = _streams(seed)
+    scale = mean_burst * (alpha - 1) / alpha
+    return (_poisson_times(arrivals, load / mean_burst), lambda: scale * bursts.paretovariate(alpha),
+            partial(priorities.randint, -20, 20))
+
+
+def _sample_bursty(seed, load, mean_burst, mean_cluster=50):
+    arrivals, bursts, priorities = _streams(seed)
+    return (_cluster_times(arrivals, load / mean_burst, mean_cluster),
+            partial(bursts.uniform, 0.01, 2 * mean_burst), partial(priorities.randint, -20, 20))
+
+
+def _sample_equal_priorities(seed, load, mean_burst):
+    arrivals, bursts, priorities = _streams(seed)
+    return (_poisson_times(arrivals, load / mean_burst), partial(bursts.uniform, 0.01, 2 * mean_burst),
+            partial(priorities.choice, (-1, 0, 0, 0, 1)))
+
+
+_SAMPLERS = {
+    "uniform": _sample_uniform,
+    "heavy_tailed": _sample_heavy_tailed,
+    "bursty": _sample_bursty,
+    "equal_priorities": _sample_equal_priorities,
+}
+
+
+def _table(n, sampler):
+    arrivals, burst, priority = sampler
+    return ProcessTable.from_sequences(range(n), array("d", islice(arrivals, n)),
+                                       array("d", (burst() for _ in range(n))),
+                                       array("d", (priority() for _ in range(n))))
+
+
+def uniform(n, seed=0, load=0.9, mean_burst=5.0):
+    """Poisson arrivals, uniform bursts in ``(0, 2 * mean_burst]``, priorities in -20..20."""
+    return _table(n, _sample_uniform(seed, load, mean_burst))
+
+
+def heavy_tailed(n, seed=0, load=0.9, mean_burst=5.0, alpha=1.5):
+    """Poisson arrivals with Pareto(``alpha``) bursts scaled to ``mean_burst``."""
+    return _table(n, _sample_heavy_tailed(seed, load, mean_burst, alpha))
+
+
+def bursty(n, seed=0, load=0.9, mean_burst=5.0, mean_cluster=50):
+    """Arrivals in clusters of about ``mean_cluster`` processes landing at once."""
+    return _table(n, _sample_bursty(seed, load, mean_burst, mean_cluster))
+
+
+def equal_priorities(n, seed=0, load=0.9, mean_burst=5.0):
+    """Like :func:`uniform` but with only three distinct priorities, so ties dominate."""
+    return _table(n, _sample_equal_priorities(seed, load, mean_burst))
+
+
+GENERATORS = {
+    "uniform": uniform,
+    "heavy_tailed": heavy_tailed,
+    "bursty": bursty,
+    "equal_priorities": equal_priorities,
+}
+
+
+def generate_records(name, n, seed=0, load=0.9, mean_burst=5.0, chunk=CHUNK, **options):
+    """Yield the ``n`` records of a ``name`` workload lazily, in arrival order.
+
+    Values are drawn ``chunk`` processes at a time, so memory stays constant
+    however large ``n`` is.  The records are the rows of the table the
+    generator of the same name makes from the same seed (``options`` are its
+    extra arguments).
+    """
+    if name not in _SAMPLERS:
+        raise ValueError(f"Unknown generator: {name!r}")
+    if chunk < 1:
+        raise ValueError("chunk must be at least 1")
+    arrivals, burst, priority = _SAMPLERS[name](seed, load, mean_burst, **options)
+    for first in range(0, n, chunk):
+        size = min(chunk, n - first)
+        times = array("d", islice(arrivals, size))
+        bursts = array("d", (burst() for _ in range(size)))
+        priorities = array("d", (priority() for _ in range(size)))
+        for k in range(size):
+            yield {"pid": first + k, "arrival": times[k], "burst": bursts[k], "priority": priorities[k]}
@@ -0,0 +1,180 @@
+"""Scheduling runs on a background thread, for interactive front ends.
+
+A :class:`SimulationJob` runs one simulation on a daemon thread so that a
+GUI event loop stays responsive, and posts its progress to a queue that the
+front end drains with :meth:`SimulationJob.poll` (from ``root.after`` in
+Tk).  Messages are tuples:
+
+``("segments", [(row, start, duration), ...])``
+    Gantt segments as soon as they are final.
+``("completed", [(row, completion), ...])``
+    Processes as they finish.
+``("done", result, cached)``
+    The finished result and the cache tier that answered (``None`` for a
+    fresh run), as :meth:`~scheduler.cache.ResultCache.schedule` returns them.
+    By then :attr:`SimulationJob.manifest` holds the run's manifest.
+``("failed", error)``
+    The run raised ``error``.
+``("cancelled",)``
+    :meth:`SimulationJob.cancel` was called before the run finished.
+
+Single-CPU FCFS, SJF, PP and RR runs without switching costs or metrics go
+through :func:`~scheduler.stream.stream_schedule`, which produces the same
+schedule event by event; those runs post segments and completions while they
+go and stop soon after a cancel.  Every other run is one engine call that
+posts only its outcome, and a cancelled one finishes in the background
+before it is dropped.
+"""
+
+import threading
+from array import array
+from queue import Empty, SimpleQueue
+from time import perf_counter
+
+from .cache import cache_key
+from .core import PREEMPTIBLE_ALGORITHMS, Result, schedule
+from .manifest import run_manifest
+from .smp import schedule_smp
+from .stream import STREAM_ALGORITHMS, stream_schedule
+from .table import ProcessTable, Timeline
+
+# Streamed runs post what they have at least this often (in seconds).
+FLUSH_INTERVAL = 0.05
+
+# Abandoned runs can still be storing their result while a new run reads the
+# cache, so every job goes through this lock to reach it.
+_cache_lock = threading.Lock()
+
+
+class SimulationJob:
+    """One scheduling run on a daemon thread; see the module docstring.
+
+    The job reads ``processes`` while it runs, so pass a table nobody else
+    modifies (:meth:`~scheduler.table.ProcessTable.copy`).  With ``cache``
+    (a :class:`~scheduler.cache.ResultCache`) single-CPU results are looked
+    up and stored there.
+    """
+
+    __slots__ = ("table", "algorithm", "preemptive", "quantum", "cores", "metrics", "switch_cost", "warmup",
+                 "cache", "messages", "manifest", "_cancelled", "_thread")
+
+    def __init__(self, processes, algorithm, preemptive=False, quantum=None, cores=1, metrics=False,
+                 switch_cost=0.0, warmup=0.0, cache=None):
+        self.table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_records(processes)
+        self.algorithm = algorithm
+        self.preemptive = preemptive
+        self.quantum = quantum
+        self.cores = cores
+        self.metrics = metrics
+        self.switch_cost = switch_cost
+        self.warmup = warmup
+        self.cache = cache
+        self.messages = SimpleQueue()
+        self.manifest = None
+        self._cancelled = False
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+
+    @property
+    def streamed(self):
+        """Whether the run posts segments and completions as it goes."""
+        return (self.cores == 1 and self.algorithm in STREAM_ALGORITHMS and not self.metrics
+                and not (self.switch_cost or self.warmup))
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancelled = True
+
+    def running(self):
+        return self._thread.is_alive()
+
+    def poll(self):
+        """Return every message posted since the last poll, oldest first."""
+        messages = []
+        while True:
+            try:
+                messages.append(self.messages.get_nowait())
+            except Empty:
+                return messages
+
+    def _run(self):
+        try:
+            options = {"queues": "per-core", "balance": "steal"} if self.cores > 1 else {}
+            if self.cores > 1:
+                message = ("done", schedule_smp(self.table, self.algorithm, self.cores, self.preemptive,
+                                                self.quantum, switch_cost=self.switch_cost,
+                                                warmup=self.warmup, **options), None)
+            else:
+                message = self._schedule()
+            if message[0] == "done":
+                self.manifest = run_manifest(message[1], self.switch_cost, self.warmup, **options)
+        except Exception as exc:
+            message = ("failed", exc)
+        self.messages.put(("cancelled",) if self._cancelled else message)
+
+    def _schedule(self):
+        key = None
+        if self.cache is not None:
+            key = cache_key(self.table, self.algorithm, self.preemptive, self.quantum, self.switch_cost,
+                            self.warmup)
+            if not self.metrics:
+                with _cache_lock:
+                    result, tier = self.cache.get(key)
+                if result is not None:
+                    return "done", result, tier
+        if self.streamed:
+            result = self._stream()
+            if result is None:
+                return ("cancelled",)
+        else:
+            result = schedule(self.table, self.algorithm, self.preemptive, self.quantum, self.metrics,
+                              switch_cost=self.switch_cost, warmup=self.warmup)
+        if key is not None:
+            with _cache_lock:
+                self.cache.put(key, result)
+        return "done", result, None
+
+    def _stream(self):
+        """Run through the streaming engine; ``None`` if cancelled."""
+        table = self.table
+        arrival, burst, priority = table.arrival, table.burst, table.priority
+        preemptive = bool(self.preemptive) and self.algorithm in PREEMPTIBLE_ALGORITHMS
+        quantum = self.quantum if self.algorithm == "RR" else None
+        # Rows stand in for the pids, so events map straight back onto the table.
+        records = ({"pid": i, "arrival": arrival[i], "burst": burst[i], "priority": priority[i]}
+                   for i in table.arrival_order())
+        order = array("l")
+        completion = array("d", bytes(8 * len(table)))
+        timeline = Timeline()
+        segments = []
+        completed = []
+        flushed = perf_counter()
+        for event in stream_schedule(records, self.algorithm, preemptive, quantum):
+            if self._cancelled:
+                return None
+            i = event["pid"]
+            if event["event"] == "segment":
+                timeline.append(i, event["start"], event["duration"])
+                segments.append((i, event["start"], event["duration"]))
+            else:
+                order.append(i)
+                completion[i] = event["completion"]
+                completed.append((i, event["completion"]))
+            if perf_counter() - flushed >= FLUSH_INTERVAL:
+                self._flush(segments, completed)
+                segments, completed = [], []
+                flushed = perf_counter()
+        self._flush(segments, completed)
+        return Result(table, self.algorithm, preemptive, quantum, order, completion, timeline)
+
+    def _flush(self, segments, completed):
+        if segments:
+            self.messages.put(("segments", segments))
+        if completed:
+            self.messages.put(("completed", completed))
@@ -0,0 +1,209 @@
+"""Run manifests: compact, replayable records of scheduling runs.
+
+A manifest is a small JSON object naming everything that decides a
+schedule, plus digests of the input and the output::
+
+    {"algorithm": "RR", "cores": 1, "engine_version": 5, "generator": null,
+     "preemptive": false, "processes": 1000, "quantum": 2.0, "schedule": "9f2c...",
+     "switch_cost": 0.0, "warmup": 0.0, "workload": "51ab..."}
+
+``workload`` digests the process records in input order, and ``schedule``
+digests the Gantt segments, switching segments and completions in the order
+the engine produced them; on more than one CPU every segment also carries
+the core it ran on, so moving work between cores changes the digest.  Two runs made the same schedule when their
+``schedule`` digests match.  Digests are kept one SHA-256 per column, so a
+:class:`~scheduler.table.ProcessTable` or :class:`~scheduler.core.Result` is
+digested a column at a time.  A stream is digested a row at a time with the
+same outcome (see :mod:`scheduler.stream`).  Workloads made by
+:mod:`scheduler.generate` can carry ``generator`` (name, ``n``, seed and
+options), which is enough to rebuild them.
+
+To replay a manifest and check that the current engines still produce the
+same schedule::
+
+    python -m scheduler.manifest run.json workload.csv
+    python -m scheduler.manifest run.json             # for generated workloads
+"""
+
+import argparse
+import hashlib
+import json
+import struct
+import sys
+from array import array
+
+from .core import ENGINE_VERSION, schedule
+from .generate import GENERATORS
+from .smp import SMPResult, schedule_smp
+from .workload import load_table
+
+
+def _float64_bytes(column):
+    values = column if isinstance(column, array) and column.typecode == "d" else array("d", column)
+    if sys.byteorder != "little":
+        values = array("d", values)
+        values.byteswap()
+    return memoryview(values).cast("B")
+
+
+class RowDigest:
+    """SHA-256 over rows of one name and ``width`` floats.
+
+    Names and each float column get their own hash, combined at the end, so
+    feeding rows with :meth:`add` and whole columns with :meth:`add_columns`
+    give the same digest.
+    """
+
+    __slots__ = ("_names", "_columns")
+
+    def __init__(self, width):
+        self._names = hashlib.sha256()
+        self._columns = [hashlib.sha256() for _ in range(width)]
+
+    def _name(self, name):
+        encoded = str(name).encode("utf-8")
+        self._names.update(struct.pack("<I", len(encoded)))
+        self._names.update(encoded)
+
+    def add(self, name, *values):
+        self._name(name)
+        for digest, value in zip(self._columns, values):
+            digest.update(struct.pack("<d", value))
+
+    def add_columns(self, names, *columns):
+        for name in names:
+            self._name(name)
+        for digest, column in zip(self._columns, columns):
+            digest.update(_float64_bytes(column))
+
+    def hexdigest(self):
+        combined = hashlib.sha256(self._names.digest())
+        for digest in self._columns:
+            combined.update(digest.digest())
+        return combined.hexdigest()
+
+
+class ScheduleDigest:
+    """Digest of a schedule: its segments, switching segments and completions.
+
+    With ``cores`` above one, segment rows take the core as a third value.
+    """
+
+    __slots__ = ("segments", "switches", "completions")
+
+    def __init__(self, cores=1):
+        width = 3 if cores > 1 else 2
+        self.segments = RowDigest(width)
+        self.switches = RowDigest(width)
+        self.completions = RowDigest(1)
+
+    def hexdigest(self):
+        combined = hashlib.sha256()
+        for digest in (self.segments, self.switches, self.completions):
+            combined.update(digest.hexdigest().encode("ascii"))
+        return combined.hexdigest()
+
+
+def workload_digest(table):
+    """Digest of a table's records in row order."""
+    digest = RowDigest(3)
+    digest.add_columns(table.pids, table.arrival, table.burst, table.priority)
+    return digest.hexdigest()
+
+
+def schedule_digest(result):
+    cores = result.cores if isinstance(result, SMPResult) else 1
+    digest = ScheduleDigest(cores)
+    pids = result.table.pids
+    timeline = result.timeline
+    digest.segments.add_columns(map(pids.__getitem__, timeline.index), timeline.start, timeline.duration,
+                                *((result.segment_core,) if cores > 1 else ()))
+    if result.overhead is not None:
+        overhead = result.overhead
+        digest.switches.add_columns(map(pids.__getitem__, overhead.index), overhead.start, overhead.duration,
+                                    *((result.overhead_core,) if cores > 1 else ()))
+    order = result.order
+    digest.completions.add_columns(map(pids.__getitem__, order), map(result.completion.__getitem__, order))
+    return digest.hexdigest()
+
+
+def manifest(algorithm, preemptive, quantum, processes, workload, schedule=None, cores=1, switch_cost=0.0,
+             warmup=0.0, generator=None, **options):
+    """Build a manifest; ``options`` holds extra engine settings (multi-CPU queues and balancing)."""
+    return dict(options, engine_version=ENGINE_VERSION, algorithm=algorithm, preemptive=bool(preemptive),
+                quantum=quantum, cores=cores, switch_cost=float(switch_cost), warmup=float(warmup),
+                processes=processes, workload=workload, schedule=schedule, generator=generator)
+
+
+def run_manifest(result, switch_cost=0.0, warmup=0.0, generator=None, digest=True, **options):
+    """Manifest of a finished run.
+
+    A result does not record its switching costs or multi-CPU options, so
+    pass them as they were given to the engine.  ``digest=False`` skips the
+    schedule digest, which costs a pass over every segment.
+    """
+    return manifest(result.algorithm, result.preemptive, result.quantum, len(result.table),
+                    workload_digest(result.table), schedule_digest(result) if digest else None,
+                    result.cores if isinstance(result, SMPResult) else 1, switch_cost, warmup, generator,
+                    **options)
+
+
+def dumps(run):
+    """The compact one-line JSON form of a manifest."""
+    return json.dumps(run, sort_keys=True, separators=(",", ":"))
+
+
+def write_manifest(run, path):
+    with open(path, "w") as handle:
+        handle.write(dumps(run) + "\n")
+
+
+def replay(run, table=None):
+    """Rerun the manifest ``run`` and return the fresh run's manifest.
+
+    ``table`` is the workload; generated workloads are rebuilt from the
+    manifest's ``generator`` when it is omitted.
+    """
+    if table is None:
+        generator = run.get("generator")
+        if not generator:
+            raise ValueError("The manifest does not say how to generate its workload; pass the workload")
+        options = {key: value for key, value in generator.items() if key not in ("name", "n")}
+        table = GENERATORS[generator["name"]](generator["n"], **options)
+    costs = {"switch_cost": run["switch_cost"], "warmup": run["warmup"]}
+    if run["cores"] > 1:
+        options = {key: run[key] for key in ("queues", "balance", "interval") if key in run}
+        result = schedule_smp(table, run["algorithm"], run["cores"], run["preemptive"], run["quantum"],
+                              **options, **costs)
+    else:
+        options = {}
+        result = schedule(table, run["algorithm"], run["preemptive"], run["quantum"], **costs)
+    return run_manifest(result, generator=run.get("generator"), **options, **costs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a run manifest and check that it reproduces.")
+    parser.add_argument("manifest", help="manifest JSON file")
+    parser.add_argument("workload", nargs="?", help="CSV or JSONL workload (omit for generated workloads)")
+    args = parser.parse_args(argv)
+
+    with open(args.manifest) as handle:
+        run = json.load(handle)
+    if run.get("engine_version") != ENGINE_VERSION:
+        print(f"Note: recorded with engine version {run.get('engine_version')}, replaying with {ENGINE_VERSION}")
+    fresh = replay(run, load_table(args.workload) if args.workload else None)
+    if fresh["workload"] != run["workload"]:
+        print("Workload differs from the one in the manifest")
+        return 1
+    if run.get("schedule") is None:
+        print(f"Replayed; the manifest has no schedule digest to compare (now {fresh['schedule']})")
+        return 0
+    if fresh["schedule"] != run["schedule"]:
+        print("Schedule differs: the engines no longer reproduce this run")
+        return 1
+    print("Schedule reproduced exactly")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
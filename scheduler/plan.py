@@ -0,0 +1,365 @@
+"""What-if capacity planning against a waiting-time objective.
+
+Given a synthetic workload (a generator from :mod:`scheduler.generate`, an
+arrival rate and a mean burst size), the planner looks for the cheapest
+configuration whose p99 waiting time stays at or under a target:
+
+``cores``
+    The fewest CPUs, found by doubling from one CPU and then bisecting.
+``quantum``
+    The largest Round Robin quantum (the fewest context switches), found
+    by bisection between two bounds.
+``policy``
+    The policy with the fewest context switches, ties going to the lower
+    p99 waiting time.
+
+Every trial regenerates the workload lazily with
+:func:`~scheduler.generate.generate_records` and simulates it as a stream,
+so no trial holds the whole workload.  The objective allows at most
+``n - ceil(0.99 * n)`` processes over the target, so a trial stops as soon
+as one more process has waited too long: the objective can no longer be
+met.  Policy trials also stop once they have switched more often than the
+best policy so far.
+
+Bisection assumes that a CPU count that misses the objective is not
+rescued by taking CPUs away, and that the quanta meeting it form one range
+reaching ``low`` or ``high``: small quanta suit heavy-tailed bursts and
+large ones suit uniform bursts.  When a workload breaks that assumption the
+answer still meets the objective but may not be the cheapest.
+
+Single-CPU trials run on :func:`~scheduler.stream.stream_schedule`.
+Multi-CPU trials stream through one queue shared by all CPUs, with the
+same results as :func:`~scheduler.smp.schedule_smp` with ``queues="global"``;
+they cover FCFS, SJF and PP without preemption and Round Robin.
+
+    python -m scheduler.plan --search cores --algorithm SJF --rate 1.5 --target 20
+    python -m scheduler.plan --search quantum --quanta 0.5 16 --generator heavy_tailed --rate 0.1 --target 50
+    python -m scheduler.plan --search policy --quantum 2 --generator heavy_tailed --rate 0.1 --target 50
+"""
+
+import argparse
+import sys
+from collections import deque
+from heapq import heappop, heappush
+from math import ceil
+from time import perf_counter
+
+from .core import PREEMPTIBLE_ALGORITHMS
+from .engine import EPSILON, INF
+from .generate import CHUNK, GENERATORS, generate_records
+from .stats import QuantileSketch
+from .stream import STREAM_ALGORITHMS, _Arrivals, _completed, _segment, stream_schedule
+
+QUANTILE = 0.99
+
+# Policies compared by a policy search, as (algorithm, preemptive).
+POLICIES = (("FCFS", False), ("SJF", False), ("PP", False), ("SJF", True), ("PP", True), ("RR", True))
+
+
+class Workload:
+    """A generated workload that every trial regenerates from its seed."""
+
+    __slots__ = ("name", "n", "seed", "chunk", "options")
+
+    def __init__(self, name, n, seed=0, chunk=CHUNK, **options):
+        if name not in GENERATORS:
+            raise ValueError(f"Unknown generator: {name!r}")
+        if n < 1:
+            raise ValueError("A workload needs at least one process")
+        self.name = name
+        self.n = n
+        self.seed = seed
+        self.chunk = chunk
+        self.options = options
+
+    def records(self):
+        return generate_records(self.name, self.n, self.seed, chunk=self.chunk, **self.options)
+
+
+def _stream_shared(arrivals, key, quantum, cores):
+    # schedule_smp needs the whole table in memory and only returns once every
+    # process has run, and stream_schedule drives a single CPU, so neither
+    # can run a multi-CPU trial that streams and stops early.  This is the
+    # streaming form of schedule_smp's global queue, and must give the same
+    # waiting times as it (and, on one CPU, as schedule()).
+    #
+    # One queue for all CPUs: arrival order for FCFS and RR, a heap of
+    # (key, seq, slot) for SJF and PP.  ``free`` holds (time, rank, core,
+    # slot) for every CPU that is not retired, with the slot whose quantum
+    # ends then.  At one instant CPUs pick in schedule_smp's order: those
+    # whose quantum ended (rank 0), then those that just completed a process
+    # (rank 1), then those that were asleep (rank 2).  A CPU that finds the
+    # queue empty sleeps until the next arrival, and retires once nothing is
+    # left to arrive; a process put back after its quantum is picked up again
+    # by the CPU that ran it, so no runnable process ever waits for a retired
+    # CPU.
+    ready = deque() if key is None else []
+    free = [(0.0, 2, core, None) for core in range(cores)]
+
+    while free:
+        time_elapsed, _, core, slot = heappop(free)
+        while arrivals.next_arrival <= time_elapsed + EPSILON:
+            seq = arrivals.seq
+            record = arrivals.pop()
+            if key is None:
+                ready.append([record, record["burst"]])
+            else:
+                heappush(ready, (record[key], seq, [record, record["burst"]]))
+        if slot is not None:
+            ready.append(slot)
+        if not ready:
+            if arrivals.next_arrival != INF:
+                heappush(free, (arrivals.next_arrival, 2, core, None))
+            continue
+
+        slot = ready.popleft() if key is None else heappop(ready)[2]
+        record = slot[0]
+        duration = slot[1] if quantum is None else min(quantum, slot[1])
+        event = _segment(record, time_elapsed, duration)
+        event["core"] = core
+        yield event
+        slot[1] -= duration
+        end = time_elapsed + duration
+        if slot[1] > EPSILON:
+            heappush(free, (end, 0, core, slot))
+        else:
+            yield _completed(record, end)
+            heappush(free, (end, 1, core, None))
+
+
+def _events(records, algorithm, preemptive, quantum, cores):
+    if cores == 1:
+        return stream_schedule(records, algorithm, preemptive, quantum)
+    if algorithm not in STREAM_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm for planning: {algorithm!r}")
+    if preemptive and algorithm in PREEMPTIBLE_ALGORITHMS:
+        raise ValueError("Preemptive SJF and PP can only be planned on one CPU")
+    if algorithm == "RR" and (quantum is None or quantum <= 0):
+        raise ValueError("Round Robin needs a positive quantum")
+    key = {"SJF": "burst", "PP": "priority"}.get(algorithm)
+    return _stream_shared(_Arrivals(records), key, quantum if algorithm == "RR" else None, cores)
+
+
+class Trial:
+    """Outcome of simulating one configuration against the objective.
+
+    ``outcome`` is ``"met"``, ``"missed"`` (stopped once too many processes
+    had waited longer than the target) or ``"pruned"`` (stopped once it had
+    switched more often than a cheaper configuration).  ``completed`` counts
+    the processes simulated before it stopped, and ``waiting`` is the
+    waiting time quantile over them, from a
+    :class:`~scheduler.stats.QuantileSketch`.  Whether the objective was met
+    is decided by exact counts, not by the sketch.
+    """
+
+    __slots__ = ("algorithm", "preemptive", "quantum", "cores", "outcome", "completed", "late", "switches",
+                 "waiting", "seconds")
+
+    def __init__(self, algorithm, preemptive, quantum, cores):
+        self.algorithm = algorithm
+        self.preemptive = preemptive
+        self.quantum = quantum
+        self.cores = cores
+        self.outcome = "met"
+        self.completed = 0
+        self.late = 0
+        self.switches = 0
+        self.waiting = 0.0
+        self.seconds = 0.0
+
+    @property
+    def met(self):
+        return self.outcome == "met"
+
+    def label(self):
+        name = f"preemptive {self.algorithm}" if self.preemptive else self.algorithm
+        if self.quantum is not None:
+            name += f" (quantum {self.quantum:g})"
+        return f"{name} on {self.cores} CPU{'s' if self.cores > 1 else ''}"
+
+    def describe(self, quantile=QUANTILE):
+        if self.met:
+            outcome = f"met, p{quantile * 100:g} waiting {self.waiting:.2f}, {self.switches} switches"
+        elif self.outcome == "missed":
+            outcome = f"missed after {self.completed} processes ({self.late} over the target)"
+        else:
+            outcome = f"pruned after {self.completed} processes ({self.switches} switches)"
+        return f"{self.label()}: {outcome} [{self.seconds:.2f}s]"
+
+
+def trial(workload, target, algorithm, preemptive=False, quantum=None, cores=1, quantile=QUANTILE,
+          max_switches=None):
+    """Simulate one configuration until it meets or clearly misses the objective.
+
+    The objective is a ``quantile`` waiting time of at most ``target``.
+    With ``max_switches`` the trial is also abandoned once it has switched
+    processes more often than that.
+    """
+    if cores < 1:
+        raise ValueError("cores must be at least 1")
+    if not 0 < quantile < 1:
+        raise ValueError("quantile must be between 0 and 1")
+    preemptive = bool(preemptive) and algorithm in PREEMPTIBLE_ALGORITHMS
+    quantum = quantum if algorithm == "RR" else None
+    result = Trial(algorithm, preemptive, quantum, cores)
+    # The quantile stays within the target while at most this many are late.
+    allowed = workload.n - ceil(quantile * workload.n)
+    waiting = QuantileSketch()
+    last = [None] * cores
+    started = perf_counter()
+    for event in _events(workload.records(), algorithm, preemptive, quantum, cores):
+        if event["event"] == "segment":
+            core = event.get("core", 0)
+            if event["pid"] != last[core]:
+                last[core] = event["pid"]
+                result.switches += 1
+                if max_switches is not None and result.switches > max_switches:
+                    result.outcome = "pruned"
+                    break
+            continue
+        waiting.add(event["waiting"])
+        if event["waiting"] > target + EPSILON:
+            result.late += 1
+            if result.late > allowed:
+                result.outcome = "missed"
+                break
+    result.completed = waiting.count
+    result.waiting = waiting.quantile(quantile)
+    result.seconds = perf_counter() - started
+    return result
+
+
+def search_cores(workload, target, algorithm, preemptive=False, quantum=None, max_cores=64,
+                 quantile=QUANTILE):
+    """Fewest CPUs, up to ``max_cores``, that meet the objective.
+
+    Returns ``(cheapest trial or None, every trial in the order run)``.
+    """
+    if max_cores < 1:
+        raise ValueError("max_cores must be at least 1")
+    if max_cores > 1 and preemptive and algorithm in PREEMPTIBLE_ALGORITHMS:
+        raise ValueError("Preemptive SJF and PP can only be planned on one CPU")
+    trials = []
+
+    def run(cores):
+        trials.append(trial(workload, target, algorithm, preemptive, quantum, cores, quantile))
+        return trials[-1]
+
+    missed = 0
+    cores = 1
+    while True:
+        best = run(cores)
+        if best.met:
+            break
+        missed = cores
+        if cores == max_cores:
+            return None, trials
+        cores = min(2 * cores, max_cores)
+    while best.cores - missed > 1:
+        attempt = run((missed + best.cores) // 2)
+        if attempt.met:
+            best = attempt
+        else:
+            missed = attempt.cores
+    return best, trials
+
+
+def search_quantum(workload, target, low, high, cores=1, resolution=None, quantile=QUANTILE):
+    """Largest Round Robin quantum in ``[low, high]`` that meets the objective.
+
+    Bisection stops when the bracket is narrower than ``resolution``
+    (a hundredth of the range by default).  Returns ``(cheapest trial or
+    None, every trial in the order run)``.
+    """
+    if not 0 < low <= high:
+        raise ValueError("The quantum range must be positive and in order")
+    resolution = resolution or (high - low) / 100
+    trials = []
+
+    def run(quantum):
+        trials.append(trial(workload, target, "RR", True, quantum, cores, quantile))
+        return trials[-1]
+
+    if run(high).met:
+        return trials[-1], trials
+    best = run(low)
+    if not best.met:
+        return None, trials
+    while high - best.quantum > resolution:
+        attempt = run((best.quantum + high) / 2)
+        if attempt.met:
+            best = attempt
+        else:
+            high = attempt.quantum
+    return best, trials
+
+
+def search_policy(workload, target, quantum=None, cores=1, policies=POLICIES, quantile=QUANTILE):
+    """Policy with the fewest context switches that meets the objective.
+
+    Round Robin is skipped without a ``quantum``, and preemptive policies
+    on more than one CPU.  Returns ``(cheapest trial or None, every trial in
+    the order run)``.
+    """
+    best = None
+    trials = []
+    for algorithm, preemptive in policies:
+        if (algorithm == "RR" and quantum is None) or (cores > 1 and preemptive and algorithm != "RR"):
+            continue
+        attempt = trial(workload, target, algorithm, preemptive, quantum, cores, quantile,
+                        best.switches if best is not None else None)
+        trials.append(attempt)
+        if attempt.met and (best is None or (attempt.switches, attempt.waiting) < (best.switches, best.waiting)):
+            best = attempt
+    return best, trials
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find the cheapest configuration that meets a waiting-time target.")
+    parser.add_argument("--search", choices=["cores", "quantum", "policy"], default="cores")
+    parser.add_argument("--target", type=float, required=True, help="largest acceptable p99 waiting time")
+    parser.add_argument("--quantile", type=float, default=QUANTILE, help="waiting time quantile to bound")
+    parser.add_argument("--generator", choices=sorted(GENERATORS), default="uniform")
+    parser.add_argument("--processes", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rate", type=float, default=0.18, help="arrivals per time unit")
+    parser.add_argument("--mean-burst", type=float, default=5.0)
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="processes generated at a time")
+    parser.add_argument("--algorithm", choices=STREAM_ALGORITHMS, default="FCFS",
+                        help="policy for a cores search")
+    parser.add_argument("--preemptive", action="store_true", help="preemptive SJF/PP (one CPU only)")
+    parser.add_argument("--quantum", type=float, help="Round Robin quantum")
+    parser.add_argument("--cores", type=int, default=1, help="CPUs for quantum and policy searches")
+    parser.add_argument("--max-cores", type=int, default=64)
+    parser.add_argument("--quanta", type=float, nargs=2, default=(0.5, 20.0), metavar=("LOW", "HIGH"),
+                        help="quantum range for a quantum search")
+    parser.add_argument("--resolution", type=float, help="stop a quantum search once the range is this narrow")
+    args = parser.parse_args(argv)
+    if args.rate <= 0 or args.mean_burst <= 0:
+        parser.error("--rate and --mean-burst must be positive")
+
+    workload = Workload(args.generator, args.processes, args.seed, args.chunk,
+                        load=args.rate * args.mean_burst, mean_burst=args.mean_burst)
+    try:
+        if args.search == "cores":
+            best, trials = search_cores(workload, args.target, args.algorithm, args.preemptive, args.quantum,
+                                        args.max_cores, args.quantile)
+        elif args.search == "quantum":
+            best, trials = search_quantum(workload, args.target, *args.quanta, args.cores, args.resolution,
+                                          args.quantile)
+        else:
+            best, trials = search_policy(workload, args.target, args.quantum, args.cores, quantile=args.quantile)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    for attempt in trials:
+        print(attempt.describe(args.quantile))
+    if best is None:
+        print(f"No configuration keeps p{args.quantile * 100:g} waiting time under {args.target:g}")
+        return 1
+    print(f"Cheapest: {best.label()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
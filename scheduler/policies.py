@@ -0,0 +1,389 @@
+"""Event-driven engines for the MLFQ, CFS, HRRN and aging schedulers.
+
+Like :mod:`scheduler.engine`, every engine here jumps straight from one
+scheduling decision to the next (an arrival, a completion or the end of a
+slice), never ticks through idle time, and keeps its ready set in a heap or
+in a handful of deques.  They take a :class:`ProcessTable`, leave it
+unmodified and return ``(order, completion, timeline)``; ``probe`` is an
+optional :class:`~scheduler.probe.Metrics`.
+
+Ties are broken by arrival order, with processes that were preempted or used
+up a slice queued behind everything that was already waiting.
+"""
+
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+from math import ceil
+from time import perf_counter
+
+from .engine import EPSILON, INF, PRECISION
+from .table import Timeline
+
+# Number of MLFQ levels.  Level k runs slices of quantum * 2**k; the last
+# level is plain Round Robin.
+MLFQ_LEVELS = 3
+
+# CFS weights follow the kernel's nice table: every nice level (here, every
+# priority step) is worth about 1.25 times the CPU share of the next.
+NICE_RATIO = 1.25
+
+
+def simulate_mlfq(table, quantum, probe=None, levels=MLFQ_LEVELS):
+    """Multilevel feedback queue.
+
+    New processes enter the top level.  A process that uses up its slice on
+    a level moves one level down, and a newcomer preempts any process running
+    below the top level.  A preempted process keeps what it has used of its
+    slice and resumes at the head of its level.
+    """
+    arrival = table.arrival
+    order = table.arrival_order()
+    n = len(order)
+    slices = [quantum * 2 ** k for k in range(levels)]
+    bottom = levels - 1
+    queues = [deque() for _ in range(levels)]
+    level = bytearray(n)
+    used = array("d", bytes(8 * n))
+    left = array("d", table.burst)
+    completion = array("d", bytes(8 * n))
+    finished = array("l")
+    timeline = Timeline()
+    waiting = 0
+    cursor = 0
+    time_elapsed = 0.0
+    current = -1
+    started = 0.0
+
+    while True:
+        if current < 0:
+            if not waiting:
+                if cursor == n:
+                    break
+                if arrival[order[cursor]] > time_elapsed + EPSILON:
+                    time_elapsed = arrival[order[cursor]]
+            while cursor < n and arrival[order[cursor]] <= time_elapsed + EPSILON:
+                queues[0].append(order[cursor])
+                waiting += 1
+                cursor += 1
+            if probe is not None:
+                selecting = perf_counter()
+            current = next(queue for queue in queues if queue).popleft()
+            if probe is not None:
+                probe.selected(waiting, perf_counter() - selecting)
+            waiting -= 1
+            started = time_elapsed
+
+        k = level[current]
+        if k == bottom and not waiting:
+            # Alone on the last level it would just be picked again after
+            # every slice, so only an arrival or completion can stop it.
+            run = left[current]
+        else:
+            run = min(left[current], slices[k] - used[current])
+        next_arrival = arrival[order[cursor]] if cursor < n else INF
+
+        if k and next_arrival < time_elapsed + run - EPSILON:
+            elapsed = next_arrival - time_elapsed
+            left[current] = round(left[current] - elapsed, PRECISION)
+            used[current] += elapsed
+            if k == bottom:
+                used[current] %= slices[k]
+                if slices[k] - used[current] < EPSILON:
+                    used[current] = 0.0
+            time_elapsed = next_arrival
+            timeline.append(current, started, time_elapsed - started)
+            queues[k].appendleft(current)
+            waiting += 1
+            current = -1
+            continue
+
+        time_elapsed = round(time_elapsed + run, PRECISION)
+        left[current] -= run
+        if left[current] < EPSILON:
+            left[current] = 0.0
+            timeline.append(current, started, time_elapsed - started)
+            completion[current] = time_elapsed
+            finished.append(current)
+            current = -1
+            continue
+
+        while cursor < n and arrival[order[cursor]] <= time_elapsed + EPSILON:
+            queues[0].append(order[cursor])
+            waiting += 1
+            cursor += 1
+        k = level[current] = min(k + 1, bottom)
+        used[current] = 0.0
+        if any(queues[j] for j in range(k + 1)):
+            timeline.append(current, started, time_elapsed - started)
+            queues[k].append(current)
+            waiting += 1
+            current = -1
+
+    return finished, completion, timeline
+
+
+def simulate_cfs(table, quantum, probe=None):
+    """Completely-fair-style scheduling on virtual runtime.
+
+    Each process's virtual runtime grows by ``NICE_RATIO ** priority`` per
+    unit of CPU time, so lower (nicer) priorities get a larger share.  The
+    process with the least virtual runtime runs for at least ``quantum``
+    before the next decision, and a newcomer starts at the smallest virtual
+    runtime in the system, so it is neither starved nor owed past CPU time.
+    """
+    arrival, priority = table.arrival, table.priority
+    order = table.arrival_order()
+    n = len(order)
+    left = array("d", table.burst)
+    vruntime = array("d", bytes(8 * n))
+    completion = array("d", bytes(8 * n))
+    finished = array("l")
+    timeline = Timeline()
+    ready = []
+    cursor = 0
+    seq = n
+    time_elapsed = 0.0
+    min_vruntime = 0.0
+    current = -1
+    started = 0.0
+
+    while True:
+        if current < 0:
+            if not ready:
+                if cursor == n:
+                    break
+                if arrival[order[cursor]] > time_elapsed + EPSILON:
+                    time_elapsed = arrival[order[cursor]]
+            while cursor < n and arrival[order[cursor]] <= time_elapsed + EPSILON:
+                i = order[cursor]
+                vruntime[i] = min_vruntime
+                heappush(ready, (min_vruntime, cursor, i))
+                cursor += 1
+            if probe is None:
+                _, _, current = heappop(ready)
+            else:
+                selecting = perf_counter()
+                _, _, current = heappop(ready)
+                probe.selected(len(ready) + 1, perf_counter() - selecting)
+            started = time_elapsed
+
+        # Run whole slices until the next decision that could change the
+        # choice: the current process overtaking the leftmost waiting one,
+        # an arrival being admitted at a slice boundary, or completion.
+        rate = NICE_RATIO ** priority[current]
+        slices = ceil(left[current] / quantum - EPSILON)
+        if ready:
+            lead = ready[0][0] - vruntime[current]
+            slices = min(slices, max(1, ceil((lead - EPSILON) / (quantum * rate))))
+        if cursor < n:
+            slices = min(slices, max(1, ceil((arrival[order[cursor]] - time_elapsed) / quantum - EPSILON)))
+        run = min(slices * quantum, left[current])
+        time_elapsed = round(time_elapsed + run, PRECISION)
+        left[current] -= run
+        vruntime[current] += run * rate
+        min_vruntime = max(min_vruntime, min(vruntime[current], ready[0][0]) if ready else vruntime[current])
+        if left[current] < EPSILON:
+            left[current] = 0.0
+            timeline.append(current, started, time_elapsed - started)
+            completion[current] = time_elapsed
+            finished.append(current)
+            current = -1
+            continue
+
+        while cursor < n and arrival[order[cursor]] <= time_elapsed + EPSILON:
+            i = order[cursor]
+            vruntime[i] = min_vruntime
+            heappush(ready, (min_vruntime, cursor, i))
+            cursor += 1
+        if ready and ready[0][0] <= vruntime[current] + EPSILON:
+            timeline.append(current, started, time_elapsed - started)
+            heappush(ready, (vruntime[current], seq, current))
+            seq += 1
+            current = -1
+
+    return finished, completion, timeline
+
+
+def simulate_hrrn(table, probe=None):
+    """Highest response ratio next (non-preemptive).
+
+    The response ratio ``(waiting + burst) / burst`` keeps changing while
+    processes wait, so the ready set cannot be a plain heap.  Waiting
+    processes are grouped by burst length instead; within a group the
+    earliest arrival always has the highest ratio.  The groups are the leaves
+    of a kinetic tournament tree ordered by length: every node keeps the
+    winner among its leaves and the time at which that winner will next be
+    overtaken (a shorter burst's ratio grows faster, so two groups swap at
+    most once).  Advancing the clock only revisits nodes whose winner has
+    changed.  Ties go to the shorter burst, then to the earlier arrival.
+    """
+    arrival, burst = table.arrival, table.burst
+    order = table.arrival_order()
+    n = len(order)
+    lengths = sorted(set(burst))
+    leaf = {length: k for k, length in enumerate(lengths)}
+    size = 1 << max(len(lengths) - 1, 0).bit_length()
+    groups = [deque() for _ in lengths]
+    head = [0.0] * len(lengths)
+    winner = [-1] * (2 * size)
+    change = [INF] * (2 * size)
+    completion = array("d", bytes(n * 8))
+    finished = array("l")
+    timeline = Timeline()
+    waiting = 0
+    cursor = 0
+    time_elapsed = 0.0
+
+    def play(v, now):
+        # Children cover disjoint length ranges, the left one the shorter.
+        left, right = winner[2 * v], winner[2 * v + 1]
+        soonest = change[2 * v] if change[2 * v] < change[2 * v + 1] else change[2 * v + 1]
+        change[v] = soonest
+        if left < 0:
+            winner[v] = right
+            return
+        winner[v] = left
+        if right >= 0:
+            short, long = lengths[left], lengths[right]
+            if short and (now - head[left]) * long < (now - head[right]) * short:
+                overtaken = (head[left] * long - head[right] * short) / (long - short)
+                if overtaken > now:
+                    winner[v] = right
+                    if overtaken < soonest:
+                        change[v] = overtaken
+
+    def advance(now):
+        if change[1] > now:
+            return
+        stale = []
+        stack = [1]
+        while stack:
+            v = stack.pop()
+            stale.append(v)
+            for child in (2 * v, 2 * v + 1):
+                if child < size and change[child] <= now:
+                    stack.append(child)
+        for v in reversed(stale):
+            play(v, now)
+
+    def update(k, now):
+        v = k + size
+        winner[v] = k if groups[k] else -1
+        if groups[k]:
+            head[k] = arrival[groups[k][0]]
+        v >>= 1
+        while v:
+            before = winner[v], change[v]
+            play(v, now)
+            if (winner[v], change[v]) == before and before[0] != k:
+                break
+            v >>= 1
+
+    while cursor < n or waiting:
+        if not waiting and arrival[order[cursor]] > time_elapsed + EPSILON:
+            time_elapsed = arrival[order[cursor]]
+        advance(time_elapsed)
+        while cursor < n and arrival[order[cursor]] <= time_elapsed + EPSILON:
+            i = order[cursor]
+            k = leaf[burst[i]]
+            groups[k].append(i)
+            if len(groups[k]) == 1:
+                update(k, time_elapsed)
+            waiting += 1
+            cursor += 1
+
+        if probe is not None:
+            selecting = perf_counter()
+        k = winner[1]
+        i = groups[k].popleft()
+        update(k, time_elapsed)
+        if probe is not None:
+            probe.selected(waiting, perf_counter() - selecting)
+        waiting -= 1
+
+        timeline.append(i, time_elapsed, burst[i])
+        time_elapsed += burst[i]
+        completion[i] = time_elapsed
+        finished.append(i)
+    return finished, completion, timeline
+
+
+def simulate_aging(table, interval, preemptive=False, probe=None):
+    """Priority scheduling with aging.
+
+    A waiting process gains one priority level (its value drops by one) for
+    every ``interval`` time units it waits.  Since all waiting processes age
+    at the same rate, the heap is keyed on ``priority * interval + enqueued``
+    and never needs reordering: the effective priority at time ``t`` is that
+    key minus ``t``, divided by ``interval``.  Keys are rounded to
+    ``PRECISION`` decimals, so equal effective priorities tie exactly and go
+    to the earlier arrival.  A running process keeps the effective priority
+    it was dispatched with.  When ``preemptive`` is set, each
+    arrival lets the best waiting process preempt a strictly worse running
+    one, as in preemptive priority scheduling.
+    """
+    arrival, burst, priority = table.arrival, table.burst, table.priority
+    order = table.arrival_order()
+    n = len(order)
+    left = array("d", burst)
+    completion = array("d", bytes(8 * n))
+    finished = array("l")
+    timeline = Timeline()
+    ready = []
+    cursor = 0
+    seq = n
+    time_elapsed = 0.0
+    current = -1
+    effective = 0.0
+    started = 0.0
+
+    while True:
+        if current < 0:
+            if not ready:
+                if cursor == n:
+                    break
+                if arrival[order[cursor]] > time_elapsed + EPSILON:
+                    time_elapsed = arrival[order[cursor]]
+            while cursor < n and arrival[order[cursor]] <= time_elapsed + EPSILON:
+                i = order[cursor]
+                heappush(ready, (round(priority[i] * interval + arrival[i], PRECISION), cursor, i))
+                cursor += 1
+            if probe is not None:
+                selecting = perf_counter()
+            key, _, current = heappop(ready)
+            if probe is not None:
+                probe.selected(len(ready) + 1, perf_counter() - selecting)
+            effective = key - time_elapsed
+            started = time_elapsed
+
+        next_arrival = arrival[order[cursor]] if cursor < n and preemptive else INF
+        remaining = left[current] - (next_arrival - time_elapsed)
+        if remaining < EPSILON:
+            if preemptive:
+                time_elapsed = round(time_elapsed + left[current], PRECISION)
+            else:
+                time_elapsed += left[current]
+            left[current] = 0.0
+            timeline.append(current, started, time_elapsed - started)
+            completion[current] = time_elapsed
+            finished.append(current)
+            current = -1
+            continue
+
+        left[current] = remaining
+        time_elapsed = next_arrival
+        while cursor < n and arrival[order[cursor]] <= time_elapsed + EPSILON:
+            i = order[cursor]
+            heappush(ready, (round(priority[i] * interval + arrival[i], PRECISION), cursor, i))
+            cursor += 1
+        # Keys grow with the clock, so the tolerance grows with them.
+        running = round(effective + time_elapsed, PRECISION)
+        if ready[0][0] < running - EPSILON * max(1.0, abs(running)):
+            left[current] = round(remaining, PRECISION)
+            timeline.append(current, started, time_elapsed - started)
+            heappush(ready, (running, seq, current))
+            seq += 1
+            current = -1
+
+    return finished, completion, timeline
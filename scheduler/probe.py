@@ -0,0 +1,113 @@
+"""Optional run metrics and profiling hooks for the scheduling engines.
+
+Passing a :class:`Metrics` object as ``probe`` to an engine makes it sample
+the ready-set length and time every ready-set selection.  Without a probe
+the engines only pay one ``is None`` test per dispatch.  Dispatch,
+preemption and context-switch counts are recovered from the timeline after
+the run, so they cost nothing inside the loop.
+"""
+
+from itertools import islice
+from operator import ne
+
+PROFILERS = ("cprofile", "tracemalloc")
+
+
+class Metrics:
+    """Counters and timers collected during one scheduling run."""
+
+    __slots__ = ("dispatches", "preemptions", "context_switches", "completions", "selections",
+                 "ready_histogram", "selection_time", "simulation_time", "formatting_time", "profile")
+
+    def __init__(self):
+        self.dispatches = 0
+        self.preemptions = 0
+        self.context_switches = 0
+        self.completions = 0
+        self.selections = 0
+        # ready_histogram[k] counts selections made while 2**(k-1) <= len(ready) < 2**k
+        # (bucket 0 is an empty ready set).
+        self.ready_histogram = []
+        self.selection_time = 0.0
+        self.simulation_time = 0.0
+        self.formatting_time = 0.0
+        self.profile = None
+
+    def selected(self, ready, seconds, times=1):
+        """Record ``times`` selections from a ready set of length ``ready``."""
+        self.selections += times
+        self.selection_time += seconds
+        bucket = ready.bit_length()
+        histogram = self.ready_histogram
+        if bucket >= len(histogram):
+            histogram.extend([0] * (bucket + 1 - len(histogram)))
+        histogram[bucket] += times
+
+    def finish(self, order, timeline):
+        """Derive the dispatch counters from a finished run."""
+        index = timeline.index
+        self.dispatches = len(index)
+        self.completions = len(order)
+        self.preemptions = self.dispatches - self.completions
+        self.context_switches = sum(map(ne, index, islice(index, 1, None)))
+
+    def histogram(self):
+        """Yield ``(label, count)`` for every non-empty ready-length bucket."""
+        for bucket, count in enumerate(self.ready_histogram):
+            if count:
+                low, high = (0, 0) if bucket == 0 else (1 << (bucket - 1), (1 << bucket) - 1)
+                yield (str(low) if low == high else f"{low}-{high}"), count
+
+    def report(self):
+        """Return the metrics as lines of text."""
+        lines = [
+            f"Dispatches: {self.dispatches}",
+            f"Preemptions: {self.preemptions}",
+            f"Context switches: {self.context_switches}",
+            f"Completions: {self.completions}",
+            f"Simulation time: {self.simulation_time * 1000:.3f} ms",
+            f"Selection time: {self.selection_time * 1000:.3f} ms over {self.selections} selections",
+            f"Formatting time: {self.formatting_time * 1000:.3f} ms",
+        ]
+        if self.ready_histogram:
+            lines.append("Ready-set length at selection:")
+            lines.extend(f"  {label:>15}: {count}" for label, count in self.histogram())
+        if self.profile:
+            lines.append(self.profile)
+        return lines
+
+
+def profiled(function, profiler):
+    """Call ``function()`` under ``"cprofile"`` or ``"tracemalloc"``.
+
+    Returns ``(value, report)`` where ``report`` is the profiler's text
+    report: the 25 most expensive calls by cumulative time, or the peak
+    traced memory and the 25 largest allocation sites.
+    """
+    # The profilers are imported here: pstats alone would double the package's import time.
+    if profiler == "cprofile":
+        import cProfile
+        import io
+        import pstats
+        profile = cProfile.Profile()
+        value = profile.runcall(function)
+        out = io.StringIO()
+        pstats.Stats(profile, stream=out).sort_stats("cumulative").print_stats(25)
+        return value, out.getvalue().rstrip()
+    if profiler == "tracemalloc":
+        import tracemalloc
+        already = tracemalloc.is_tracing()
+        if not already:
+            tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            value = function()
+            peak = tracemalloc.get_traced_memory()[1]
+            top = tracemalloc.take_snapshot().statistics("lineno")[:25]
+        finally:
+            if not already:
+                tracemalloc.stop()
+        lines = [f"Peak traced memory: {peak / 1024:.1f} KiB"]
+        lines.extend(str(stat) for stat in top)
+        return value, "\n".join(lines)
+    raise ValueError(f"Unknown profiler: {profiler!r}")
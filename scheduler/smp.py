@@ -0,0 +1,485 @@
+"""Multi-CPU (SMP) scheduling.
+
+The machine has ``cores`` identical CPUs.  Ready processes wait either in one
+run queue per core (``queues="per-core"``) or in a single shared queue
+(``queues="global"``).  Per-core queues are kept level by work stealing (an
+idle core takes the best waiting process from the longest queue) or by
+periodic load balancing.  A process may be pinned to one core, in which case
+it only ever waits in and runs on that core.
+
+Every queue is a heap of ``(key, seq, row)`` entries ordered the same way the
+single-CPU engines order their ready sets, so a one-core run reproduces
+:func:`~scheduler.core.schedule`: the same segments in the same order, with
+times equal to within float rounding.  The least-loaded core, the longest queue,
+the idle cores and the worst running process are found through lazily
+updated heaps, so each event costs O(log cores) rather than a scan of every
+core.
+
+Switching is free unless ``switch_cost`` or ``warmup`` is set.  A core pays
+``switch_cost`` whenever it starts a process other than the one it ran last,
+and a process that already ran somewhere pays ``warmup`` on top of that for
+its cold cache, whether it was preempted or migrated.  This overhead is
+recorded as separate segments in ``result.overhead``.
+"""
+
+from array import array
+from heapq import heapify, heappop, heappush
+from math import floor
+
+from .core import Result
+from .engine import EPSILON, INF, PRECISION
+from .table import ProcessTable, Timeline
+
+# The machine runs the algorithms whose ready sets are plain keyed queues.
+SMP_ALGORITHMS = ("FCFS", "SJF", "PP", "RR")
+QUEUES = ("per-core", "global")
+BALANCERS = ("steal", "periodic", None)
+
+
+def _split(timeline, cores, core):
+    lanes = [Timeline() for _ in range(cores)]
+    for c, i, start, duration in zip(core, timeline.index, timeline.start, timeline.duration):
+        lanes[c].append(i, start, duration)
+    return lanes
+
+
+class SMPResult(Result):
+    """A :class:`Result` whose segments also record the core they ran on."""
+
+    def __init__(self, table, algorithm, preemptive, quantum, order, completion, timeline, cores, segment_core,
+                 overhead=None, overhead_core=None):
+        super().__init__(table, algorithm, preemptive, quantum, order, completion, timeline, overhead)
+        self.cores = cores
+        self.segment_core = segment_core
+        self.overhead_core = overhead_core
+
+    def lanes(self):
+        """Return one :class:`Timeline` per core, each in start-time order."""
+        return _split(self.timeline, self.cores, self.segment_core)
+
+    def overhead_lanes(self):
+        """Return the switching overhead of every core, like :meth:`lanes`."""
+        if self.overhead is None:
+            return [Timeline() for _ in range(self.cores)]
+        return _split(self.overhead, self.cores, self.overhead_core)
+
+    def busy(self):
+        """Total execution time of every core."""
+        busy = [0.0] * self.cores
+        for c, duration in zip(self.segment_core, self.timeline.duration):
+            busy[c] += duration
+        return busy
+
+    def utilization(self):
+        """Fraction of the makespan each core spent executing."""
+        span = self.makespan()
+        return [b / span if span else 0.0 for b in self.busy()]
+
+    def effective_utilization(self):
+        return super().effective_utilization() / self.cores
+
+    def makespan(self):
+        # Segments are recorded when they end, so the last one ends last.
+        return self.timeline.end()
+
+
+class _Machine:
+    def __init__(self, table, algorithm, cores, preemptive, quantum, shared, balance, affinity,
+                 switch_cost=0.0, warmup=0.0):
+        n = len(table)
+        self.n = n
+        self.cores = cores
+        self.rr = algorithm == "RR"
+        self.by_remaining = algorithm == "SJF"
+        self.preemptive = preemptive
+        self.quantum = quantum
+        self.shared = [] if shared else None
+        self.steal = balance == "steal" and not shared
+        self.affinity = affinity
+        self.priority = table.priority
+        self.left = array("d", table.burst)
+        self.keys = {"SJF": self.left, "PP": table.priority}.get(algorithm)
+        self.seq = 0
+        self.queued = 0
+        self.switch_cost = switch_cost
+        self.warmup = warmup
+        self.ran = bytearray(n)
+        self.last_ran = [-1] * cores
+        self.switching = [-1] * cores
+        self.overhead = Timeline()
+        self.overhead_core = array("l")
+
+        self.pinned = [[] for _ in range(cores)]
+        self.local = [[] for _ in range(cores)]
+        self.current = [-1] * cores
+        self.dispatched = [0.0] * cores
+        self.since = [0.0] * cores
+        self.stamp = [0] * cores
+        self.basis = [0.0] * cores
+        self.events = []
+        self.idle = list(range(cores))
+        self.running = []
+        self.light = [(0, c) for c in range(cores)]
+        self.heavy = []
+
+        self.completion = array("d", bytes(8 * n))
+        self.finished = array("l")
+        self.timeline = Timeline()
+        self.segment_core = array("l")
+
+    # -- queues ---------------------------------------------------------------
+
+    def key(self, i):
+        return self.keys[i] if self.keys is not None else 0.0
+
+    def enqueue(self, i, c, seq):
+        """Queue row ``i`` (last run on, or placed on, core ``c``); return the core
+        whose queue took it, or -1 for the shared queue."""
+        entry = (self.key(i), seq, i)
+        self.queued += 1
+        pin = self.affinity[i] if self.affinity is not None else -1
+        if pin >= 0:
+            heappush(self.pinned[pin], entry)
+            self.touch(pin)
+            return pin
+        if self.shared is not None:
+            heappush(self.shared, entry)
+            return -1
+        heappush(self.local[c], entry)
+        self.touch(c)
+        return c
+
+    def requeue(self, i, c):
+        if self.rr:
+            seq = self.seq
+        else:
+            # Preempted processes queue behind every process that was
+            # already in the trace, as in the single-CPU engines.
+            seq = self.n + self.seq
+        self.seq += 1
+        self.enqueue(i, c, seq)
+
+    def head(self, c):
+        """The best entry core ``c`` could run next, and the queue holding it."""
+        best, source = None, None
+        for queue in (self.pinned[c], self.local[c] if self.shared is None else self.shared):
+            if queue and (best is None or queue[0] < best):
+                best, source = queue[0], queue
+        return best, source
+
+    def pick(self, c):
+        """Pop the entry core ``c`` runs next, stealing if allowed, or return None."""
+        best, source = self.head(c)
+        if source is not None:
+            heappop(source)
+            self.queued -= 1
+            if self.shared is None or source is not self.shared:
+                self.touch(c)
+            return best
+        if self.steal:
+            victim = self.longest()
+            if victim >= 0:
+                best = heappop(self.local[victim])
+                self.queued -= 1
+                self.touch(victim)
+                return best
+        return None
+
+    # -- load tracking (per-core queues) --------------------------------------
+
+    def load(self, c):
+        return len(self.pinned[c]) + len(self.local[c]) + (self.current[c] >= 0)
+
+    def touch(self, c):
+        if self.shared is not None:
+            return
+        heappush(self.light, (self.load(c), c))
+        if self.local[c]:
+            heappush(self.heavy, (-len(self.local[c]), c))
+        if len(self.light) + len(self.heavy) > 8 * self.cores + 64:
+            self.light = [(self.load(k), k) for k in range(self.cores)]
+            self.heavy = [(-len(self.local[k]), k) for k in range(self.cores) if self.local[k]]
+            heapify(self.light)
+            heapify(self.heavy)
+
+    def lightest(self):
+        light = self.light
+        while light[0][0] != self.load(light[0][1]):
+            heappop(light)
+        return light[0][1]
+
+    def longest(self):
+        """The core with the most stealable waiting processes, or -1."""
+        heavy = self.heavy
+        while heavy:
+            length, c = heavy[0]
+            if -length == len(self.local[c]):
+                return c
+            heappop(heavy)
+        return -1
+
+    # -- cores ----------------------------------------------------------------
+
+    def start(self, c, entry, t, resume=False):
+        i = entry[2]
+        cost = 0.0
+        if i != self.last_ran[c]:
+            cost = self.switch_cost + (self.warmup if self.ran[i] else 0.0)
+            self.ran[i] = 1
+            self.last_ran[c] = i
+        if cost:
+            self.switching[c] = len(self.overhead)
+            self.overhead.append(i, t, cost)
+            self.overhead_core.append(c)
+            t += cost
+        self.current[c] = i
+        self.dispatched[c] = t
+        if not resume:
+            self.since[c] = t
+        self.stamp[c] += 1
+        if self.rr:
+            end = t + min(self.quantum, self.left[i])
+        elif self.preemptive:
+            end = round(t + self.left[i], PRECISION)
+        else:
+            end = t + self.left[i]
+        heappush(self.events, (end, c, self.stamp[c]))
+        if self.preemptive and self.shared is not None:
+            self.basis[c] = self.left[i] + t if self.by_remaining else self.priority[i]
+            heappush(self.running, (-self.basis[c], c, self.stamp[c]))
+            if len(self.running) > 4 * self.cores + 64:
+                self.running = [(-self.basis[k], k, self.stamp[k]) for k in range(self.cores)
+                                if self.current[k] >= 0]
+                heapify(self.running)
+        self.touch(c)
+
+    def release(self, c, t):
+        """Close the open segment on core ``c`` at time ``t``."""
+        slot = self.switching[c]
+        if slot >= 0:
+            # Preempted while still switching: only the elapsed part was paid.
+            self.switching[c] = -1
+            overhead = self.overhead
+            if t <= overhead.start[slot] and slot == len(overhead) - 1:
+                for column in (overhead.index, overhead.start, overhead.duration, self.overhead_core):
+                    column.pop()
+            elif t < self.dispatched[c]:
+                overhead.duration[slot] = t - overhead.start[slot]
+        if t > self.since[c]:
+            self.timeline.append(self.current[c], self.since[c], t - self.since[c])
+            self.segment_core.append(c)
+        self.current[c] = -1
+        self.touch(c)
+
+    def dispatch(self, c, t):
+        entry = self.pick(c)
+        if entry is not None:
+            self.start(c, entry, t)
+        elif self.shared is not None:
+            heappush(self.idle, c)
+
+    def running_key(self, c, t):
+        i = self.current[c]
+        if self.by_remaining:
+            return self.left[i] - max(t - self.dispatched[c], 0.0)
+        return self.priority[i]
+
+    def preempt(self, c, t):
+        i = self.current[c]
+        self.left[i] -= max(t - self.dispatched[c], 0.0)
+        if self.by_remaining:
+            # Only remaining times are keys, so only they are rounded, as in run_preemptive.
+            self.left[i] = round(self.left[i], PRECISION)
+        self.release(c, t)
+        self.requeue(i, c)
+        self.start(c, self.pick(c), t)
+
+    def check(self, c, t):
+        """Start an idle core ``c`` or let it preempt its running process."""
+        if self.current[c] < 0:
+            self.dispatch(c, t)
+        elif self.preemptive:
+            best, _ = self.head(c)
+            if best is not None and best[0] < self.running_key(c, t) - EPSILON:
+                self.preempt(c, t)
+
+    def worst(self):
+        """The core running the least urgent process, or -1."""
+        running = self.running
+        while running:
+            _, c, stamp = running[0]
+            if stamp == self.stamp[c] and self.current[c] >= 0:
+                return c
+            heappop(running)
+        return -1
+
+    def settle(self, t, dirty):
+        for c in dict.fromkeys(dirty):
+            self.check(c, t)
+        if self.shared is None:
+            return
+        shared, idle = self.shared, self.idle
+        while shared and idle:
+            c = heappop(idle)
+            if self.current[c] < 0:
+                self.start(c, self.pick(c), t)
+        while self.preemptive and shared:
+            c = self.worst()
+            if c < 0 or not shared[0][0] < self.running_key(c, t) - EPSILON:
+                break
+            self.preempt(c, t)
+
+    # -- events ---------------------------------------------------------------
+
+    def finishing(self, c, t):
+        return not self.rr or self.left[self.current[c]] - (t - self.dispatched[c]) <= EPSILON
+
+    def finish(self, c, t):
+        """Complete the process on core ``c`` at ``t``, leaving the core free."""
+        i = self.current[c]
+        self.left[i] = 0.0
+        self.completion[i] = t
+        self.finished.append(i)
+        self.release(c, t)
+
+    def expire(self, c, t):
+        """End a Round Robin slice on core ``c``: requeue its process and run the
+        next one, which may be the same process continuing its segment."""
+        i = self.current[c]
+        self.left[i] -= t - self.dispatched[c]
+        self.requeue(i, c)
+        entry = self.pick(c)
+        if entry[2] != i:
+            self.release(c, t)
+        self.start(c, entry, t, resume=entry[2] == i)
+
+    def balance(self, t):
+        """Move waiting processes from the longest queues to the least loaded cores."""
+        while True:
+            donor = self.longest()
+            if donor < 0:
+                return
+            taker = self.lightest()
+            if self.load(donor) - self.load(taker) <= 1:
+                return
+            heappush(self.local[taker], heappop(self.local[donor]))
+            self.touch(donor)
+            self.touch(taker)
+            if self.current[taker] < 0:
+                self.dispatch(taker, t)
+
+    def run(self, table, interval):
+        arrival = table.arrival
+        order = table.arrival_order()
+        n = self.n
+        events, stamp = self.events, self.stamp
+        cursor = 0
+        now = 0.0
+        while True:
+            next_arrival = arrival[order[cursor]] if cursor < n else INF
+            while events and events[0][2] != stamp[events[0][1]]:
+                heappop(events)
+            next_event = events[0][0] if events else INF
+            next_balance = INF
+            if interval and self.queued:
+                # The first tick after now; now / interval can round either
+                # way when now is itself a tick, so step past it explicitly.
+                tick = floor(now / interval)
+                while tick * interval <= now:
+                    tick += 1
+                next_balance = tick * interval
+
+            now = min(next_arrival, next_event)
+            if now == INF:
+                break
+            if next_balance < now:
+                now = next_balance
+                self.balance(now)
+                continue
+
+            # Everything happening at one instant is handled together, in the
+            # order the single-CPU engines use: completions free their cores,
+            # arrivals are queued, Round Robin slices that ran out are requeued
+            # behind the newcomers, and then free cores dispatch and busy cores
+            # consider preemption.
+            freed, expired = [], []
+            while events and events[0][0] <= now + EPSILON:
+                t, c, s = heappop(events)
+                if s != stamp[c]:
+                    continue
+                now = max(now, t)
+                if self.finishing(c, t):
+                    self.finish(c, t)
+                    freed.append(c)
+                else:
+                    expired.append((c, t))
+            while cursor < n and arrival[order[cursor]] <= now + EPSILON:
+                i = order[cursor]
+                c = -1 if self.shared is not None else self.lightest()
+                c = self.enqueue(i, c, self.seq if self.rr else cursor)
+                if self.rr:
+                    self.seq += 1
+                if c >= 0:
+                    freed.append(c)
+                cursor += 1
+            for c, t in expired:
+                self.expire(c, t)
+            self.settle(now, freed)
+        return self.finished, self.completion, self.timeline
+
+
+def simulate_overhead(table, algorithm, preemptive, quantum, switch_cost, warmup, probe=None):
+    """Single-CPU run with switching costs, for :func:`~scheduler.core.schedule`.
+
+    Returns ``(order, completion, timeline, overhead)``.  ``probe`` is
+    accepted for symmetry with the other engines but not sampled.
+    """
+    result = schedule_smp(table, algorithm, 1, preemptive, quantum, switch_cost=switch_cost, warmup=warmup)
+    return result.order, result.completion, result.timeline, result.overhead
+
+
+def schedule_smp(processes, algorithm, cores, preemptive=False, quantum=None, queues="per-core",
+                 balance="steal", interval=None, affinity=None, switch_cost=0.0, warmup=0.0):
+    """Schedule ``processes`` on ``cores`` CPUs and return an :class:`SMPResult`.
+
+    ``algorithm`` is one of ``SMP_ALGORITHMS``; it, ``preemptive`` and
+    ``quantum`` mean the same as for :func:`~scheduler.core.schedule`.  ``queues`` is ``"per-core"`` or
+    ``"global"``.  With per-core queues a new process joins the least loaded
+    core, and ``balance`` is ``"steal"`` (idle cores steal), ``"periodic"``
+    (queues are levelled every ``interval`` time units) or ``None``.
+    ``affinity`` optionally gives, per table row, the core the process is
+    pinned to, or -1 for any core.  ``switch_cost`` and ``warmup`` add
+    context-switch and cache-warmup overhead as described above.
+    """
+    if algorithm not in SMP_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm for multiple CPUs: {algorithm!r}")
+    if not isinstance(cores, int) or cores < 1:
+        raise ValueError("cores must be a positive integer")
+    if queues not in QUEUES:
+        raise ValueError(f"Unknown queue layout: {queues!r}")
+    if balance not in BALANCERS:
+        raise ValueError(f"Unknown balancing policy: {balance!r}")
+    if balance == "periodic" and (interval is None or interval <= 0):
+        raise ValueError("Periodic balancing needs a positive interval")
+    if algorithm == "RR" and (quantum is None or quantum <= 0):
+        raise ValueError("Round Robin needs a positive quantum")
+    if switch_cost < 0 or warmup < 0:
+        raise ValueError("switch_cost and warmup cannot be negative")
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_records(processes)
+    if affinity is not None:
+        affinity = array("l", affinity)
+        if len(affinity) != len(table):
+            raise ValueError("affinity needs one entry per process")
+        if any(not -1 <= a < cores for a in affinity):
+            raise ValueError(f"affinity entries must be -1 or a core in 0..{cores - 1}")
+
+    preemptive = bool(preemptive) and algorithm in ("SJF", "PP")
+    quantum = quantum if algorithm == "RR" else None
+    shared = queues == "global"
+    machine = _Machine(table, algorithm, cores, preemptive, quantum, shared, balance, affinity,
+                       switch_cost, warmup)
+    interval = interval if balance == "periodic" and not shared else None
+    order, completion, timeline = machine.run(table, interval)
+    overhead = machine.overhead if switch_cost or warmup else None
+    return SMPResult(table, algorithm, preemptive, quantum, order, completion, timeline, cores,
+                     machine.segment_core, overhead, machine.overhead_core if overhead is not None else None)
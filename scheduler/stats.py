@@ -0,0 +1,282 @@
+"""Scheduling quality metrics that can be computed in one streaming pass.
+
+:class:`RunStats` consumes Gantt segments and completed processes as they
+happen, so it works the same on a :class:`~scheduler.core.Result` (see
+:func:`run_stats`) and on an unbounded :mod:`scheduler.stream` trace.  It
+keeps constant-size state apart from the throughput buckets: waiting,
+turnaround and response time percentiles come from a
+:class:`QuantileSketch`, and everything else is a running sum.
+
+Response time is the first dispatch minus the arrival.  Fairness is Jain's
+index over every process's ``burst / turnaround`` (the share of its time in
+the system that it spent running): 1.0 when all processes were slowed down
+equally, approaching ``1/n`` when one process got everything.
+"""
+
+from array import array
+from itertools import accumulate
+from math import ceil, log
+
+from .engine import EPSILON, INF
+from .gantt import with_overhead
+
+PERCENTILES = (0.5, 0.95, 0.99)
+
+# Sketches keep their raw values, and answer exactly, up to this many values.
+EXACT_LIMIT = 1024
+
+
+class QuantileSketch:
+    """Relative-error quantile sketch over non-negative values.
+
+    Values are counted in logarithmic buckets (as in DDSketch), so every
+    quantile is within ``accuracy`` of a true sample value, however many
+    values were added.  Values up to ``EPSILON`` share one zero bucket.
+    Count, sum, minimum and maximum are exact, and so are the quantiles of
+    up to ``EXACT_LIMIT`` values.
+    """
+
+    __slots__ = ("accuracy", "count", "total", "min", "max", "zeros", "_buckets", "_log_gamma", "_values")
+
+    def __init__(self, accuracy=0.01):
+        if not 0 < accuracy < 1:
+            raise ValueError("accuracy must be between 0 and 1")
+        self.accuracy = accuracy
+        self.count = 0
+        self.total = 0.0
+        self.min = INF
+        self.max = -INF
+        self.zeros = 0
+        self._buckets = {}
+        self._log_gamma = log((1 + accuracy) / (1 - accuracy))
+        self._values = []
+
+    def add(self, value):
+        if self._values is not None:
+            self._values.append(value)
+            if len(self._values) > EXACT_LIMIT:
+                self._values = None
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= EPSILON:
+            self.zeros += 1
+        else:
+            bucket = ceil(log(value) / self._log_gamma)
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    def merge(self, other):
+        """Fold ``other`` (built with the same accuracy) into this sketch."""
+        if other.accuracy != self.accuracy:
+            raise ValueError("Only sketches with the same accuracy can be merged")
+        if self._values is not None and other._values is not None \
+                and len(self._values) + len(other._values) <= EXACT_LIMIT:
+            self._values.extend(other._values)
+        else:
+            self._values = None
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.zeros += other.zeros
+        buckets = self._buckets
+        for bucket, count in other._buckets.items():
+            buckets[bucket] = buckets.get(bucket, 0) + count
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q):
+        """The ``q``-quantile (0 <= q <= 1), or 0.0 for an empty sketch."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.count:
+            return 0.0
+        if q == 1:
+            return self.max
+        # Nearest rank: the smallest value with at least q of them at or below it.
+        rank = max(ceil(q * self.count) - 1, 0)
+        if self._values is not None:
+            return sorted(self._values)[rank]
+        seen = self.zeros
+        if rank < seen:
+            return max(self.min, 0.0)
+        gamma = (1 + self.accuracy) / (1 - self.accuracy)
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if rank < seen:
+                # The midpoint (in relative terms) of the bucket's range.
+                value = 2 * gamma ** bucket / (gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self):
+        """``(mean, p50, p95, p99, max)``."""
+        return (self.mean(), *(self.quantile(q) for q in PERCENTILES), self.max if self.count else 0.0)
+
+
+class RunStats:
+    """Streaming accumulator for the metrics of one run.
+
+    Feed it with :meth:`segment` for every executed (or switching) segment
+    and :meth:`completed` for every finished process, then call
+    :meth:`finish`.  Segments of one core must come in start order.  Idle
+    time is counted from ``origin``, which defaults to the start of the
+    first segment.  With ``window`` set, completions are also counted in
+    ``step``-wide buckets (``window / 4`` by default) for :meth:`throughput`.
+    """
+
+    __slots__ = ("cores", "origin", "window", "step", "waiting", "turnaround", "response", "busy",
+                 "switching", "idle_gaps", "idle_time", "longest_idle", "makespan", "_last_end",
+                 "_fair_sum", "_fair_squares", "_buckets")
+
+    def __init__(self, cores=1, window=None, step=None, accuracy=0.01, origin=None):
+        if window is not None and window <= 0:
+            raise ValueError("window must be positive")
+        self.cores = cores
+        self.origin = origin
+        self.window = window
+        self.step = (step or window / 4) if window else None
+        if self.step is not None and self.step <= 0:
+            raise ValueError("step must be positive")
+        self.waiting = QuantileSketch(accuracy)
+        self.turnaround = QuantileSketch(accuracy)
+        self.response = QuantileSketch(accuracy)
+        self.busy = 0.0
+        self.switching = 0.0
+        self.idle_gaps = 0
+        self.idle_time = 0.0
+        self.longest_idle = 0.0
+        self.makespan = 0.0
+        self._last_end = [origin] * cores
+        self._fair_sum = 0.0
+        self._fair_squares = 0.0
+        self._buckets = array("l")
+
+    def segment(self, start, duration, core=0, switching=False):
+        if self.origin is None:
+            self.origin = start
+            self._last_end = [start] * self.cores
+        gap = start - self._last_end[core]
+        if gap > EPSILON:
+            self.idle_gaps += 1
+            self.idle_time += gap
+            if gap > self.longest_idle:
+                self.longest_idle = gap
+        end = start + duration
+        self._last_end[core] = end
+        if end > self.makespan:
+            self.makespan = end
+        if switching:
+            self.switching += duration
+        else:
+            self.busy += duration
+
+    def completed(self, arrival, burst, completion, first_start=None):
+        """Record a finished process; ``first_start`` is its first dispatch."""
+        turnaround = completion - arrival
+        self.turnaround.add(turnaround)
+        self.waiting.add(turnaround - burst)
+        self.response.add((completion if first_start is None else first_start) - arrival)
+        share = burst / turnaround if turnaround > EPSILON else 1.0
+        self._fair_sum += share
+        self._fair_squares += share * share
+        if self.step is not None:
+            bucket = int(completion // self.step)
+            buckets = self._buckets
+            if bucket >= len(buckets):
+                buckets.extend([0] * (bucket + 1 - len(buckets)))
+            buckets[bucket] += 1
+
+    @property
+    def completions(self):
+        return self.turnaround.count
+
+    def finish(self):
+        """Count the idle time left at the end of every core's timeline."""
+        if self.origin is not None:
+            for core in range(self.cores):
+                self.segment(self.makespan, 0.0, core)
+        return self
+
+    def utilization(self):
+        """Share of the cores' time spent executing processes."""
+        span = (self.makespan - (self.origin or 0.0)) * self.cores
+        return self.busy / span if span > 0 else 0.0
+
+    def fairness(self):
+        """Jain's fairness index over ``burst / turnaround``."""
+        n = self.completions
+        return self._fair_sum ** 2 / (n * self._fair_squares) if self._fair_squares else 1.0
+
+    def throughput(self):
+        """Return ``(window start, completions per time unit)`` for every window.
+
+        Windows start every ``step`` time units and are ``window`` wide,
+        rounded to a whole number of steps.  Without a window the list is
+        empty.
+        """
+        if self.step is None:
+            return []
+        steps = max(1, round(self.window / self.step))
+        counts = [0, *accumulate(self._buckets)]
+        width = steps * self.step
+        last = max(len(counts) - 1 - steps, 0)
+        return [(k * self.step, (counts[min(k + steps, len(counts) - 1)] - counts[k]) / width)
+                for k in range(last + 1)]
+
+    def report(self):
+        """Return the metrics as lines of text."""
+        lines = [
+            f"Processes: {self.completions}",
+            f"Makespan: {self.makespan:.2f}",
+            f"Throughput: {self.completions / self.makespan if self.makespan else 0.0:.4f} per time unit",
+            f"CPU utilization: {self.utilization():.1%}",
+            f"Idle gaps: {self.idle_gaps} totalling {self.idle_time:.2f} (longest {self.longest_idle:.2f})",
+        ]
+        if self.switching:
+            lines.append(f"Switching overhead: {self.switching:.2f}")
+        for name, sketch in (("Waiting", self.waiting), ("Turnaround", self.turnaround),
+                             ("Response", self.response)):
+            mean, p50, p95, p99, peak = sketch.summary()
+            lines.append(f"{name} time: mean {mean:.2f}, p50 {p50:.2f}, p95 {p95:.2f}, "
+                         f"p99 {p99:.2f}, max {peak:.2f}")
+        lines.append(f"Jain's fairness index: {self.fairness():.4f}")
+        rates = self.throughput()
+        if rates:
+            low = min(rate for _, rate in rates)
+            high = max(rate for _, rate in rates)
+            lines.append(f"Throughput over {self.window:g}-unit windows: min {low:.4f}, max {high:.4f}")
+        return lines
+
+
+def first_dispatch(result):
+    """First start time of every row of ``result`` (``INF`` if it never ran)."""
+    first = array("d", [INF]) * len(result.table)
+    timeline = result.timeline
+    for i, start in zip(timeline.index, timeline.start):
+        if start < first[i]:
+            first[i] = start
+    return first
+
+
+def run_stats(result, window=None, step=None):
+    """Compute :class:`RunStats` for a finished :class:`~scheduler.core.Result`."""
+    cores = getattr(result, "cores", 1)
+    stats = RunStats(cores, window, step, origin=0.0)
+    lanes = result.lanes() if cores > 1 else [result.timeline]
+    overhead = result.overhead_lanes() if cores > 1 else [result.overhead]
+    for core, (lane, switches) in enumerate(zip(lanes, overhead)):
+        if switches is not None and len(switches):
+            lane = with_overhead(lane, switches)
+        for i, start, duration in zip(lane.index, lane.start, lane.duration):
+            stats.segment(start, duration, core, i < 0)
+    first = first_dispatch(result)
+    table = result.table
+    arrival, burst, completion = table.arrival, table.burst, result.completion
+    for i in result.order:
+        stats.completed(arrival[i], burst[i], completion[i], first[i] if first[i] != INF else None)
+    return stats.finish()
@@ -0,0 +1,166 @@
+"""Binary columnar storage for scheduling results.
+
+A result file holds every per-process column (arrival, burst, priority,
+completion, completion order, pids), the Gantt segments and any switching
+overhead segments as raw fixed-width
+arrays, Arrow-style, behind a small JSON header::
+
+    b"SCHEDRES" | header length (uint64) | JSON header | padding | columns...
+
+Every column starts on an 8-byte boundary.  Strings are stored as an offsets
+column plus one UTF-8 blob.  :func:`load_result` maps the file with ``mmap``
+and hands out ``memoryview`` columns, so reloading is zero-copy regardless of
+size and the columns can be wrapped directly with ``numpy.frombuffer``.
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from .core import Result
+from .table import ProcessTable, Timeline
+
+MAGIC = b"SCHEDRES"
+VERSION = 1
+
+
+class StringColumn:
+    """Read-only sequence of strings decoded on access from offsets and a UTF-8 blob."""
+
+    __slots__ = ("offsets", "data")
+
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return str(self.data[self.offsets[i]:self.offsets[i + 1]], "utf-8")
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+def _int64(values):
+    if isinstance(values, array) and values.typecode in "lq" and values.itemsize == 8:
+        return values
+    return array("q", values)
+
+
+def _float64(values):
+    if isinstance(values, array) and values.typecode == "d":
+        return values
+    return array("d", values)
+
+
+def _strings(values):
+    offsets = array("q", [0])
+    blob = bytearray()
+    for value in values:
+        blob += str(value).encode("utf-8")
+        offsets.append(len(blob))
+    return offsets, bytes(blob)
+
+
+def save_result(result, path, manifest=None):
+    """Write ``result`` to ``path`` in the columnar result format.
+
+    ``manifest`` (see :mod:`scheduler.manifest`) is kept in the header and
+    can be read back with :func:`read_manifest`.
+    """
+    table, timeline = result.table, result.timeline
+    pid_offsets, pid_data = _strings(table.pids)
+    columns = {
+        "arrival": ("d", _float64(table.arrival)),
+        "burst": ("d", _float64(table.burst)),
+        "priority": ("d", _float64(table.priority)),
+        "completion": ("d", _float64(result.completion)),
+        "order": ("q", _int64(result.order)),
+        "pid_offsets": ("q", pid_offsets),
+        "pid_data": ("B", pid_data),
+        "segment_index": ("q", _int64(timeline.index)),
+        "segment_start": ("d", _float64(timeline.start)),
+        "segment_duration": ("d", _float64(timeline.duration)),
+    }
+    if result.overhead is not None:
+        columns["overhead_index"] = ("q", _int64(result.overhead.index))
+        columns["overhead_start"] = ("d", _float64(result.overhead.start))
+        columns["overhead_duration"] = ("d", _float64(result.overhead.duration))
+    layout = {}
+    offset = 0
+    for name, (typecode, values) in columns.items():
+        size = len(memoryview(values).cast("B"))
+        layout[name] = {"type": typecode, "offset": offset, "bytes": size}
+        offset += size + (-size % 8)
+    header = json.dumps({
+        "version": VERSION, "byteorder": sys.byteorder, "algorithm": result.algorithm,
+        "preemptive": result.preemptive, "quantum": result.quantum, "columns": layout,
+        **({"manifest": manifest} if manifest is not None else {}),
+    }).encode("utf-8")
+    header += b" " * (-(len(MAGIC) + 8 + len(header)) % 8)
+
+    with open(path, "wb") as handle:
+        handle.write(MAGIC)
+        handle.write(struct.pack("<Q", len(header)))
+        handle.write(header)
+        for typecode, values in columns.values():
+            data = memoryview(values).cast("B")
+            handle.write(data)
+            handle.write(b"\0" * (-len(data) % 8))
+
+
+def _read_header(handle, path):
+    if handle.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{path} is not a scheduling result file")
+    (header_length,) = struct.unpack("<Q", handle.read(8))
+    return header_length, json.loads(handle.read(header_length))
+
+
+def read_manifest(path):
+    """The run manifest stored with the result file at ``path``, or ``None``."""
+    with open(path, "rb") as handle:
+        return _read_header(handle, path)[1].get("manifest")
+
+
+def load_result(path):
+    """Map the result file at ``path`` and return a read-only :class:`Result` over it."""
+    with open(path, "rb") as handle:
+        header_length, header = _read_header(handle, path)
+        if header["version"] != VERSION:
+            raise ValueError(f"Unsupported result file version {header['version']}")
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{path} was written on a {header['byteorder']}-endian machine")
+        start = len(MAGIC) + 8 + header_length
+        view = memoryview(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def column(name):
+        spec = header["columns"][name]
+        data = view[start + spec["offset"]:start + spec["offset"] + spec["bytes"]]
+        return data if spec["type"] == "B" else data.cast(spec["type"])
+
+    table = ProcessTable()
+    table.pids = StringColumn(column("pid_offsets"), column("pid_data"))
+    table.arrival = column("arrival")
+    table.burst = column("burst")
+    table.priority = column("priority")
+    timeline = Timeline()
+    timeline.index = column("segment_index")
+    timeline.start = column("segment_start")
+    timeline.duration = column("segment_duration")
+    overhead = None
+    if "overhead_index" in header["columns"]:
+        overhead = Timeline()
+        overhead.index = column("overhead_index")
+        overhead.start = column("overhead_start")
+        overhead.duration = column("overhead_duration")
+    return Result(table, header["algorithm"], header["preemptive"], header["quantum"],
+                  column("order"), column("completion"), timeline, overhead)
+
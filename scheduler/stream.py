@@ -0,0 +1,287 @@
+"""Incremental scheduling of unbounded, arrival-ordered process streams.
+
+:func:`stream_schedule` consumes process records lazily (typically straight
+from :func:`scheduler.workload.read_records`) and yields Gantt segments and
+completed processes as soon as they are final.  Only the ready set and a
+single look-ahead record are held in memory, so day-long traces can be
+replayed in constant memory as long as the system keeps up with its load.
+
+The records must arrive in non-decreasing arrival order.  Results match
+:func:`scheduler.schedule` on the same input.
+
+    python -m scheduler.stream --algorithm RR --quantum 2 trace.csv > events.jsonl
+"""
+
+import argparse
+import json
+import sys
+from collections import deque
+from heapq import heappop, heappush
+
+from .core import _full_rounds
+from .engine import EPSILON, INF, PRECISION
+from .manifest import RowDigest, ScheduleDigest, manifest, write_manifest
+from .stats import RunStats
+from .workload import read_records
+
+# The streaming engines cover the original four algorithms.
+STREAM_ALGORITHMS = ("FCFS", "SJF", "PP", "RR")
+
+
+def _segment(record, start, duration):
+    return {"event": "segment", "pid": record["pid"], "start": start, "duration": duration}
+
+
+def _completed(record, completion):
+    turnaround = completion - record["arrival"]
+    return {"event": "completed", "pid": record["pid"], "arrival": record["arrival"], "burst": record["burst"],
+            "priority": record["priority"], "completion": completion,
+            "waiting": turnaround - record["burst"], "turnaround": turnaround}
+
+
+class _Arrivals:
+    """Look-ahead cursor over the record stream that enforces arrival order."""
+
+    def __init__(self, records):
+        self._records = iter(records)
+        self.seq = 0
+        self.upcoming = next(self._records, None)
+        self.next_arrival = self.upcoming["arrival"] if self.upcoming else INF
+
+    def pop(self):
+        record = self.upcoming
+        self.seq += 1
+        self.upcoming = next(self._records, None)
+        if self.upcoming is None:
+            self.next_arrival = INF
+        elif self.upcoming["arrival"] < record["arrival"]:
+            raise ValueError(f"Process {self.upcoming['pid']} arrives before process {record['pid']}; "
+                             "streamed records must be sorted by arrival time")
+        else:
+            self.next_arrival = self.upcoming["arrival"]
+        return record
+
+
+def _stream_select(arrivals, key, preemptive):
+    # ``key`` is the record field to select on (None for arrival order); for
+    # "burst" the running process is compared on its remaining time.
+    # Ready entries are (key, requeued?, seq, slot): fresh arrivals tie-break
+    # by arrival order and preempted processes queue behind all of them, as
+    # in run_preemptive.
+    ready = []
+    requeued = 0
+    slots = {}
+    time_elapsed = 0.0
+    current = None
+    current_key = 0.0
+    started = 0.0
+
+    def admit():
+        while arrivals.next_arrival <= time_elapsed + EPSILON:
+            seq = arrivals.seq
+            record = arrivals.pop()
+            slots[seq] = [record, record["burst"]]
+            heappush(ready, (seq if key is None else record[key], 0, seq, seq))
+
+    while True:
+        if current is None:
+            if not ready:
+                if arrivals.next_arrival == INF:
+                    return
+                if arrivals.next_arrival > time_elapsed + EPSILON:
+                    time_elapsed = arrivals.next_arrival
+            admit()
+            current_key, _, _, current = heappop(ready)
+            started = time_elapsed
+
+        slot = slots[current]
+        left = slot[1] - (arrivals.next_arrival - time_elapsed)
+        if not preemptive or left < EPSILON:
+            if preemptive:
+                time_elapsed = round(time_elapsed + slot[1], PRECISION)
+                duration = time_elapsed - started
+            else:
+                # Like the batch engines, record the burst itself rather than
+                # the (float-rounded) difference of the two clock readings.
+                time_elapsed += slot[1]
+                duration = slot[1]
+            del slots[current]
+            yield _segment(slot[0], started, duration)
+            yield _completed(slot[0], time_elapsed)
+            current = None
+            continue
+
+        slot[1] = left
+        time_elapsed = arrivals.next_arrival
+        if key == "burst":
+            current_key = left
+        admit()
+
+        if ready[0][0] < current_key - EPSILON:
+            if time_elapsed > started:
+                yield _segment(slot[0], started, time_elapsed - started)
+            if key == "burst":
+                current_key = slot[1] = round(left, PRECISION)
+            heappush(ready, (current_key, 1, requeued, current))
+            requeued += 1
+            current_key, _, _, current = heappop(ready)
+            started = time_elapsed
+
+
+def _stream_rr(arrivals, quantum):
+    # A slice that continues the process that ran just before it extends
+    # that process's segment, as in simulate_rr, so the open segment
+    # ``[seq, start, duration]`` is only yielded once another process runs,
+    # the CPU idles or the process completes.
+    records = {}
+    left = {}
+    queue = deque()
+    time_elapsed = 0.0
+    countdown = 0
+    running = None
+
+    def admit():
+        while arrivals.next_arrival <= time_elapsed + EPSILON:
+            seq = arrivals.seq
+            records[seq] = arrivals.pop()
+            left[seq] = records[seq]["burst"]
+            queue.append(seq)
+
+    def close():
+        i, start, duration = running
+        return _segment(records[i], start, duration)
+
+    while arrivals.next_arrival != INF or queue:
+        admit()
+        if not queue:
+            if running is not None:
+                yield close()
+                running = None
+            time_elapsed = arrivals.next_arrival
+            continue
+
+        if countdown <= 0:
+            countdown = len(queue)
+            rounds = _full_rounds(queue, left, quantum, time_elapsed, arrivals.next_arrival)
+            if rounds > 1:
+                slices = rounds * len(queue)
+                if len(queue) == 1:
+                    if running is not None and running[0] == queue[0]:
+                        running[2] = time_elapsed + slices * quantum - running[1]
+                    else:
+                        if running is not None:
+                            yield close()
+                        running = [queue[0], time_elapsed, rounds * quantum]
+                else:
+                    if running is not None:
+                        yield close()
+                    for step in range(slices - 1):
+                        yield _segment(records[queue[step % len(queue)]], time_elapsed + step * quantum, quantum)
+                    running = [queue[-1], time_elapsed + (slices - 1) * quantum, quantum]
+                for i in queue:
+                    left[i] -= rounds * quantum
+                time_elapsed += slices * quantum
+
+        i = queue.popleft()
+        countdown -= 1
+        exec_time = min(quantum, left[i])
+        if running is not None and running[0] == i:
+            running[2] = time_elapsed + exec_time - running[1]
+        else:
+            if running is not None:
+                yield close()
+            running = [i, time_elapsed, exec_time]
+        left[i] -= exec_time
+        time_elapsed += exec_time
+
+        admit()
+        if left[i] > EPSILON:
+            queue.append(i)
+        else:
+            del left[i]
+            yield close()
+            running = None
+            yield _completed(records.pop(i), time_elapsed)
+
+
+def stream_schedule(records, algorithm, preemptive=False, quantum=None):
+    """Schedule an arrival-ordered stream of process dicts incrementally.
+
+    Yields ``{"event": "segment", ...}`` dicts for executed Gantt segments and
+    ``{"event": "completed", ...}`` dicts (with ``completion``, ``waiting`` and
+    ``turnaround``) for finished processes, in simulation order.
+    """
+    if algorithm not in STREAM_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm for streaming: {algorithm!r}")
+    arrivals = _Arrivals(records)
+    if algorithm == "RR":
+        if quantum is None or quantum <= 0:
+            raise ValueError("Round Robin needs a positive quantum")
+        return _stream_rr(arrivals, quantum)
+    if algorithm == "FCFS":
+        return _stream_select(arrivals, None, False)
+    return _stream_select(arrivals, "burst" if algorithm == "SJF" else "priority", preemptive)
+
+
+def _digested(records, digest):
+    for record in records:
+        digest.add(record["pid"], record["arrival"], record["burst"], record["priority"])
+        yield record
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream a process trace through a scheduler.")
+    parser.add_argument("trace", nargs="?", default="-", help="CSV or JSONL trace sorted by arrival ('-' for stdin)")
+    parser.add_argument("--algorithm", choices=STREAM_ALGORITHMS, default="FCFS")
+    parser.add_argument("--preemptive", action="store_true", help="preemptive SJF/PP")
+    parser.add_argument("--quantum", type=float, help="Round Robin quantum")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="trace format (default: from extension)")
+    parser.add_argument("--no-segments", action="store_true", help="only emit completed processes")
+    parser.add_argument("--stats", action="store_true",
+                        help="print percentiles, utilization and fairness to stderr at the end")
+    parser.add_argument("--window", type=float, help="throughput window for --stats")
+    parser.add_argument("--manifest", help="write the run's manifest (see scheduler.manifest) to this file")
+    args = parser.parse_args(argv)
+    if args.algorithm == "RR" and (args.quantum is None or args.quantum <= 0):
+        parser.error("--algorithm RR needs a positive --quantum")
+
+    count = 0
+    total_waiting = 0.0
+    stats = RunStats(window=args.window) if args.stats else None
+    first = {}
+    records = read_records(args.trace, args.format)
+    if args.manifest:
+        workload = RowDigest(3)
+        digest = ScheduleDigest()
+        records = _digested(records, workload)
+    for event in stream_schedule(records, args.algorithm, args.preemptive, args.quantum):
+        if args.manifest:
+            if event["event"] == "completed":
+                digest.completions.add(event["pid"], event["completion"])
+            else:
+                digest.segments.add(event["pid"], event["start"], event["duration"])
+        if event["event"] == "completed":
+            count += 1
+            total_waiting += event["waiting"]
+            if stats is not None:
+                stats.completed(event["arrival"], event["burst"], event["completion"], first.pop(event["pid"], None))
+        else:
+            if stats is not None:
+                stats.segment(event["start"], event["duration"])
+                first.setdefault(event["pid"], event["start"])
+            if args.no_segments:
+                continue
+        sys.stdout.write(json.dumps(event) + "\n")
+    if count:
+        print(f"{count} processes, average waiting time {total_waiting / count:.2f}", file=sys.stderr)
+    if stats is not None:
+        print("\n".join(stats.finish().report()), file=sys.stderr)
+    if args.manifest:
+        preemptive = args.preemptive and args.algorithm in ("SJF", "PP")
+        quantum = args.quantum if args.algorithm == "RR" else None
+        write_manifest(manifest(args.algorithm, preemptive, quantum, count, workload.hexdigest(),
+                                digest.hexdigest()), args.manifest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Columnar storage for process sets and Gantt timelines.
+
+A :class:`ProcessTable` keeps one ``array('d')`` per numeric attribute instead
+of one dict per process, which cuts memory use on multi-million-process traces
+by an order of magnitude.  Engines address processes by their row index and
+never copy the table; the arrival-sorted order is computed once and cached.
+"""
+
+from array import array
+
+
+def _column(values):
+    if isinstance(values, array) and values.typecode == "d":
+        return values
+    return array("d", values)
+
+
+class ProcessTable:
+    """Struct-of-arrays process set: ``pids``, ``arrival``, ``burst``, ``priority``."""
+
+    __slots__ = ("pids", "arrival", "burst", "priority", "_order")
+
+    def __init__(self):
+        self.pids = []
+        self.arrival = array("d")
+        self.burst = array("d")
+        self.priority = array("d")
+        self._order = None
+
+    @classmethod
+    def from_sequences(cls, pids, arrivals, bursts, priorities=None):
+        """Build a table from parallel sequences.
+
+        ``array('d')`` columns are adopted as-is; anything else is copied once.
+        ``priorities`` defaults to all zeros.
+        """
+        table = cls()
+        table.pids = pids if isinstance(pids, (list, range)) else list(pids)
+        table.arrival = _column(arrivals)
+        table.burst = _column(bursts)
+        if priorities is None:
+            table.priority = array("d", bytes(8 * len(table.arrival)))
+        else:
+            table.priority = _column(priorities)
+        if not len(table.pids) == len(table.arrival) == len(table.burst) == len(table.priority):
+            raise ValueError("Process columns must all have the same length")
+        return table
+
+    @classmethod
+    def from_records(cls, records):
+        """Build a table from dicts with ``pid``, ``arrival``, ``burst`` and ``priority`` keys."""
+        table = cls()
+        for record in records:
+            table.append(record["pid"], record["arrival"], record["burst"], record.get("priority", 0))
+        return table
+
+    def append(self, pid, arrival, burst, priority=0):
+        if isinstance(self.pids, range):
+            self.pids = list(self.pids)
+        self.pids.append(pid)
+        self.arrival.append(arrival)
+        self.burst.append(burst)
+        self.priority.append(priority)
+        self._order = None
+
+    def clear(self):
+        self.pids = []
+        self.arrival = array("d")
+        self.burst = array("d")
+        self.priority = array("d")
+        self._order = None
+
+    def copy(self):
+        """An independent copy, e.g. to hand to a run on another thread."""
+        return ProcessTable.from_sequences(list(self.pids), array("d", self.arrival), array("d", self.burst),
+                                           array("d", self.priority))
+
+    def __len__(self):
+        return len(self.arrival)
+
+    def arrival_order(self):
+        """Row indices sorted by arrival time (stable, so ties keep insertion order)."""
+        if self._order is None:
+            self._order = array("l", sorted(range(len(self.arrival)), key=self.arrival.__getitem__))
+        return self._order
+
+    def record(self, i):
+        return {"pid": self.pids[i], "arrival": self.arrival[i], "burst": self.burst[i],
+                "priority": self.priority[i]}
+
+
+class Timeline:
+    """Executed Gantt segments as parallel ``index``/``start``/``duration`` columns."""
+
+    __slots__ = ("index", "start", "duration")
+
+    def __init__(self):
+        self.index = array("l")
+        self.start = array("d")
+        self.duration = array("d")
+
+    def append(self, i, start, duration):
+        self.index.append(i)
+        self.start.append(start)
+        self.duration.append(duration)
+
+    def __len__(self):
+        return len(self.index)
+
+    def end(self):
+        if not self.index:
+            return 0.0
+        return self.start[-1] + self.duration[-1]
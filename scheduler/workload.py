@@ -0,0 +1,49 @@
+"""Reading process records from workload files.
+
+A workload is either a CSV file with a ``pid,arrival,burst[,priority]``
+header or a JSON Lines file with one ``{"pid", "arrival", "burst",
+"priority"}`` object per line.  The format is picked from the extension
+unless given explicitly; ``-`` reads from standard input.
+"""
+
+import csv
+import json
+import sys
+
+from .table import ProcessTable
+
+
+def _record(raw):
+    return {"pid": str(raw["pid"]), "arrival": float(raw["arrival"]), "burst": float(raw["burst"]),
+            "priority": float(raw.get("priority") or 0)}
+
+
+def _parse(handle, fmt):
+    if fmt == "jsonl":
+        for line in handle:
+            if line.strip():
+                yield _record(json.loads(line))
+    elif fmt == "csv":
+        for raw in csv.DictReader(handle):
+            yield _record(raw)
+    else:
+        raise ValueError(f"Unknown workload format: {fmt!r}")
+
+
+def read_records(path, fmt=None):
+    """Lazily yield one process dict per record in the workload at ``path``.
+
+    ``fmt`` is ``"csv"`` or ``"jsonl"``; by default it is taken from the file
+    extension, and standard input is assumed to be CSV.
+    """
+    if fmt is None:
+        fmt = "jsonl" if str(path).endswith((".jsonl", ".json")) else "csv"
+    if path == "-":
+        yield from _parse(sys.stdin, fmt)
+        return
+    with open(path, newline="") as handle:
+        yield from _parse(handle, fmt)
+
+
+def load_table(path):
+    return ProcessTable.from_records(read_records(path))
@@ -0,0 +1,123 @@
+"""Exact (Fraction) reference schedulers for small hand-sized traces.
+
+They are deliberately naive: the clock and every burst are Fractions of the
+decimal values written in the trace, so float drift cannot decide a tie.
+They follow the loops of the original GUI engines, so agreeing with them
+means agreeing with what the GUI computed before the engines were rewritten.
+"""
+
+from fractions import Fraction
+
+
+def exact(value):
+    return Fraction(repr(float(value)))
+
+
+def non_preemptive(records, key):
+    """Completion time of every record, running the smallest ``key`` to completion.
+
+    ``key`` is ``"arrival"`` (FCFS), ``"burst"`` (SJF) or ``"priority"`` (PP);
+    ties go to the earlier arrival, then to the record listed first.
+    """
+    rows = [(exact(r["arrival"]), exact(r["burst"]), r["priority"]) for r in records]
+    pending = sorted(range(len(rows)), key=lambda i: rows[i][0])
+    rank = {i: position for position, i in enumerate(pending)}
+    column = {"arrival": 0, "burst": 1, "priority": 2}[key]
+    completion = [None] * len(rows)
+    clock = Fraction(0)
+    while pending:
+        ready = [i for i in pending if rows[i][0] <= clock]
+        if not ready:
+            clock = rows[pending[0]][0]
+            continue
+        i = min(ready, key=lambda i: (rows[i][column], rank[i]))
+        pending.remove(i)
+        clock += rows[i][1]
+        completion[i] = clock
+    return completion
+
+
+def merged(segments):
+    """``(pid, start, duration)`` segments with back-to-back runs of one pid joined."""
+    joined = []
+    for pid, start, duration in segments:
+        if joined and joined[-1][0] == pid and joined[-1][1] + joined[-1][2] == start:
+            joined[-1] = (pid, joined[-1][1], joined[-1][2] + duration)
+        else:
+            joined.append((pid, start, duration))
+    return joined
+
+
+def round_robin(records, quantum):
+    """``(completion, segments)`` for Round Robin with ``quantum``.
+
+    Arrivals during a slice queue ahead of the process that ran it, and a
+    process continuing straight after itself stays one segment.
+    """
+    quantum = exact(quantum)
+    pending = sorted(range(len(records)), key=lambda i: exact(records[i]["arrival"]))
+    left = [exact(r["burst"]) for r in records]
+    completion = [None] * len(records)
+    segments = []
+    queue = []
+    clock = Fraction(0)
+    while pending or queue:
+        while pending and exact(records[pending[0]]["arrival"]) <= clock:
+            queue.append(pending.pop(0))
+        if not queue:
+            clock = exact(records[pending[0]]["arrival"])
+            continue
+        i = queue.pop(0)
+        ran = min(quantum, left[i])
+        segments.append((records[i]["pid"], clock, ran))
+        left[i] -= ran
+        clock += ran
+        while pending and exact(records[pending[0]]["arrival"]) <= clock:
+            queue.append(pending.pop(0))
+        if left[i]:
+            queue.append(i)
+        else:
+            completion[i] = clock
+    return completion, merged(segments)
+
+
+def preemptive(records, key, tick=Fraction(1, 10)):
+    """``(completion, segments)`` for preemptive SJF (``key="burst"``) or PP (``"priority"``).
+
+    The clock advances one ``tick`` at a time, as the original GUI did, so
+    every arrival and burst must be a whole number of ticks.  A newcomer
+    preempts only with a strictly smaller key (the remaining time for SJF);
+    a preempted process queues behind everything already waiting.
+    """
+    left = [exact(r["burst"]) for r in records]
+    keys = left if key == "burst" else [r["priority"] for r in records]
+    waiting = sorted(range(len(records)), key=lambda i: exact(records[i]["arrival"]))
+    completion = [None] * len(records)
+    segments = []
+    running = None
+    clock = Fraction(0)
+    while waiting or running is not None:
+        ready = [i for i in waiting if exact(records[i]["arrival"]) <= clock]
+        if not ready and running is None:
+            clock = min(exact(records[i]["arrival"]) for i in waiting)
+            continue
+        if ready:
+            best = min(ready, key=keys.__getitem__)
+            if running is None or keys[running] > keys[best]:
+                if running is not None:
+                    waiting.append(running)
+                waiting.remove(best)
+                running = best
+        segments.append((records[running]["pid"], clock, tick))
+        left[running] -= tick
+        clock += tick
+        if not left[running]:
+            completion[running] = clock
+            running = None
+    return completion, merged(segments)
+
+
+def records(*rows):
+    """Records from ``(arrival, burst[, priority])`` tuples, with pids P0, P1, ..."""
+    return [{"pid": f"P{i}", "arrival": row[0], "burst": row[1], "priority": row[2] if len(row) > 2 else 0}
+            for i, row in enumerate(rows)]
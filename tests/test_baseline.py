@@ -0,0 +1,48 @@
+"""The engines against exact ports of the original GUI loops, on random traces."""
+
+import random
+
+import pytest
+
+from scheduler import schedule
+
+from .exact import non_preemptive, preemptive, records, round_robin
+
+SEEDS = range(100)
+
+
+def random_trace(seed):
+    rng = random.Random(seed)
+    # Whole tenths, as typed into the GUI, so the tick-based references are exact.
+    return records(*((rng.randint(0, 40) / 10, rng.randint(1, 40) / 10, rng.randint(-3, 3))
+                     for _ in range(rng.randint(1, 9))))
+
+
+def assert_matches(result, completion, segments=None):
+    assert list(result.completion) == pytest.approx([float(c) for c in completion], abs=1e-9)
+    if segments is not None:
+        actual = list(result.segments())
+        assert [pid for pid, _, _ in actual] == [pid for pid, _, _ in segments]
+        assert [value for _, start, duration in actual for value in (start, duration)] == pytest.approx(
+            [float(value) for _, start, duration in segments for value in (start, duration)], abs=1e-9)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("algorithm, key", [("FCFS", "arrival"), ("SJF", "burst"), ("PP", "priority")])
+def test_non_preemptive_matches_the_original_engines(seed, algorithm, key):
+    trace = random_trace(seed)
+    assert_matches(schedule(trace, algorithm), non_preemptive(trace, key))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("algorithm, key", [("SJF", "burst"), ("PP", "priority")])
+def test_preemptive_matches_the_original_engines(seed, algorithm, key):
+    trace = random_trace(seed)
+    assert_matches(schedule(trace, algorithm, preemptive=True), *preemptive(trace, key))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("quantum", [0.1, 0.5, 1, 3])
+def test_round_robin_matches_the_original_engine(seed, quantum):
+    trace = random_trace(seed)
+    assert_matches(schedule(trace, "RR", quantum=quantum), *round_robin(trace, quantum))
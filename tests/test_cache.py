@@ -0,0 +1,82 @@
+from scheduler import ProcessTable, schedule
+from scheduler.cache import ResultCache, cache_key, workload_hash
+
+
+def table(pids, arrival=(0.0, 1.0), burst=(3.0, 2.0)):
+    return ProcessTable.from_sequences(list(pids), list(arrival), list(burst), [0.0] * len(pids))
+
+
+def test_workload_hash_depends_on_contents_only():
+    assert workload_hash(table(["P1", "P2"])) == workload_hash(table(["P1", "P2"]))
+    assert workload_hash(table(["P1", "P2"])) != workload_hash(table(["P2", "P1"]))
+    assert workload_hash(table(["P1", "P2"])) != workload_hash(table(["P1", "P2"], burst=(3.0, 2.5)))
+
+
+def test_workload_hash_tells_pid_types_apart():
+    assert workload_hash(table([1, 2])) != workload_hash(table(["1", "2"]))
+    assert cache_key(table([1, 2]), "FCFS") != cache_key(table(["1", "2"]), "FCFS")
+
+
+def test_cache_key_normalizes_ignored_parameters():
+    workload = table(["P1", "P2"])
+    assert cache_key(workload, "FCFS", preemptive=True, quantum=2) == cache_key(workload, "FCFS")
+    assert cache_key(workload, "RR", quantum=2) == cache_key(workload, "RR", quantum=2.0)
+    assert cache_key(workload, "RR", quantum=2) != cache_key(workload, "RR", quantum=1)
+
+
+def test_int_and_str_pids_do_not_share_cached_results():
+    cache = ResultCache(None)
+    numbered, _ = cache.schedule(table([1, 2]), "FCFS")
+    named, tier = cache.schedule(table(["1", "2"]), "FCFS")
+    assert tier is None
+    assert named.table.pids == ["1", "2"] and numbered.table.pids == [1, 2]
+
+
+def test_disk_tier_round_trip(tmp_path):
+    workload = table(["P1", "P2"])
+    fresh, tier = ResultCache(str(tmp_path)).schedule(workload, "SJF")
+    assert tier is None
+    cache = ResultCache(str(tmp_path))
+    cached, tier = cache.schedule(workload, "SJF")
+    assert tier == "disk"
+    assert list(cached.segments()) == list(fresh.segments())
+    assert cached.stats() == fresh.stats()
+    assert cache.schedule(workload, "SJF")[1] == "memory"
+
+
+def test_hits_do_not_carry_the_metrics_of_an_earlier_run():
+    cache = ResultCache(None)
+    workload = table(["P1", "P2"])
+    measured, _ = cache.schedule(workload, "RR", quantum=1, metrics=True)
+    assert measured.metrics is not None
+    cached, tier = cache.schedule(workload, "RR", quantum=1)
+    assert tier == "memory" and cached.metrics is None
+    assert list(cached.segments()) == list(measured.segments())
+    assert measured.metrics is not None
+
+
+def test_eviction_scans_only_when_the_tracked_size_overflows(tmp_path, monkeypatch):
+    import scheduler.cache as cache_module
+
+    scans = []
+    scandir = cache_module.os.scandir
+    monkeypatch.setattr(cache_module.os, "scandir", lambda path: scans.append(path) or scandir(path))
+    cache = ResultCache(str(tmp_path), memory_items=0)
+    workloads = [table(["P1", "P2"], burst=(3.0, float(b))) for b in range(1, 9)]
+    cache.schedule(workloads[0], "FCFS")
+    size = cache.disk_bytes
+    assert len(scans) == 1 and size > 0
+    cache.max_bytes = 4 * size
+    for workload in workloads[1:4]:
+        cache.schedule(workload, "FCFS")
+    assert len(scans) == 1 and cache.disk_bytes == 4 * size
+    result, tier = cache.schedule(workloads[0], "FCFS")
+    cache.put(cache_key(workloads[0], "FCFS"), result)
+    assert tier == "disk" and len(scans) == 1 and cache.disk_bytes == 4 * size
+    for workload in workloads[4:]:
+        cache.schedule(workload, "FCFS")
+    assert len(scans) == 5
+    files = sorted(tmp_path.iterdir())
+    assert len(files) == 4 and cache.disk_bytes == sum(f.stat().st_size for f in files) == 4 * size
+    cache.clear()
+    assert cache.disk_bytes == 0 and not list(tmp_path.iterdir())
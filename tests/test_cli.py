@@ -0,0 +1,26 @@
+import os
+import subprocess
+import sys
+
+CLI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Cpu Scheduler")
+
+# Three processes, SJN; the answers to the CLI's prompts.
+ANSWERS = "3\n0\n5\n1\n1\n3\n2\n2\n1\n3\n2\n"
+
+
+def run_cli(home, *args, answers=""):
+    env = {key: value for key, value in os.environ.items() if key not in ("SCHEDULER_CACHE_DIR", "XDG_CACHE_HOME")}
+    env["HOME"] = str(home)
+    return subprocess.run([sys.executable, CLI, *args], input=answers, capture_output=True, text=True, env=env,
+                          check=True)
+
+
+def test_help_does_not_create_the_cache(tmp_path):
+    run_cli(tmp_path, "--help")
+    assert not os.listdir(tmp_path)
+
+
+def test_run_creates_the_cache_on_first_use(tmp_path):
+    done = run_cli(tmp_path, "--no-plot", answers=ANSWERS)
+    assert "P2: AT=1, BT=3, CT=9.0" in done.stdout
+    assert os.listdir(tmp_path / ".cache" / "cpu-scheduler")
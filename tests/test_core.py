@@ -0,0 +1,48 @@
+import pytest
+
+from scheduler import schedule
+from scheduler.stream import stream_schedule
+
+from .exact import non_preemptive, records
+
+# The clock reaches 6.7 as 0.9 + 2.1 + ... in floats, a hair short of the
+# arrival at 6.7: that arrival must still beat the longer job that is waiting.
+DRIFT = records((4.0, 2.1), (6.1, 0.4), (7.8, 1.7), (0.0, 0.9), (6.7, 0.3), (2.5, 2.1))
+
+
+@pytest.mark.parametrize("algorithm, key", [("FCFS", "arrival"), ("SJF", "burst"), ("PP", "priority")])
+def test_non_preemptive_matches_exact_arithmetic(algorithm, key):
+    trace = [dict(record, priority=record["burst"] if key == "priority" else 0) for record in DRIFT]
+    result = schedule(trace, algorithm)
+    expected = non_preemptive(trace, key)
+    assert list(result.completion) == pytest.approx([float(c) for c in expected], abs=1e-9)
+
+
+def test_drifting_clock_still_admits_due_arrival():
+    result = schedule(DRIFT, "SJF")
+    assert [result.table.pids[i] for i in result.order] == ["P3", "P5", "P0", "P4", "P1", "P2"]
+
+
+@pytest.mark.parametrize("trace, quantum, expected", [
+    # A lone process is one dispatch, however many quanta it runs.
+    (records((0, 2)), 0.5, [("P0", 0.0, 2.0)]),
+    (records((1, 4)), 1, [("P0", 1.0, 4.0)]),
+    # The fast path covers the first rounds, single slices the rest.
+    (records((0, 10), (5, 1)), 1, [("P0", 0.0, 5.0), ("P1", 5.0, 1.0), ("P0", 6.0, 5.0)]),
+    (records((0, 3), (1, 1)), 1, [("P0", 0.0, 1.0), ("P1", 1.0, 1.0), ("P0", 2.0, 2.0)]),
+    (records((0, 2), (0, 2)), 0.5, [("P0", 0.0, 0.5), ("P1", 0.5, 0.5), ("P0", 1.0, 0.5), ("P1", 1.5, 0.5),
+                                    ("P0", 2.0, 0.5), ("P1", 2.5, 0.5), ("P0", 3.0, 0.5), ("P1", 3.5, 0.5)]),
+])
+def test_round_robin_segments(trace, quantum, expected):
+    result = schedule(trace, "RR", quantum=quantum)
+    assert list(result.segments()) == expected
+    streamed = [(event["pid"], event["start"], event["duration"])
+                for event in stream_schedule(trace, "RR", quantum=quantum) if event["event"] == "segment"]
+    assert streamed == expected
+
+
+def test_round_robin_metrics_count_real_dispatches():
+    result = schedule(records((0, 10), (5, 1)), "RR", quantum=1, metrics=True)
+    assert result.metrics.dispatches == 3
+    assert result.metrics.preemptions == 1
+    assert result.metrics.context_switches == 2
@@ -0,0 +1,43 @@
+from scheduler.diff import CompletionDeltas, compare_segments
+
+SEGMENTS = [("A", 0.0, 1.0), ("B", 1.0, 2.0), ("A", 3.0, 0.5)]
+
+
+def test_identical_segments():
+    assert compare_segments(iter(SEGMENTS), iter(SEGMENTS)) == (None, 3, 3, 3.5, 3.5)
+
+
+def test_first_divergence_within_tolerance():
+    moved = [("A", 0.0, 1.0), ("B", 1.25, 2.0), ("A", 3.25, 0.5)]
+    assert compare_segments(SEGMENTS, moved) == ((1, ("B", 1.0, 2.0), ("B", 1.25, 2.0)), 3, 3, 3.5, 3.75)
+    assert compare_segments(SEGMENTS, moved, tolerance=0.25) == (None, 3, 3, 3.5, 3.75)
+
+
+def test_first_divergence_on_pid_and_length():
+    swapped = [("A", 0.0, 1.0), ("C", 1.0, 2.0), ("A", 3.0, 0.5)]
+    assert compare_segments(SEGMENTS, swapped)[0] == (1, ("B", 1.0, 2.0), ("C", 1.0, 2.0))
+    assert compare_segments(SEGMENTS, SEGMENTS[:2]) == ((2, ("A", 3.0, 0.5), None), 3, 2, 3.5, 3.0)
+    assert compare_segments([], SEGMENTS[:1]) == ((0, None, ("A", 0.0, 1.0)), 0, 1, 0.0, 1.0)
+
+
+def test_completion_deltas_join_out_of_order_pids():
+    deltas = CompletionDeltas()
+    deltas.feed(("P1", 0.0, 2.0, 2.0), ("P2", 0.0, 1.0, 1.0))
+    assert (dict(deltas.only_a), dict(deltas.only_b)) == ({"P1": ("P1", 0.0, 2.0, 2.0)}, {"P2": ("P2", 0.0, 1.0, 1.0)})
+    deltas.feed(("P2", 0.0, 1.0, 3.0), ("P1", 0.0, 2.0, 3.0))
+    assert (deltas.only_a, deltas.only_b) == ({}, {})
+    assert (deltas.matched, deltas.changed, deltas.inputs_changed) == (2, 2, 0)
+    assert deltas.waiting == [2.0, 1.0]
+    assert (deltas.waiting_delta, deltas.largest_delta) == (-1.0, 2.0)
+    assert sorted(deltas.top, reverse=True) == [(2.0, "P2", -2.0, -2.0), (1.0, "P1", 1.0, 1.0)]
+    assert not deltas.identical
+
+
+def test_completion_deltas_unmatched_and_changed_inputs():
+    deltas = CompletionDeltas(tolerance=0.5)
+    deltas.feed(("P1", 0.0, 2.0, 2.25), ("P1", 0.0, 2.0, 2.0))
+    assert deltas.identical
+    deltas.feed(("P2", 1.0, 1.0, 3.0), ("P2", 1.0, 1.75, 3.5))
+    assert (deltas.inputs_changed, deltas.changed) == (1, 0)
+    deltas.feed(("P3", 0.0, 1.0, 5.0), None)
+    assert list(deltas.only_a) == ["P3"] and not deltas.identical
@@ -0,0 +1,55 @@
+"""The streaming and vectorized engines against :func:`scheduler.schedule`."""
+
+import pytest
+
+from scheduler import schedule
+from scheduler.stream import stream_schedule
+
+from .test_smp import random_table
+
+SEEDS = range(100)
+STREAMED = [("FCFS", False, None), ("SJF", False, None), ("SJF", True, None), ("PP", False, None),
+            ("PP", True, None), ("RR", False, 0.5), ("RR", False, 2)]
+
+
+def arrival_ordered(seed):
+    table = random_table(seed)
+    return [table.record(i) for i in table.arrival_order()]
+
+
+def completions(result):
+    return {result.table.pids[i]: result.completion[i] for i in result.order}
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("algorithm, preemptive, quantum", STREAMED)
+def test_stream_matches_schedule(seed, algorithm, preemptive, quantum):
+    trace = arrival_ordered(seed)
+    result = schedule(trace, algorithm, preemptive, quantum)
+    events = list(stream_schedule(trace, algorithm, preemptive, quantum))
+    segments = [(event["pid"], event["start"], event["duration"]) for event in events if event["event"] == "segment"]
+    expected = list(result.segments())
+    assert [pid for pid, _, _ in segments] == [pid for pid, _, _ in expected]
+    assert [(start, duration) for _, start, duration in segments] == pytest.approx(
+        [(start, duration) for _, start, duration in expected], abs=1e-9)
+    done = {event["pid"]: event["completion"] for event in events if event["event"] == "completed"}
+    assert list(done) == list(completions(result))
+    assert done == pytest.approx(completions(result), abs=1e-9)
+
+
+@pytest.mark.parametrize("algorithm, preemptive", [("FCFS", False), ("SJF", False), ("PP", False),
+                                                   ("SJF", True), ("RR", False)])
+def test_batch_matches_schedule(algorithm, preemptive):
+    np = pytest.importorskip("numpy")
+    from scheduler.batch import evaluate
+
+    tables = [random_table(seed) for seed in SEEDS]
+    width = max(len(table) for table in tables)
+    tables = [table for table in tables if len(table) == width]
+    arrivals = np.array([list(table.arrival) for table in tables])
+    bursts = np.array([list(table.burst) for table in tables])
+    priorities = np.array([list(table.priority) for table in tables], dtype=float)
+    batch = evaluate(arrivals, bursts, algorithm, priorities, preemptive, quantum=1.5)
+    for row, table in enumerate(tables):
+        result = schedule(table, algorithm, preemptive, 1.5)
+        assert list(batch.completion[row]) == pytest.approx(list(result.completion), abs=1e-9)
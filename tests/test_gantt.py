@@ -0,0 +1,53 @@
+from scheduler import gantt
+from scheduler.gantt import GanttIndex, with_overhead
+from scheduler.table import Timeline
+
+
+def timeline(rows):
+    result = Timeline()
+    for i, start, duration in rows:
+        result.append(i, start, duration)
+    return result
+
+
+# Process 0 runs twice back to back, then 1, then 0 again after an idle gap.
+ROWS = [(0, 0.0, 1.0), (0, 1.0, 1.0), (1, 2.0, 0.5), (0, 3.0, 1.0)]
+
+
+def test_back_to_back_slices_are_coalesced():
+    index = GanttIndex(timeline(ROWS))
+    assert len(index.levels) == 1
+    assert (index.begin, index.end) == (0.0, 4.0)
+    assert index.blocks(0.0, 4.0, 1000) == [(0.0, 2.0, 0, False), (2.0, 2.5, 1, False), (3.0, 4.0, 0, False)]
+
+
+def test_window_returns_only_overlapping_blocks():
+    index = GanttIndex(timeline(ROWS))
+    assert index.blocks(2.2, 2.8, 100) == [(2.0, 2.5, 1, False)]
+    assert index.blocks(1.5, 3.5, 100) == [(0.0, 2.0, 0, False), (2.0, 2.5, 1, False), (3.0, 4.0, 0, False)]
+    assert index.blocks(2.5, 3.0, 100) == []
+    assert index.blocks(5.0, 6.0, 100) == []
+
+
+def test_coarse_views_fold_blocks_into_the_longest_process(monkeypatch):
+    monkeypatch.setattr(gantt, "MIN_LEVEL_BLOCKS", 1)
+    index = GanttIndex(timeline(ROWS))
+    assert [level.resolution for level in index.levels[-2:]] == [2.0, 4.0]
+    assert index.blocks(0.0, 4.0, 1000) == [(0.0, 2.0, 0, False), (2.0, 2.5, 1, False), (3.0, 4.0, 0, False)]
+    assert index.blocks(0.0, 4.0, 2) == [(0.0, 2.0, 0, False), (2.0, 4.0, 0, True)]
+    assert index.blocks(0.0, 4.0, 1) == [(0.0, 4.0, 0, True)]
+
+
+def test_empty_timeline():
+    index = GanttIndex(Timeline())
+    assert (index.begin, index.end) == (0.0, 0.0)
+    assert index.blocks(0.0, 1.0, 100) == []
+
+
+def test_overhead_lanes_are_interleaved_with_inverted_indices():
+    execution = timeline([(0, 0.5, 1.0), (1, 2.0, 1.0)])
+    overhead = timeline([(0, 0.0, 0.5), (1, 1.5, 0.5)])
+    merged = with_overhead(execution, overhead)
+    assert list(zip(merged.index, merged.start, merged.duration)) == [
+        (-1, 0.0, 0.5), (0, 0.5, 1.0), (-2, 1.5, 0.5), (1, 2.0, 1.0)]
+    assert list(with_overhead(execution, Timeline()).index) == [0, 1]
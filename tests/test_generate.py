@@ -0,0 +1,39 @@
+import pytest
+
+from scheduler import schedule
+from scheduler.generate import GENERATORS, generate_records
+from scheduler.manifest import replay, run_manifest
+
+
+def columns(table):
+    return list(table.pids), list(table.arrival), list(table.burst), list(table.priority)
+
+
+@pytest.mark.parametrize("name", GENERATORS)
+def test_same_seed_same_workload(name):
+    assert columns(GENERATORS[name](200, seed=5)) == columns(GENERATORS[name](200, seed=5))
+    assert columns(GENERATORS[name](200, seed=5)) != columns(GENERATORS[name](200, seed=6))
+
+
+@pytest.mark.parametrize("name", GENERATORS)
+def test_records_do_not_depend_on_the_chunk_size(name):
+    records = list(generate_records(name, 300, seed=1, chunk=7))
+    assert records == list(generate_records(name, 300, seed=1))
+    assert [record["pid"] for record in records] == list(range(300))
+    assert all(a["arrival"] <= b["arrival"] for a, b in zip(records, records[1:]))
+
+
+def test_replay_rebuilds_a_generated_workload():
+    generator = {"name": "heavy_tailed", "n": 60, "seed": 4}
+    table = GENERATORS["heavy_tailed"](60, seed=4)
+    run = run_manifest(schedule(table, "RR", quantum=2.0, switch_cost=0.1, warmup=0.5), switch_cost=0.1,
+                       warmup=0.5, generator=generator)
+    assert replay(run) == run
+
+
+@pytest.mark.parametrize("name, options", [("uniform", {}), ("heavy_tailed", {"alpha": 2.5}), ("bursty", {}),
+                                           ("bursty", {"mean_cluster": 3}), ("equal_priorities", {})])
+def test_tables_and_records_hold_the_same_processes(name, options):
+    table = GENERATORS[name](500, seed=9, load=0.7, **options)
+    records = list(generate_records(name, 500, seed=9, load=0.7, chunk=64, **options))
+    assert [table.record(i) for i in range(len(table))] == records
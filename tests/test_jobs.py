@@ -0,0 +1,88 @@
+import time
+
+import pytest
+
+import scheduler.jobs as jobs
+from scheduler import SMPResult, schedule
+from scheduler.cache import ResultCache
+from scheduler.generate import GENERATORS
+from scheduler.jobs import SimulationJob
+
+from .test_smp import random_table
+
+
+def finish(job):
+    job.start()
+    job._thread.join(timeout=30)
+    assert not job.running()
+    return job.poll()
+
+
+@pytest.mark.parametrize("algorithm, preemptive, quantum", [("FCFS", False, None), ("SJF", True, None),
+                                                            ("PP", False, None), ("RR", False, 1.5)])
+def test_streamed_job_posts_the_schedule_as_it_goes(monkeypatch, algorithm, preemptive, quantum):
+    monkeypatch.setattr(jobs, "FLUSH_INTERVAL", 0.0)
+    table = random_table(21)
+    job = SimulationJob(table.copy(), algorithm, preemptive, quantum)
+    assert job.streamed
+    messages = finish(job)
+    kind, result, cached = messages[-1]
+    assert (kind, cached) == ("done", None)
+    expected = schedule(table, algorithm, preemptive, quantum)
+    segments = [segment for message in messages if message[0] == "segments" for segment in message[1]]
+    completed = [done for message in messages if message[0] == "completed" for done in message[1]]
+    assert len(messages) > 3
+    assert [i for i, _, _ in segments] == list(expected.timeline.index)
+    assert [start for _, start, _ in segments] == pytest.approx(list(expected.timeline.start), abs=1e-9)
+    assert [i for i, _ in completed] == list(expected.order)
+    assert list(result.completion) == pytest.approx(list(expected.completion), abs=1e-9)
+    assert job.manifest["algorithm"] == algorithm and job.manifest["schedule"]
+
+
+def test_other_runs_post_only_their_outcome():
+    table = random_table(22)
+    job = SimulationJob(table, "MLFQ", quantum=1.0, metrics=True)
+    assert not job.streamed
+    [(kind, result, cached)] = finish(job)
+    assert kind == "done" and cached is None and result.metrics is not None
+    [(kind, result, cached)] = finish(SimulationJob(table, "SJF", cores=3))
+    assert kind == "done" and isinstance(result, SMPResult) and result.cores == 3
+
+
+@pytest.mark.parametrize("algorithm, quantum", [("RR", 1.0), ("HRRN", None)])
+def test_cancelled_job_posts_only_cancelled(algorithm, quantum):
+    job = SimulationJob(random_table(23), algorithm, quantum=quantum)
+    job.cancel()
+    assert job.cancelled
+    assert finish(job) == [("cancelled",)]
+
+
+def test_streamed_job_stops_soon_after_a_cancel(monkeypatch):
+    monkeypatch.setattr(jobs, "FLUSH_INTERVAL", 0.0)
+    table = GENERATORS["uniform"](50000, seed=1)
+    job = SimulationJob(table, "RR", quantum=1.0).start()
+    messages = []
+    while not any(message[0] == "completed" for message in messages):
+        messages.extend(job.poll())
+        time.sleep(0.001)
+    job.cancel()
+    job._thread.join(timeout=30)
+    messages.extend(job.poll())
+    assert messages[-1] == ("cancelled",)
+    assert sum(len(message[1]) for message in messages if message[0] == "completed") < len(table)
+
+
+def test_failed_job_posts_the_error():
+    [(kind, error)] = finish(SimulationJob(random_table(24), "RR"))
+    assert kind == "failed" and isinstance(error, ValueError)
+
+
+def test_cache_hit_skips_the_run():
+    cache = ResultCache(None)
+    table = random_table(25)
+    first = finish(SimulationJob(table.copy(), "RR", quantum=2.0, cache=cache))
+    assert first[-1][0] == "done" and first[-1][2] is None
+    second = finish(SimulationJob(table.copy(), "RR", quantum=2.0, cache=cache))
+    [(kind, result, cached)] = second
+    assert (kind, cached) == ("done", "memory")
+    assert list(result.segments()) == list(first[-1][1].segments())
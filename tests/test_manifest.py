@@ -0,0 +1,61 @@
+from array import array
+
+import pytest
+
+import scheduler.manifest as manifest_module
+from scheduler import ENGINE_VERSION, schedule, schedule_smp
+from scheduler.generate import GENERATORS
+from scheduler.manifest import replay, run_manifest, schedule_digest
+from scheduler.store import load_result, read_manifest, save_result
+
+from .exact import records
+from .test_smp import random_table
+
+
+@pytest.mark.parametrize("algorithm, preemptive, quantum, switch_cost", [
+    ("FCFS", False, None, 0.0), ("PP", True, None, 0.0), ("RR", False, 1.5, 0.25)])
+def test_manifest_travels_with_the_result_file(tmp_path, algorithm, preemptive, quantum, switch_cost):
+    result = schedule(random_table(7), algorithm, preemptive, quantum, switch_cost=switch_cost)
+    run = run_manifest(result, switch_cost=switch_cost)
+    path = tmp_path / "run.sres"
+    save_result(result, path, run)
+    assert read_manifest(path) == run
+    assert schedule_digest(load_result(path)) == schedule_digest(result) == run["schedule"]
+
+
+def test_result_file_without_manifest(tmp_path):
+    path = tmp_path / "run.sres"
+    save_result(schedule(random_table(3), "SJF"), path)
+    assert read_manifest(path) is None
+
+
+def test_replay_with_a_given_workload():
+    table = random_table(11)
+    run = run_manifest(schedule(table, "SJF", True))
+    assert replay(run, table) == run
+    assert replay(run, random_table(12))["schedule"] != run["schedule"]
+    with pytest.raises(ValueError):
+        replay(run)
+
+
+def test_replay_multi_cpu_options():
+    table = GENERATORS["uniform"](80, seed=2)
+    run = run_manifest(schedule_smp(table, "PP", 3, True, queues="global"), queues="global")
+    assert run["cores"] == 3
+    assert replay(run, table) == run
+
+
+def test_example_shows_the_current_engine_version():
+    assert f'"engine_version": {ENGINE_VERSION},' in manifest_module.__doc__
+
+
+def test_multi_cpu_digest_covers_the_core():
+    table = random_table(4)
+    result = schedule_smp(table, "FCFS", 2, queues="global")
+    swapped = schedule_smp(table, "FCFS", 2, queues="global")
+    swapped.segment_core = array("l", (1 - core for core in swapped.segment_core))
+    assert list(swapped.segments()) == list(result.segments())
+    assert schedule_digest(swapped) != schedule_digest(result)
+    # On one CPU there is no core to record, so the digest is schedule()'s.
+    trace = records((0, 3), (1, 1), (1, 2), (5, 1))
+    assert schedule_digest(schedule_smp(trace, "SJF", 1)) == schedule_digest(schedule(trace, "SJF"))
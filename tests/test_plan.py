@@ -0,0 +1,130 @@
+from math import ceil
+
+import pytest
+
+from scheduler import schedule, schedule_smp
+from scheduler.plan import (POLICIES, Workload, _events, _stream_shared, search_cores, search_policy, search_quantum,
+                            trial)
+from scheduler.stream import _Arrivals
+
+from .exact import records
+from .test_equivalence import SEEDS, arrival_ordered, completions
+
+
+def waiting_times(trace, algorithm, quantum, cores):
+    return {event["pid"]: event["waiting"] for event in _events(trace, algorithm, False, quantum, cores)
+            if event["event"] == "completed"}
+
+
+def test_cpus_pick_in_schedule_smp_order_at_one_instant():
+    # At 1.0 CPU 1 completes P1 while CPU 0 has slept since 0.5, so CPU 1
+    # picks first.  At 2.0 P2's quantum ends on CPU 1 as CPU 0 completes P3:
+    # CPU 1 picks first again and takes P4, and CPU 0 continues P2.
+    trace = records((0, 0.5), (0, 1), (1, 3), (1, 1), (1, 1))
+    segments = [(event["pid"], event["core"], event["start"]) for event in _events(trace, "RR", False, 1.0, 2)
+                if event["event"] == "segment"]
+    assert segments == [("P0", 0, 0.0), ("P1", 1, 0.0), ("P2", 1, 1.0), ("P3", 0, 1.0), ("P4", 1, 2.0),
+                        ("P2", 0, 2.0), ("P2", 0, 3.0)]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("cores", [2, 3])
+@pytest.mark.parametrize("algorithm, quantum", [("FCFS", None), ("SJF", None), ("PP", None), ("RR", 1.0)])
+def test_shared_queue_matches_global_smp(seed, cores, algorithm, quantum):
+    trace = arrival_ordered(seed)
+    result = schedule_smp(trace, algorithm, cores, quantum=quantum, queues="global")
+    arrival = {record["pid"]: record["arrival"] for record in trace}
+    burst = {record["pid"]: record["burst"] for record in trace}
+    expected = {pid: completion - arrival[pid] - burst[pid] for pid, completion in completions(result).items()}
+    assert waiting_times(trace, algorithm, quantum, cores) == pytest.approx(expected, abs=1e-9)
+
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("algorithm, quantum", [("FCFS", None), ("SJF", None), ("PP", None), ("RR", 1.0)])
+def test_shared_queue_on_one_cpu_matches_schedule(seed, algorithm, quantum):
+    trace = arrival_ordered(seed)
+    key = {"SJF": "burst", "PP": "priority"}.get(algorithm)
+    done = {event["pid"]: event["completion"] for event in _stream_shared(_Arrivals(trace), key, quantum, 1)
+            if event["event"] == "completed"}
+    assert done == pytest.approx(completions(schedule(trace, algorithm, quantum=quantum)), abs=1e-9)
+
+
+def brute_force(workload, target, algorithm, preemptive=False, quantum=None, cores=1, quantile=0.99):
+    """``(met, switches)`` from a full simulation by the table engines."""
+    table = list(workload.records())
+    if cores == 1:
+        result = schedule(table, algorithm, preemptive, quantum)
+    else:
+        result = schedule_smp(table, algorithm, cores, quantum=quantum, queues="global")
+    late = sum(result.completion[i] - record["arrival"] - record["burst"] > target + 1e-9
+               for i, record in enumerate(table))
+    lanes = result.lanes() if cores > 1 else [result.timeline]
+    # Round Robin runs are one segment per dispatch, so every segment is a switch.
+    switches = sum(sum(1 for k in range(len(lane)) if k == 0 or lane.index[k] != lane.index[k - 1])
+                   for lane in lanes)
+    return late <= len(table) - ceil(quantile * len(table)), switches
+
+
+@pytest.mark.parametrize("target", [5, 20, 60])
+@pytest.mark.parametrize("algorithm, quantum", [("FCFS", None), ("SJF", None), ("RR", 2.0)])
+def test_core_search_matches_a_linear_scan(target, algorithm, quantum):
+    workload = Workload("uniform", 300, seed=3, load=2.5)
+    best, trials = search_cores(workload, target, algorithm, quantum=quantum, max_cores=8)
+    scan = [cores for cores in range(1, 9) if brute_force(workload, target, algorithm, quantum=quantum,
+                                                          cores=cores)[0]]
+    assert (best.cores if best else None) == (scan[0] if scan else None)
+    for attempt in trials:
+        assert attempt.met == (attempt.cores in scan)
+        if not attempt.met:
+            # A missed trial stops at the first process too many over the target.
+            assert attempt.late == workload.n - ceil(0.99 * workload.n) + 1
+
+
+@pytest.mark.parametrize("seed, load, target", [(0, 0.6, 20), (0, 0.8, 40), (2, 0.6, 10)])
+def test_quantum_search_matches_a_linear_scan(seed, load, target):
+    # With the range 1..17 and resolution 1, every quantum the bisection
+    # tries is a whole number, so scanning the whole numbers covers them all.
+    workload = Workload("heavy_tailed", 300, seed=seed, load=load)
+    best, trials = search_quantum(workload, target, 1.0, 17.0, resolution=1, quantile=0.9)
+    met = {quantum: brute_force(workload, target, "RR", quantum=float(quantum), quantile=0.9)[0]
+           for quantum in range(1, 18)}
+    # The scan confirms the search's assumption: the quanta that meet the target reach low.
+    assert list(met.values()) == sorted(met.values(), reverse=True)
+    assert best.quantum == max(quantum for quantum, ok in met.items() if ok)
+    for attempt in trials:
+        assert attempt.met == met[attempt.quantum]
+    assert len(trials) <= 7
+
+
+@pytest.mark.parametrize("load, target", [(0.5, 40), (0.7, 80), (0.7, 20)])
+def test_policy_search_matches_a_linear_scan(load, target):
+    workload = Workload("uniform", 300, seed=3, load=load)
+    best, trials = search_policy(workload, target, quantum=2.0)
+    scan = {(algorithm, preemptive): brute_force(workload, target, algorithm, preemptive, 2.0)
+            for algorithm, preemptive in POLICIES}
+    cheapest = min((switches for met, switches in scan.values() if met), default=None)
+    assert (best.switches if best else None) == cheapest
+    if best:
+        assert scan[best.algorithm, best.preemptive] == (True, cheapest)
+    for attempt in trials:
+        met, switches = scan[attempt.algorithm, attempt.preemptive or attempt.algorithm == "RR"]
+        if attempt.outcome == "pruned":
+            # Stopped once it had switched more often than the best so far,
+            # which the full run would have done too.
+            assert switches >= attempt.switches > cheapest_before(trials, attempt)
+        else:
+            assert attempt.met == met
+
+
+def cheapest_before(trials, attempt):
+    return min(t.switches for t in trials[:trials.index(attempt)] if t.met)
+
+
+def test_trials_stop_early():
+    workload = Workload("uniform", 300, seed=3, load=2.5)
+    missed = trial(workload, 1, "FCFS")
+    assert missed.outcome == "missed" and missed.late == workload.n - ceil(0.99 * workload.n) + 1
+    assert missed.completed < workload.n
+    pruned = trial(workload, 1000, "RR", quantum=0.5, max_switches=50)
+    assert pruned.outcome == "pruned" and pruned.switches == 51 and pruned.completed < workload.n
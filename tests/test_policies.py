@@ -0,0 +1,100 @@
+"""Hand-checked traces for the MLFQ, CFS, HRRN and aging schedulers."""
+
+import pytest
+
+from scheduler import schedule
+
+
+def process(pid, arrival, burst, priority=0):
+    return {"pid": pid, "arrival": arrival, "burst": burst, "priority": priority}
+
+
+def segments(result):
+    return [(pid, pytest.approx(start), pytest.approx(duration)) for pid, start, duration in result.segments()]
+
+
+def completions(result):
+    return {record["pid"]: pytest.approx(record["completion"]) for record in result.completed}
+
+
+def order(result):
+    return [result.table.pids[i] for i in result.order]
+
+
+def test_mlfq_demotes_and_lets_newcomers_preempt_lower_levels():
+    # Slices are 1, 2 and 4.  P2 arrives while P0 runs on level 1 and
+    # preempts it; P0 resumes at the head of level 1 with 1.5 of its slice left.
+    result = schedule([process("P0", 0, 4), process("P1", 1, 2), process("P2", 2.5, 0.5)], "MLFQ", quantum=1)
+    assert segments(result) == [("P0", 0, 1), ("P1", 1, 1), ("P0", 2, 0.5), ("P2", 2.5, 0.5), ("P0", 3, 1.5),
+                                ("P1", 4.5, 1), ("P0", 5.5, 1)]
+    assert completions(result) == {"P2": 3, "P1": 5.5, "P0": 6.5}
+
+
+def test_mlfq_lone_process_keeps_one_segment_through_demotions():
+    result = schedule([process("P0", 0, 10)], "MLFQ", quantum=1)
+    assert list(result.segments()) == [("P0", 0.0, 10.0)]
+
+
+def test_cfs_alternates_equal_weights():
+    result = schedule([process("P0", 0, 3), process("P1", 0, 3)], "CFS", quantum=1)
+    assert segments(result) == [("P0", 0, 1), ("P1", 1, 1), ("P0", 2, 1), ("P1", 3, 1), ("P0", 4, 1),
+                                ("P1", 5, 1)]
+    assert completions(result) == {"P0": 5, "P1": 6}
+
+
+def test_cfs_weights_by_nice_like_priority():
+    # P1's virtual runtime grows 1.25**4 times faster, so after one slice
+    # each P0 may run two slices in a row and finishes first.
+    result = schedule([process("P0", 0, 3, 0), process("P1", 0, 3, 4)], "CFS", quantum=1)
+    assert segments(result) == [("P0", 0, 1), ("P1", 1, 1), ("P0", 2, 2), ("P1", 4, 2)]
+    assert completions(result) == {"P0": 4, "P1": 6}
+
+
+def test_cfs_newcomer_starts_at_the_minimum_virtual_runtime():
+    # P1 arrives late but is not owed the time P0 ran alone.
+    result = schedule([process("P0", 0, 6), process("P1", 4, 2)], "CFS", quantum=1)
+    assert segments(result) == [("P0", 0, 4), ("P1", 4, 1), ("P0", 5, 1), ("P1", 6, 1), ("P0", 7, 1)]
+
+
+def test_hrrn_prefers_a_long_wait_over_a_short_burst():
+    # At t=10, P1 has ratio (9 + 3) / 3 = 4 and P2 has (1 + 1) / 1 = 2.
+    result = schedule([process("P0", 0, 10), process("P1", 1, 3), process("P2", 9, 1)], "HRRN")
+    assert order(result) == ["P0", "P1", "P2"]
+    assert completions(result) == {"P0": 10, "P1": 13, "P2": 14}
+
+
+def test_hrrn_picks_highest_ratio_each_dispatch():
+    result = schedule([process("P0", 0, 3), process("P1", 1, 6), process("P2", 2, 2), process("P3", 4, 1)], "HRRN")
+    assert order(result) == ["P0", "P2", "P3", "P1"]
+    assert completions(result) == {"P0": 3, "P2": 5, "P3": 6, "P1": 12}
+
+
+def test_hrrn_ratio_tie_goes_to_the_shorter_burst():
+    # At t=3 both ratios are 1.5: (2 + 4) / 4 and (1 + 2) / 2.
+    result = schedule([process("P0", 0, 3), process("P1", 1, 4), process("P2", 2, 2)], "HRRN")
+    assert order(result) == ["P0", "P2", "P1"]
+
+
+def test_aging_lets_a_long_wait_beat_a_better_priority():
+    # At t=4, P1 has aged to 2 - 3.5 = -1.5 and P2 only to 0 - 1 = -1.
+    trace = [process("P0", 0, 4), process("P1", 0.5, 1, 2), process("P2", 3, 1, 0)]
+    assert order(schedule(trace, "AGING", quantum=1)) == ["P0", "P1", "P2"]
+    assert order(schedule(trace, "PP")) == ["P0", "P2", "P1"]
+
+
+@pytest.mark.parametrize("interval, early, late", [
+    (1.0, process("P0", 6.2, 1, 0), process("P7", 9.2, 1, -3)),
+    (3.0, process("P6", 1, 1, 0), process("P7", 4, 1, -1)),
+])
+def test_aging_equal_effective_priority_goes_to_earlier_arrival(interval, early, late):
+    # The runner keeps the CPU until both have aged to the same effective
+    # priority; float division must not decide the tie.
+    runner = process("R", 0, late["arrival"] + 0.8)
+    result = schedule([runner, late, early], "AGING", quantum=interval)
+    assert order(result) == ["R", early["pid"], late["pid"]]
+
+
+def test_preemptive_aging_requeues_with_the_priority_it_reached():
+    result = schedule([process("P0", 0, 5, 5), process("P1", 1, 1, 0)], "AGING", preemptive=True, quantum=1)
+    assert segments(result) == [("P0", 0, 1), ("P1", 1, 1), ("P0", 2, 4)]
+    assert completions(result) == {"P1": 2, "P0": 6}
@@ -0,0 +1,168 @@
+import random
+
+import pytest
+
+from scheduler import ProcessTable, schedule
+from scheduler.smp import SMP_ALGORITHMS, QUEUES, schedule_smp
+
+from .test_core import DRIFT
+
+CONFIGS = [(algorithm, preemptive) for algorithm in SMP_ALGORITHMS
+           for preemptive in ((False, True) if algorithm in ("SJF", "PP") else (False,))]
+
+
+def random_table(seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 12)
+    # A mix of round and arbitrary values, so both exact ties and float drift occur.
+    return ProcessTable.from_sequences(
+        [f"P{k}" for k in range(n)],
+        [rng.choice([0, 1, 2.5, round(rng.uniform(0, 20), 1), rng.uniform(0, 20)]) for _ in range(n)],
+        [rng.choice([1, 2, round(rng.uniform(0.1, 6), 1), rng.uniform(0.1, 6)]) for _ in range(n)],
+        [rng.randint(-3, 3) for _ in range(n)])
+
+
+def assert_same_schedule(expected, actual):
+    assert list(actual.order) == list(expected.order)
+    assert list(actual.completion) == pytest.approx(list(expected.completion), abs=1e-9)
+    assert list(actual.timeline.index) == list(expected.timeline.index)
+    assert list(actual.timeline.start) == pytest.approx(list(expected.timeline.start), abs=1e-9)
+    assert list(actual.timeline.duration) == pytest.approx(list(expected.timeline.duration), abs=1e-9)
+
+
+@pytest.mark.parametrize("queues", QUEUES)
+@pytest.mark.parametrize("algorithm, preemptive", CONFIGS)
+def test_one_core_reproduces_schedule(algorithm, preemptive, queues):
+    for seed in range(150):
+        table = random_table(seed)
+        quantum = random.Random(seed).choice([0.3, 0.5, 1, 2.5]) if algorithm == "RR" else None
+        assert_same_schedule(schedule(table, algorithm, preemptive, quantum),
+                             schedule_smp(table, algorithm, 1, preemptive, quantum, queues=queues))
+
+
+@pytest.mark.parametrize("algorithm, preemptive", CONFIGS)
+def test_one_core_reproduces_schedule_on_drifting_clock(algorithm, preemptive):
+    quantum = 0.5 if algorithm == "RR" else None
+    assert_same_schedule(schedule(DRIFT, algorithm, preemptive, quantum),
+                         schedule_smp(DRIFT, algorithm, 1, preemptive, quantum))
+
+
+def test_global_queue_uses_every_core():
+    result = schedule_smp([{"pid": f"P{k}", "arrival": 0, "burst": 2, "priority": 0} for k in range(4)],
+                          "FCFS", 2, queues="global")
+    assert sorted(result.completion) == [2.0, 2.0, 4.0, 4.0]
+    assert result.busy() == [4.0, 4.0]
+
+
+@pytest.mark.parametrize("algorithm", ["SJF", "PP"])
+def test_periodic_balancing_steps_past_a_tick_it_lands_on(algorithm):
+    # Tick 24 falls at 24 * 0.7 = 16.799999999999997, and that divided by 0.7 is
+    # 23.999999999999996: flooring it gives back the same tick.
+    result = schedule_smp([{"pid": 13, "arrival": 12.0, "burst": 6.0, "priority": 0},
+                           {"pid": 14, "arrival": 14.4, "burst": 4.2, "priority": -1},
+                           {"pid": 15, "arrival": 14.0, "burst": 4.683, "priority": -3}],
+                          algorithm, 2, True, queues="per-core", balance="periodic", interval=0.7)
+    assert sorted(result.table.pids[i] for i in result.order) == [13, 14, 15]
+
+
+def assert_consistent(result, affinity=None):
+    """Work is conserved, no core runs two things at once, no process runs on two
+    cores at once, and pinned processes stay on their core."""
+    table = result.table
+    ran = [0.0] * len(table)
+    spans = [[] for _ in range(len(table))]
+    for core, (lane, overhead) in enumerate(zip(result.lanes(), result.overhead_lanes())):
+        busy = sorted([(start, start + duration) for start, duration in zip(lane.start, lane.duration)]
+                      + [(start, start + duration) for start, duration in zip(overhead.start, overhead.duration)])
+        for (_, end), (start, _) in zip(busy, busy[1:]):
+            assert start >= end - 1e-9
+        for i, start, duration in zip(lane.index, lane.start, lane.duration):
+            assert duration > 0 and start >= table.arrival[i] - 1e-9
+            assert affinity is None or affinity[i] in (-1, core)
+            ran[i] += duration
+            spans[i].append((start, start + duration))
+    assert ran == pytest.approx(list(table.burst), abs=1e-9)
+    assert sorted(result.order) == list(range(len(table)))
+    for i, intervals in enumerate(spans):
+        intervals.sort()
+        for (_, end), (start, _) in zip(intervals, intervals[1:]):
+            assert start >= end - 1e-9
+        assert result.completion[i] == pytest.approx(intervals[-1][1], abs=1e-9)
+
+
+MULTI = [("per-core", "steal"), ("per-core", "periodic"), ("per-core", None), ("global", None)]
+
+
+@pytest.mark.parametrize("queues, balance", MULTI)
+@pytest.mark.parametrize("algorithm, preemptive", CONFIGS)
+def test_multi_core_schedules_are_consistent(algorithm, preemptive, queues, balance):
+    for seed in range(60):
+        rng = random.Random(seed)
+        table = random_table(seed)
+        cores = rng.randint(2, 4)
+        quantum = rng.choice([0.3, 1, 2.5]) if algorithm == "RR" else None
+        interval = rng.choice([0.7, 1, 3]) if balance == "periodic" else None
+        assert_consistent(schedule_smp(table, algorithm, cores, preemptive, quantum, queues, balance, interval))
+
+
+@pytest.mark.parametrize("queues, balance", MULTI)
+@pytest.mark.parametrize("algorithm, preemptive", CONFIGS)
+def test_pinned_processes_stay_on_their_core(algorithm, preemptive, queues, balance):
+    for seed in range(60):
+        rng = random.Random(seed)
+        table = random_table(seed)
+        cores = rng.randint(2, 4)
+        affinity = [rng.choice([-1, -1, rng.randrange(cores)]) for _ in range(len(table))]
+        quantum = 1 if algorithm == "RR" else None
+        interval = 0.7 if balance == "periodic" else None
+        result = schedule_smp(table, algorithm, cores, preemptive, quantum, queues, balance, interval, affinity)
+        assert_consistent(result, affinity)
+
+
+@pytest.mark.parametrize("queues", QUEUES)
+@pytest.mark.parametrize("algorithm, preemptive", CONFIGS)
+def test_switching_costs_keep_schedules_consistent(algorithm, preemptive, queues):
+    for seed in range(60):
+        rng = random.Random(seed)
+        table = random_table(seed)
+        quantum = 1 if algorithm == "RR" else None
+        result = schedule_smp(table, algorithm, rng.randint(2, 4), preemptive, quantum, queues,
+                              switch_cost=rng.choice([0.0, 0.1, 0.5]), warmup=rng.choice([0.0, 0.2]))
+        assert_consistent(result)
+
+
+def placements(result):
+    pids = result.table.pids
+    return [(pids[i], core, start) for i, core, start in zip(result.timeline.index, result.segment_core,
+                                                             result.timeline.start)]
+
+
+@pytest.mark.parametrize("balance, expected", [
+    # P3 joins core 1's queue behind the long P1.  Stealing moves it to
+    # core 0 as soon as that core runs dry at 4; periodic balancing at the
+    # next tick after that, 6; without balancing it waits for P1.
+    ("steal", [("P0", 0, 0.0), ("P2", 0, 1.0), ("P3", 0, 4.0), ("P1", 1, 0.0)]),
+    ("periodic", [("P0", 0, 0.0), ("P2", 0, 1.0), ("P3", 0, 6.0), ("P1", 1, 0.0)]),
+    (None, [("P0", 0, 0.0), ("P2", 0, 1.0), ("P1", 1, 0.0), ("P3", 1, 10.0)]),
+])
+def test_balancing_moves_waiting_work_to_an_idle_core(balance, expected):
+    records = [{"pid": f"P{k}", "arrival": arrival, "burst": burst, "priority": 0}
+               for k, (arrival, burst) in enumerate([(0, 1), (0, 10), (0.5, 3), (0.5, 3)])]
+    result = schedule_smp(records, "FCFS", 2, balance=balance, interval=2 if balance == "periodic" else None)
+    assert placements(result) == expected
+
+
+def test_pinned_process_waits_for_its_core():
+    records = [{"pid": f"P{k}", "arrival": 0, "burst": burst, "priority": 0} for k, burst in enumerate((5, 1, 1))]
+    result = schedule_smp(records, "FCFS", 2, affinity=[0, -1, 0])
+    assert placements(result) == [("P1", 1, 0.0), ("P0", 0, 0.0), ("P2", 0, 5.0)]
+
+
+def test_switch_cost_and_warmup_are_paid_per_dispatch():
+    # Every dispatch pays the switch; only returning processes pay the warmup.
+    records = [{"pid": "P0", "arrival": 0, "burst": 2, "priority": 0},
+               {"pid": "P1", "arrival": 0, "burst": 2, "priority": 0}]
+    result = schedule_smp(records, "RR", 1, quantum=1, switch_cost=0.5, warmup=0.25)
+    assert list(result.overhead.start) == [0.0, 1.5, 3.0, 4.75]
+    assert list(result.overhead.duration) == [0.5, 0.5, 0.75, 0.75]
+    assert list(result.completion) == [4.75, 6.5]
@@ -0,0 +1,99 @@
+import random
+from math import ceil
+
+import pytest
+
+from scheduler import schedule, schedule_smp
+from scheduler.stats import EXACT_LIMIT, QuantileSketch, RunStats, run_stats
+
+from .exact import records
+from .test_smp import random_table
+
+QUANTILES = (0.0, 0.01, 0.1, 0.5, 0.9, 0.95, 0.99, 0.999, 1.0)
+
+
+def nearest_rank(values, q):
+    ordered = sorted(values)
+    return ordered[max(ceil(q * len(ordered)) - 1, 0)]
+
+
+def sample(seed, n):
+    rng = random.Random(seed)
+    return [rng.choice([0.0, rng.expovariate(0.1), rng.lognormvariate(0, 3), rng.paretovariate(1.2)])
+            for _ in range(n)]
+
+
+def sketch_of(values, accuracy=0.01):
+    sketch = QuantileSketch(accuracy)
+    for value in values:
+        sketch.add(value)
+    return sketch
+
+
+def test_small_sketches_are_exact():
+    values = sample(1, EXACT_LIMIT)
+    sketch = sketch_of(values)
+    for q in QUANTILES:
+        assert sketch.quantile(q) == nearest_rank(values, q)
+
+
+@pytest.mark.parametrize("accuracy", [0.01, 0.05])
+@pytest.mark.parametrize("seed", range(5))
+def test_large_sketches_stay_within_the_relative_error(seed, accuracy):
+    values = sample(seed, 20000)
+    sketch = sketch_of(values, accuracy)
+    assert (sketch.count, sketch.min, sketch.max) == (len(values), min(values), max(values))
+    assert sketch.total == pytest.approx(sum(values))
+    for q in QUANTILES:
+        exact = nearest_rank(values, q)
+        assert abs(sketch.quantile(q) - exact) <= accuracy * exact + 1e-12
+
+
+@pytest.mark.parametrize("sizes", [(10, 20), (EXACT_LIMIT, 1), (5000, 7000)])
+def test_merge_equals_one_sketch_over_everything(sizes):
+    left, right = sample(7, sizes[0]), sample(8, sizes[1])
+    merged = sketch_of(left)
+    merged.merge(sketch_of(right))
+    whole = sketch_of(left + right)
+    assert (merged.count, merged.min, merged.max, merged.zeros) == (whole.count, whole.min, whole.max, whole.zeros)
+    assert merged.total == pytest.approx(whole.total)
+    for q in QUANTILES:
+        assert merged.quantile(q) == whole.quantile(q)
+    with pytest.raises(ValueError):
+        merged.merge(QuantileSketch(0.02))
+
+
+def test_run_stats_on_an_exact_trace():
+    # P0 runs 1-4, P1 4-6 after waiting 2, then the CPU idles until P2 at 8.
+    stats = run_stats(schedule(records((1, 3), (2, 2), (8, 1)), "FCFS"), window=4, step=2)
+    assert (stats.makespan, stats.busy) == (9.0, 6.0)
+    assert (stats.idle_gaps, stats.idle_time, stats.longest_idle) == (2, 3.0, 2.0)
+    assert stats.utilization() == pytest.approx(6 / 9)
+    assert stats.waiting.summary() == (pytest.approx(2 / 3), 0.0, 2.0, 2.0, 2.0)
+    assert stats.response.quantile(1) == 2.0
+    shares = [1.0, 0.5, 1.0]
+    assert stats.fairness() == pytest.approx(sum(shares) ** 2 / (3 * sum(s * s for s in shares)))
+    # Completions at 4, 6 and 9; windows [0, 4), [2, 6), [4, 8), [6, 10) four units wide.
+    assert stats.throughput() == [(0.0, 0.0), (2.0, 0.25), (4.0, 0.5), (6.0, 0.5)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_run_stats_match_exact_metrics(seed):
+    table = random_table(seed)
+    result = schedule_smp(table, "RR", 2, quantum=1.0)
+    stats = run_stats(result, window=5.0, step=1.0)
+    waiting = [result.completion[i] - table.arrival[i] - table.burst[i] for i in range(len(table))]
+    for q in QUANTILES:
+        assert stats.waiting.quantile(q) == nearest_rank(waiting, q)
+    shares = [table.burst[i] / (result.completion[i] - table.arrival[i]) for i in range(len(table))]
+    assert stats.fairness() == pytest.approx(sum(shares) ** 2 / (len(shares) * sum(s * s for s in shares)))
+    assert stats.busy == pytest.approx(sum(table.burst))
+    assert stats.utilization() == pytest.approx(sum(table.burst) / (2 * result.makespan()))
+    for start, rate in stats.throughput():
+        done = sum(start <= completion < start + 5.0 for completion in result.completion)
+        assert rate == pytest.approx(done / 5.0)
+
+
+def test_window_must_be_positive():
+    with pytest.raises(ValueError):
+        RunStats(window=0)
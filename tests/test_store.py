@@ -0,0 +1,46 @@
+import pytest
+
+from scheduler import schedule
+from scheduler.store import load_result, save_result
+
+from .test_smp import random_table
+
+
+@pytest.mark.parametrize("algorithm, preemptive, quantum, switch_cost", [
+    ("FCFS", False, None, 0.0), ("PP", True, None, 0.0), ("RR", False, 1.5, 0.25)])
+def test_result_file_round_trip(tmp_path, algorithm, preemptive, quantum, switch_cost):
+    result = schedule(random_table(7), algorithm, preemptive, quantum, switch_cost=switch_cost)
+    path = tmp_path / "run.sres"
+    save_result(result, path)
+    loaded = load_result(path)
+    assert list(loaded.table.pids) == list(result.table.pids)
+    assert (loaded.algorithm, loaded.preemptive, loaded.quantum) == (algorithm, preemptive, quantum)
+    assert list(loaded.segments()) == list(result.segments())
+    assert loaded.stats() == result.stats()
+    assert (loaded.overhead is None) == (result.overhead is None)
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "trace.csv"
+    path.write_text("pid,arrival,burst,priority\n")
+    with pytest.raises(ValueError):
+        load_result(path)
+
+
+def test_text_pids_round_trip(tmp_path):
+    records = [{"pid": pid, "arrival": 0.5 * k, "burst": 1.0, "priority": 0}
+               for k, pid in enumerate(["réseau", "", "进程", "P" * 300])]
+    result = schedule(records, "FCFS")
+    path = tmp_path / "run.sres"
+    save_result(result, path)
+    assert list(load_result(path).table.pids) == ["réseau", "", "进程", "P" * 300]
+
+
+def test_columns_are_views_over_the_file(tmp_path):
+    np = pytest.importorskip("numpy")
+    result = schedule(random_table(5), "SJF")
+    path = tmp_path / "run.sres"
+    save_result(result, path)
+    loaded = load_result(path)
+    assert isinstance(loaded.completion, memoryview) and loaded.completion.readonly
+    assert np.frombuffer(loaded.completion).tolist() == list(result.completion)
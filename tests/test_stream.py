@@ -0,0 +1,25 @@
+import json
+
+import pytest
+
+from scheduler.stream import main
+
+TRACE = "pid,arrival,burst,priority\nP1,0,3,1\nP2,1,2,1\n"
+
+
+@pytest.mark.parametrize("quantum", [[], ["--quantum", "0"]])
+def test_round_robin_without_a_quantum_is_a_usage_error(tmp_path, capsys, quantum):
+    trace = tmp_path / "trace.csv"
+    trace.write_text(TRACE)
+    with pytest.raises(SystemExit) as exit:
+        main([str(trace), "--algorithm", "RR", *quantum])
+    assert exit.value.code == 2
+    assert "--algorithm RR needs a positive --quantum" in capsys.readouterr().err
+
+
+def test_round_robin_streams_completions(tmp_path, capsys):
+    trace = tmp_path / "trace.csv"
+    trace.write_text(TRACE)
+    main([str(trace), "--algorithm", "RR", "--quantum", "2", "--no-segments"])
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(event["pid"], event["completion"]) for event in events] == [("P2", 4.0), ("P1", 5.0)]
@@ -0,0 +1,50 @@
+import csv
+
+import pytest
+
+from scheduler import ALGORITHMS, schedule
+from scheduler.sweep import configs, sweep
+from scheduler.workload import load_table
+
+from .test_smp import random_table
+
+
+@pytest.fixture
+def workloads(tmp_path):
+    paths = []
+    for seed in (1, 2):
+        table = random_table(seed)
+        path = tmp_path / f"w{seed}.csv"
+        with open(path, "w", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["pid", "arrival", "burst", "priority"])
+            for i in range(len(table)):
+                writer.writerow([table.pids[i], repr(table.arrival[i]), repr(table.burst[i]), table.priority[i]])
+        paths.append(str(path))
+    return paths
+
+
+def test_configs_skip_repeated_runs():
+    assert configs(["FCFS", "SJF", "RR"], (False, True), (1.0, 2.0)) == [
+        ("FCFS", False, None), ("SJF", False, None), ("SJF", True, None), ("RR", True, 1.0), ("RR", True, 2.0)]
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 3), (2, 4)])
+def test_rows_match_serial_schedule(tmp_path, workloads, workers, chunk_size):
+    output = tmp_path / "sweep.csv"
+    rows = list(sweep(workloads, ALGORITHMS, quanta=(0.5, 2.0), output=str(output), workers=workers,
+                      chunk_size=chunk_size))
+    grid = configs(ALGORITHMS, (False, True), (0.5, 2.0))
+    assert len(rows) == len(grid) * len(workloads)
+    seen = set()
+    for row in rows:
+        key = (row["workload"], row["algorithm"], row["preemptive"], row["quantum"])
+        assert key not in seen
+        seen.add(key)
+        result = schedule(load_table(row["workload"]), row["algorithm"], row["preemptive"], row["quantum"])
+        assert row["processes"] == len(result.table)
+        assert row["average_waiting"] == pytest.approx(result.average_waiting(), abs=1e-9)
+        assert row["average_turnaround"] == pytest.approx(result.average_turnaround(), abs=1e-9)
+        assert row["makespan"] == pytest.approx(result.makespan(), abs=1e-9)
+    with open(output, newline="") as handle:
+        assert len(list(csv.DictReader(handle))) == len(rows)